@@ -1,6 +1,20 @@
 from django.apps import AppConfig
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        from django.conf import settings
+        from . import schema, signals  # noqa: F401
+        from .revocation import shared_store_configured
+
+        if getattr(settings, "JWT_STATELESS_AUTH", True) and not shared_store_configured():
+            logger.warning(
+                "JWT_STATELESS_AUTH is on but the default cache is not shared (set REDIS_URL); "
+                "authenticating against the database instead"
+            )
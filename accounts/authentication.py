@@ -0,0 +1,67 @@
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .revocation import ISSUED_AT_CLAIM, is_revoked, issued_before, shared_store_configured
+
+# Login-এর সময় token-এ বসানো claim; stateless path এগুলো থেকেই user বানায়।
+USER_CLAIMS = ("email", "is_active")
+
+
+def tokens_for_user(user) -> RefreshToken:
+    refresh = RefreshToken.for_user(user)
+    for claim in USER_CLAIMS:
+        refresh[claim] = getattr(user, claim)
+    refresh[ISSUED_AT_CLAIM] = int(time.time() * 1000)
+    return refresh
+
+
+def stateless_enabled() -> bool:
+    """
+    JWT_STATELESS_AUTH চালু আর revocation রাখার shared store (Redis) আছে।
+    না থাকলে per-process cache-এর marker অন্য worker দেখে না, তাই DB lookup।
+    """
+    return getattr(settings, "JWT_STATELESS_AUTH", True) and shared_store_configured()
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Signed claim বিশ্বাস করে DB থেকে user load না করেই unsaved User instance
+    বানায়, তাই request-প্রতি একটা query কমে। এই instance কখনো save() করা যাবে না;
+    পুরো profile লাগলে view নিজে DB থেকে পড়ে। পুরনো token (claim ছাড়া), shared
+    store না থাকলে বা JWT_STATELESS_AUTH=False হলে আগের মতো DB lookup হয় —
+    সেখানে is_active, user আছে কিনা আর tokens_valid_after দেখা হয়।
+    """
+
+    def get_user(self, validated_token):
+        if is_revoked(validated_token):
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+
+        if not stateless_enabled() or any(
+            claim not in validated_token for claim in USER_CLAIMS
+        ):
+            user = super().get_user(validated_token)
+            if issued_before(validated_token, user.tokens_valid_after):
+                raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+            return user
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        User = get_user_model()
+        return User(
+            **{
+                api_settings.USER_ID_FIELD: User._meta.get_field(
+                    api_settings.USER_ID_FIELD
+                ).to_python(user_id),
+                "email": validated_token["email"],
+                "is_active": True,
+            }
+        )
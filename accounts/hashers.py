@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+# Algorithm নাম Django-র hasher-এর মতোই, তাই পুরনো hash verify হয়; cost
+# settings থেকে আসে আর বদলালে পরের login-এ must_update দিয়ে rehash হয়।
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return getattr(
+            settings, "PASSWORD_PBKDF2_ITERATIONS", hashers.PBKDF2PasswordHasher.iterations
+        )
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return getattr(
+            settings, "PASSWORD_ARGON2_TIME_COST", hashers.Argon2PasswordHasher.time_cost
+        )
+
+    @property
+    def memory_cost(self):
+        return getattr(
+            settings, "PASSWORD_ARGON2_MEMORY_COST", hashers.Argon2PasswordHasher.memory_cost
+        )
+
+    @property
+    def parallelism(self):
+        return getattr(
+            settings, "PASSWORD_ARGON2_PARALLELISM", hashers.Argon2PasswordHasher.parallelism
+        )
+
+
+class BCryptSHA256PasswordHasher(hashers.BCryptSHA256PasswordHasher):
+    @property
+    def rounds(self):
+        return getattr(
+            settings, "PASSWORD_BCRYPT_ROUNDS", hashers.BCryptSHA256PasswordHasher.rounds
+        )
@@ -0,0 +1,51 @@
+import importlib.util
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+LIBRARIES = {"argon2": "argon2", "bcrypt": "bcrypt", "pbkdf2": "hashlib"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark password verification (logins/second) for each configured hasher "
+        "at its current cost settings, on one thread and on the login pool size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=20)
+        parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+
+    def handle(self, *args, **options):
+        logins, threads = options["logins"], options["threads"]
+        for path in settings.PASSWORD_HASHERS:
+            hasher = import_string(path)()
+            name = next(n for n in LIBRARIES if n in hasher.algorithm)
+            if not importlib.util.find_spec(LIBRARIES[name]):
+                self.stdout.write(f"{hasher.algorithm}: not installed, skipped")
+                continue
+
+            encoded = hasher.encode("correct horse battery staple", hasher.salt())
+            began = time.perf_counter()
+            for _ in range(logins):
+                hasher.verify("correct horse battery staple", encoded)
+            single = logins / (time.perf_counter() - began)
+
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                began = time.perf_counter()
+                list(pool.map(lambda _: hasher.verify("x", encoded), range(logins * threads)))
+                pooled = logins * threads / (time.perf_counter() - began)
+
+            cost = {
+                key: value
+                for key, value in hasher.decode(encoded).items()
+                if key not in ("algorithm", "salt", "hash", "checksum")
+            }
+            self.stdout.write(
+                f"{hasher.algorithm} {cost}: "
+                f"{single:.1f} logins/s on one core, {pooled:.1f} logins/s on {threads} threads "
+                f"({pooled / threads:.1f}/core)"
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_digest',
+            field=models.CharField(choices=[('off', 'Send immediately'), ('hourly', 'Hourly digest'), ('daily', 'Daily digest')], default='off', max_length=10),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 19:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_email_digest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='tokens_valid_after',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
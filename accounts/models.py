@@ -36,6 +36,11 @@ class UserManager(BaseUserManager):
 
 
 class User(AbstractBaseUser, PermissionsMixin):
+    class EmailDigest(models.TextChoices):
+        OFF = "off", "Send immediately"
+        HOURLY = "hourly", "Hourly digest"
+        DAILY = "daily", "Daily digest"
+
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     email = models.EmailField(unique=True, max_length=255, db_index=True)
     first_name = models.CharField(max_length=150, blank=True)
@@ -43,6 +48,14 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
+    # Participant.updated_at-এর মতো — অন্য process-এর directory এটা দেখে refresh করে।
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # এর আগে issue হওয়া সব token বাতিল (email বদল/deactivate); DB lookup path দেখে।
+    tokens_valid_after = models.DateTimeField(null=True, blank=True, editable=False)
+    # Invitation/cancellation email আলাদা না গিয়ে একসাথে digest-এ যায়।
+    email_digest = models.CharField(
+        max_length=10, choices=EmailDigest.choices, default=EmailDigest.OFF
+    )
 
     objects = UserManager()
 
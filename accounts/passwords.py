@@ -0,0 +1,74 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+
+class LoginBusy(Exception):
+    """Hash pool-এর queue ভরা; login পরে আবার চেষ্টা করতে হবে।"""
+
+
+def _workers() -> int:
+    return getattr(settings, "AUTH_HASH_WORKERS", None) or max(1, (os.cpu_count() or 2) // 2)
+
+
+_executor = ThreadPoolExecutor(max_workers=_workers(), thread_name_prefix="password-hash")
+# Running + waiting verification-এর সীমা; বেশি হলে queue না করে সাথে সাথে ফেরত।
+_slots = threading.BoundedSemaphore(
+    _workers() + getattr(settings, "AUTH_HASH_QUEUE", _workers() * 4)
+)
+
+
+def _run(fn, *args):
+    if not _slots.acquire(blocking=False):
+        raise LoginBusy("Too many logins in progress, please retry shortly.")
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    try:
+        return future.result(timeout=getattr(settings, "AUTH_HASH_TIMEOUT_SECONDS", 10))
+    except TimeoutError:
+        raise LoginBusy("Login timed out, please retry shortly.")
+
+
+def _needs_rehash(encoded: str) -> bool:
+    try:
+        current = identify_hasher(encoded)
+    except ValueError:
+        return False
+    preferred = get_hasher("default")
+    return current.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def verify_credentials(request, email: str, password: str):
+    """
+    ModelBackend.authenticate-এর মতো, কিন্তু দামি hash কাজটা bounded thread
+    pool-এ চলে (hashlib/argon2/bcrypt GIL ছেড়ে দেয়), যাতে login burst request
+    worker আটকে না রাখে। DB query request thread-এই থাকে। Cost বদলালে সফল
+    login-এ password নতুন setting দিয়ে rehash হয়।
+    """
+    User = get_user_model()
+    try:
+        user = User._default_manager.get_by_natural_key(email)
+    except User.DoesNotExist:
+        # অচেনা email-এও সমান সময় লাগুক (timing দিয়ে account enumeration না হয়)।
+        _run(make_password, password)
+        user = None
+    else:
+        if not _run(check_password, password, user.password) or not user.is_active:
+            user = None
+        elif _needs_rehash(user.password):
+            user.password = _run(make_password, password)
+            user.save(update_fields=["password"])
+
+    if user is None:
+        user_login_failed.send(
+            sender=__name__, credentials={"email": email}, request=request
+        )
+    return user
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """ছোট per-process LRU; প্রতিটা entry কয়েক সেকেন্ড পর বাতিল হয়।"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = _TTLCache(maxsize=getattr(settings, "AUTH_REVOCATION_CACHE_SIZE", 10000))
+
+
+def _local_ttl() -> float:
+    return getattr(settings, "AUTH_REVOCATION_CACHE_SECONDS", 30)
+
+
+def _user_key(user_id) -> str:
+    return f"auth:revoked-after:{user_id}"
+
+
+def _jti_key(jti) -> str:
+    return f"auth:revoked-jti:{jti}"
+
+
+# Login-এর millisecond timestamp; iat শুধু পুরো সেকেন্ড, তাই revoke-এর একই
+# সেকেন্ডে আবার login করলে নতুন token-ও বাতিল হয়ে যেত।
+ISSUED_AT_CLAIM = "iat_ms"
+
+# এই backend-গুলো সব worker-এর মধ্যে shared; LocMem/file/dummy নয়।
+SHARED_CACHE_BACKENDS = (
+    "django.core.cache.backends.redis.RedisCache",
+    "django_redis.cache.RedisCache",
+)
+
+
+def shared_store_configured() -> bool:
+    """Revocation marker সব worker দেখতে পায় কিনা (default cache Redis কিনা)।"""
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    return backend in SHARED_CACHE_BACKENDS
+
+
+def issued_at_ms(token) -> int:
+    """পুরনো token-এ claim না থাকলে iat-এর সেকেন্ডের শুরু — সন্দেহে বাতিলের দিকে।"""
+    issued = token.get(ISSUED_AT_CLAIM)
+    if issued is None:
+        issued = int(token.get("iat", 0)) * 1000
+    return int(issued)
+
+
+def revoke_user_tokens(user_id, at: float | None = None):
+    """এই মুহূর্ত পর্যন্ত issue হওয়া user-এর সব access/refresh token বাতিল।"""
+    revoked_after = int((at if at is not None else time.time()) * 1000)
+    lifetime = settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
+    cache.set(_user_key(user_id), revoked_after, int(lifetime))
+    _local.set(_user_key(user_id), revoked_after, _local_ttl())
+
+
+def issued_before(token, moment) -> bool:
+    """DB-তে রাখা tokens_valid_after-এর সাথে তুলনা (millisecond)।"""
+    return moment is not None and issued_at_ms(token) <= int(moment.timestamp() * 1000)
+
+
+def revoke_token(token):
+    """একটা token (যেমন logout-এ current access token) expiry পর্যন্ত বাতিল।"""
+    jti, exp = token.get("jti"), token.get("exp")
+    if not jti:
+        return
+    remaining = max(1, int(exp - time.time())) if exp else None
+    cache.set(_jti_key(jti), 1, remaining)
+    # Revoke কখনো উল্টায় না, তাই local LRU-তে expiry পর্যন্ত রাখা নিরাপদ।
+    _local.set(_jti_key(jti), 1, remaining or _local_ttl())
+
+
+def is_revoked(token) -> bool:
+    """
+    আগে process-local cache দেখে; miss হলে shared cache-এ একটাই get_many।
+    অন্য worker-এর revocation সর্বোচ্চ AUTH_REVOCATION_CACHE_SECONDS দেরিতে পৌঁছায়।
+    """
+    keys = [_user_key(token.get(settings.SIMPLE_JWT.get("USER_ID_CLAIM", "user_id")))]
+    if token.get("jti"):
+        keys.append(_jti_key(token["jti"]))
+
+    values = {key: _local.get(key) for key in keys}
+    missing = [key for key, value in values.items() if value is _MISSING]
+    if missing:
+        found = cache.get_many(missing)
+        for key in missing:
+            values[key] = found.get(key)
+            ttl = _local_ttl()
+            if key != keys[0] and values[key] is not None and token.get("exp"):
+                ttl = max(ttl, token["exp"] - time.time())
+            _local.set(key, values[key], ttl)
+
+    revoked_after = values[keys[0]]
+    if revoked_after is not None and issued_at_ms(token) <= revoked_after:
+        return True
+    return len(keys) > 1 and values[keys[1]] is not None
+
+
+def prune_expired_tokens(*, batch_size: int | None = None, max_batches: int | None = None) -> int:
+    """
+    Expire হয়ে যাওয়া OutstandingToken (cascade-এ BlacklistedToken-ও) ছোট batch-এ
+    মোছে, যাতে একটা লম্বা DELETE table lock করে না রাখে।
+    """
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    batch_size = batch_size or getattr(settings, "TOKEN_PRUNE_BATCH_SIZE", 1000)
+    max_batches = max_batches or getattr(settings, "TOKEN_PRUNE_MAX_BATCHES", 50)
+    now = timezone.now()
+    deleted = 0
+    for _ in range(max_batches):
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lt=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+    if deleted:
+        logger.info(f"Pruned {deleted} expired outstanding tokens")
+    return deleted
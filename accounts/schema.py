@@ -0,0 +1,7 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    """OpenAPI-তে StatelessJWTAuthentication-কেও সাধারণ bearer JWT হিসেবে দেখায়।"""
+
+    target_class = "accounts.authentication.StatelessJWTAuthentication"
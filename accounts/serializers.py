@@ -1,6 +1,10 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password as django_validate_password
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from .revocation import is_revoked, issued_before, revoke_token
 
 User = get_user_model()
 
@@ -40,4 +44,29 @@ class UserLoginSerializer(serializers.Serializer):
 class UserMeSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ("id", "email", "first_name", "last_name")
+        fields = ("id", "email", "first_name", "last_name", "email_digest")
+        read_only_fields = ("id", "email")
+
+
+class RevocationAwareTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        # Signature যাচাই না করেই jti দেখা হয়: cache-এ revoked পেলে শুধু reject
+        # করি, তাই replay হওয়া পুরনো token-এ blacklist table ছুঁতে হয় না।
+        try:
+            unverified = self.token_class(attrs["refresh"], verify=False)
+        except TokenError as exc:
+            raise InvalidToken(exc.args[0])
+        if is_revoked(unverified):
+            raise InvalidToken("Token has been revoked.")
+        valid_after = (
+            User.objects.filter(pk=unverified.get(api_settings.USER_ID_CLAIM))
+            .values_list("tokens_valid_after", flat=True)
+            .first()
+        )
+        if issued_before(unverified, valid_after):
+            raise InvalidToken("Token has been revoked.")
+
+        data = super().validate(attrs)
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            revoke_token(unverified)
+        return data
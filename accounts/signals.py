@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .revocation import revoke_user_tokens
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=User)
+def revoke_tokens_on_identity_change(sender, instance, **kwargs):
+    # Token-এ email/is_active বসানো থাকে; বদলালে পুরনো token আর বিশ্বাস করা যায় না।
+    if instance._state.adding:
+        return
+    previous = User.objects.filter(pk=instance.pk).values("email", "is_active").first()
+    if previous and (previous["email"], previous["is_active"]) != (
+        instance.email,
+        instance.is_active,
+    ):
+        # Row-এ রাখা হয় যাতে cache evict হলেও বা অন্য worker-এ DB path ধরে;
+        # save-এ update_fields থাকতে পারে, তাই আলাদা UPDATE।
+        now = timezone.now()
+        instance.tokens_valid_after = now
+        User.objects.filter(pk=instance.pk).update(tokens_valid_after=now)
+        revoke_user_tokens(instance.pk, at=now.timestamp())
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    revoke_user_tokens(instance.pk)
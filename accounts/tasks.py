@@ -0,0 +1,10 @@
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task
+
+
+@db_periodic_task(crontab(minute="17"))
+def prune_expired_tokens_periodic():
+    """প্রতি ঘণ্টায় expire হওয়া refresh token-এর row মোছে; বাকি থাকলে পরের run নেয়।"""
+    from .revocation import prune_expired_tokens
+
+    return prune_expired_tokens()
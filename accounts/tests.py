@@ -1,3 +1,133 @@
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from . import revocation
+from .tasks import prune_expired_tokens_periodic
 
-# Create your tests here.
+PASSWORD = "pw12345!A"
+
+
+class AuthTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        revocation._local.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(revocation._local.clear)
+        self.user = get_user_model().objects.create_user(email="ada@example.com", password=PASSWORD)
+
+    def login(self, email="ada@example.com"):
+        response = APIClient().post(
+            "/api/auth/login/", {"email": email, "password": PASSWORD}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def client_for(self, tokens):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        return client
+
+    def forget_markers(self):
+        # অন্য worker বা cache evict — শুধু DB-র tokens_valid_after বাকি থাকে।
+        cache.clear()
+        revocation._local.clear()
+
+
+class StatelessAuthTests(AuthTestCase):
+    def user_lookups(self, client):
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(client.get("/api/meetings/").status_code, 200)
+        return [
+            q["sql"]
+            for q in ctx.captured_queries
+            if 'FROM "accounts_user"' in q["sql"] and 'WHERE "accounts_user"."id" =' in q["sql"]
+        ]
+
+    def test_shared_store_authenticates_from_claims(self):
+        client = self.client_for(self.login())
+        with mock.patch("accounts.authentication.shared_store_configured", return_value=True):
+            self.assertEqual(self.user_lookups(client), [])
+
+    def test_without_shared_store_falls_back_to_the_database(self):
+        client = self.client_for(self.login())
+        self.assertEqual(len(self.user_lookups(client)), 1)
+
+    def test_email_change_revokes_through_tokens_valid_after(self):
+        tokens = self.login()
+        self.user.email = "lovelace@example.com"
+        self.user.save(update_fields=["email"])
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.tokens_valid_after)
+        self.forget_markers()
+
+        self.assertEqual(self.client_for(tokens).get("/api/meetings/").status_code, 401)
+        response = APIClient().post(
+            "/api/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json"
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_login_in_the_same_second_as_the_revocation_works(self):
+        self.user.email = "lovelace@example.com"
+        self.user.save(update_fields=["email"])
+        client = self.client_for(self.login("lovelace@example.com"))
+        self.assertEqual(client.get("/api/meetings/").status_code, 200)
+        self.forget_markers()
+        self.assertEqual(client.get("/api/meetings/").status_code, 200)
+
+    def test_deactivation_and_deletion_revoke(self):
+        client = self.client_for(self.login())
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(client.get("/api/meetings/").status_code, 401)
+
+        self.user.is_active = True
+        self.user.save()
+        client = self.client_for(self.login())
+        self.user.delete()
+        self.forget_markers()
+        self.assertEqual(client.get("/api/meetings/").status_code, 401)
+
+    def test_logout_revokes_the_access_token(self):
+        tokens = self.login()
+        client = self.client_for(tokens)
+        response = client.post("/api/auth/logout/", {"refresh": tokens["refresh"]}, format="json")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(client.get("/api/meetings/").status_code, 401)
+
+
+class TokenPruneTests(AuthTestCase):
+    def make_tokens(self, expired, live):
+        now = timezone.now()
+        for i in range(expired + live):
+            token = OutstandingToken.objects.create(
+                user=self.user,
+                jti=f"jti-{i}",
+                token="x",
+                expires_at=now + (timedelta(days=1) if i >= expired else -timedelta(days=1)),
+            )
+            BlacklistedToken.objects.create(token=token)
+
+    def test_prunes_expired_rows_in_bounded_batches(self):
+        self.make_tokens(expired=20, live=5)
+        self.assertEqual(revocation.prune_expired_tokens(batch_size=7, max_batches=2), 14)
+        # বাকিটা পরের run নেয়।
+        self.assertEqual(prune_expired_tokens_periodic.call_local(), 6)
+        self.assertEqual(revocation.prune_expired_tokens(), 0)
+        self.assertEqual(OutstandingToken.objects.count(), 5)
+        self.assertEqual(BlacklistedToken.objects.count(), 5)
+        self.assertFalse(OutstandingToken.objects.filter(expires_at__lt=timezone.now()).exists())
+
+    def test_rotated_refresh_token_cannot_be_replayed(self):
+        refresh = self.login()["refresh"]
+        client = APIClient()
+        response = client.post("/api/auth/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        response = client.post("/api/auth/token/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, 401)
@@ -1,10 +1,14 @@
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import get_user_model
 from rest_framework import status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from meeting_scheduler.throttling import AnonTokenBucketThrottle, LoginRateThrottle
+from .authentication import tokens_for_user
+from .passwords import LoginBusy, verify_credentials
+from .revocation import revoke_token
 from .serializers import UserRegisterSerializer, UserLoginSerializer, UserMeSerializer
 
 User = get_user_model()
@@ -23,6 +27,7 @@ class RegisterView(APIView):
 
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [AnonTokenBucketThrottle, LoginRateThrottle]
 
     @extend_schema(request=UserLoginSerializer, responses=dict, tags=["Auth"])
     def post(self, request):
@@ -30,13 +35,20 @@ class LoginView(APIView):
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data["email"]
         password = serializer.validated_data["password"]
-        user = authenticate(request, email=email, password=password)
+        try:
+            user = verify_credentials(request, email, password)
+        except LoginBusy as exc:
+            return Response(
+                {"detail": str(exc)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
         if not user:
             return Response({"detail": "Invalid credentials."}, status=status.HTTP_400_BAD_REQUEST)
         if not user.is_active:
             return Response({"detail": "User is inactive."}, status=status.HTTP_400_BAD_REQUEST)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = tokens_for_user(user)
         return Response(
             {
                 "user": UserMeSerializer(user).data,
@@ -62,11 +74,15 @@ class LogoutView(APIView):
         try:
             token = RefreshToken(refresh_token)
             token.blacklist()
+            revoke_token(token)
         except (TokenError, AttributeError):
             return Response(
                 {"detail": "Invalid token or blacklist not enabled."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        # Stateless auth DB দেখে না, তাই current access token-ও বাতিল করতে হয়।
+        if request.auth is not None:
+            revoke_token(request.auth)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -76,5 +92,15 @@ class MeView(APIView):
 
     @extend_schema(responses=UserMeSerializer, tags=["Auth"])
     def get(self, request):
-        serializer = UserMeSerializer(request.user)
+        # Stateless auth-এর user-এ শুধু token claim থাকে; profile DB থেকে পড়া হয়।
+        user = User.objects.get(pk=request.user.pk)
+        serializer = UserMeSerializer(user)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(request=UserMeSerializer, responses=UserMeSerializer, tags=["Auth"])
+    def patch(self, request):
+        user = User.objects.get(pk=request.user.pk)
+        serializer = UserMeSerializer(user, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import ExternalBusyInterval
 
-# Register your models here.
+
+@admin.register(ExternalBusyInterval)
+class ExternalBusyIntervalAdmin(admin.ModelAdmin):
+    list_display = ("participant", "source", "start_time", "end_time", "sequence", "updated_at")
+    list_filter = ("source",)
+    search_fields = ("participant__email", "uid")
+    raw_id_fields = ("participant",)
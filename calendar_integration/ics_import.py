@@ -0,0 +1,351 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from typing import Iterable, Iterator
+from zoneinfo import ZoneInfoNotFoundError
+from dateutil.rrule import rruleset, rrulestr
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .models import ExternalBusyInterval
+from .timezones import get_zone
+import logging
+
+logger = logging.getLogger(__name__)
+
+_DURATION_RE = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+@dataclass
+class ParsedEvent:
+    uid: str
+    recurrence_id: str
+    sequence: int
+    start_time: datetime
+    end_time: datetime
+    busy: bool
+    # RRULE/RDATE থেকে তৈরি occurrence; একই RECURRENCE-ID-এর override এলে সেটাই থাকে।
+    generated: bool = False
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    skipped: int = 0
+
+
+def iter_unfolded_lines(stream: Iterable) -> Iterator[str]:
+    """
+    RFC 5545 folding খুলে একটা একটা logical line দেয়; পুরো file কখনো
+    memory-তে আনা হয় না।
+    """
+    pending = None
+    for raw in stream:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending:
+        yield pending
+
+
+def _split_property(line: str) -> tuple[str, dict, str]:
+    head, _, value = line.partition(":")
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, val = raw.partition("=")
+        params[key.upper()] = val.strip('"')
+    return name.upper(), params, value
+
+
+def _parse_datetime(value: str, params: dict, default_tz: tzinfo = dt_timezone.utc) -> datetime:
+    """
+    Floating time (TZID বা Z ছাড়া) আর all-day date default_tz-এ ধরা হয় —
+    participant-এর নিজের zone; UTC ধরলে অন্য zone-এর মানুষের busy time সরে যেত।
+    """
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d").replace(tzinfo=default_tz)
+
+    if value.endswith("Z"):
+        return datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=dt_timezone.utc)
+
+    naive = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tzid = params.get("TZID")
+    if tzid:
+        try:
+            return naive.replace(tzinfo=get_zone(tzid))
+        except ZoneInfoNotFoundError:
+            logger.warning(f"Unknown TZID {tzid!r} in imported calendar, using {default_tz}")
+    return naive.replace(tzinfo=default_tz)
+
+
+def _recurrence_key(moment: datetime) -> str:
+    """RECURRENCE-ID UTC-তে — generated occurrence আর override একই key পায়।"""
+    return moment.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _parse_duration(value: str) -> timedelta:
+    match = _DURATION_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid DURATION {value!r}")
+    parts = {k: int(v) for k, v in match.groupdict().items() if v and k != "sign"}
+    duration = timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
+
+
+# এই property-গুলো একটা VEVENT-এ কয়েকবার আসতে পারে; বাকিগুলোর প্রথমটাই থাকে।
+_LIST_PROPERTIES = ("RDATE", "EXDATE")
+
+
+def recurrence_horizon() -> timedelta:
+    return timedelta(days=getattr(settings, "ICS_RECURRENCE_HORIZON_DAYS", 180))
+
+
+def iter_vevents(
+    lines: Iterable[str], *, default_tz: tzinfo = dt_timezone.utc, now: datetime | None = None
+) -> Iterator[ParsedEvent]:
+    props = None
+    depth = 0
+    now = now or timezone.now()
+
+    for line in lines:
+        name, params, value = _split_property(line)
+
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and props is None:
+                props = {}
+                depth = 0
+            elif props is not None:
+                depth += 1
+            continue
+
+        if name == "END":
+            if props is None:
+                continue
+            if depth:
+                depth -= 1
+                continue
+            yield from _build_events(props, default_tz, now)
+            props = None
+            continue
+
+        # Nested components (VALARM etc.) have their own DTSTART/UID-less props.
+        if props is None or depth:
+            continue
+        if name in _LIST_PROPERTIES:
+            props.setdefault(name, []).append((params, value))
+        elif name not in props:
+            props[name] = (params, value)
+
+
+def _build_events(props: dict, default_tz: tzinfo, now: datetime) -> Iterator[ParsedEvent]:
+    if "UID" not in props or "DTSTART" not in props:
+        return
+    uid = props["UID"][1]
+    try:
+        start = _parse_datetime(props["DTSTART"][1], props["DTSTART"][0], default_tz)
+        if "DTEND" in props:
+            end = _parse_datetime(props["DTEND"][1], props["DTEND"][0], default_tz)
+        elif "DURATION" in props:
+            end = start + _parse_duration(props["DURATION"][1])
+        elif props["DTSTART"][0].get("VALUE") == "DATE":
+            end = start + timedelta(days=1)
+        else:
+            end = start
+        sequence = int(props.get("SEQUENCE", ({}, "0"))[1] or 0)
+        recurrence_id = ""
+        if "RECURRENCE-ID" in props:
+            params, value = props["RECURRENCE-ID"]
+            recurrence_id = _recurrence_key(_parse_datetime(value, params, default_tz))
+        occurrences = _occurrences(props, start, end - start, default_tz, now)
+    except ValueError as e:
+        logger.warning(f"Skipping unparsable VEVENT {uid!r}: {str(e)}")
+        return
+
+    status = props.get("STATUS", ({}, ""))[1].upper()
+    transp = props.get("TRANSP", ({}, ""))[1].upper()
+    busy = status != "CANCELLED" and transp != "TRANSPARENT" and end > start
+
+    if occurrences is None or recurrence_id:
+        yield ParsedEvent(
+            uid=uid[:255],
+            recurrence_id=recurrence_id,
+            sequence=sequence,
+            start_time=start,
+            end_time=end,
+            busy=busy,
+        )
+        return
+    for occurrence in occurrences:
+        yield ParsedEvent(
+            uid=uid[:255],
+            recurrence_id=_recurrence_key(occurrence),
+            sequence=sequence,
+            start_time=occurrence,
+            end_time=occurrence + (end - start),
+            busy=busy,
+            generated=True,
+        )
+
+
+def _occurrences(props, start, duration, default_tz, now) -> list[datetime] | None:
+    """
+    RRULE/RDATE (EXDATE বাদ দিয়ে) এখন থেকে ICS_RECURRENCE_HORIZON_DAYS পর্যন্ত
+    খোলে, সর্বোচ্চ ICS_RECURRENCE_MAX_OCCURRENCES টা। পুনরাবৃত্তি না থাকলে None।
+    """
+    if "RRULE" not in props and "RDATE" not in props:
+        return None
+    rules = rruleset()
+    if "RRULE" in props:
+        rules.rrule(rrulestr(props["RRULE"][1], dtstart=start))
+    else:
+        rules.rdate(start)
+    for params, value in props.get("RDATE", []):
+        for item in value.split(","):
+            rules.rdate(_parse_datetime(item, params, default_tz))
+    for params, value in props.get("EXDATE", []):
+        for item in value.split(","):
+            rules.exdate(_parse_datetime(item, params, default_tz))
+
+    horizon = now + recurrence_horizon()
+    limit = getattr(settings, "ICS_RECURRENCE_MAX_OCCURRENCES", 500)
+    occurrences = []
+    # চলতে থাকা occurrence-ও busy, তাই duration আগে থেকে।
+    for occurrence in rules.xafter(now - duration, count=limit, inc=False):
+        if occurrence > horizon:
+            break
+        occurrences.append(occurrence)
+    return occurrences
+
+
+def _flush(batch: list[ExternalBusyInterval]):
+    if not batch:
+        return
+    ExternalBusyInterval.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=["participant", "source", "uid", "recurrence_id"],
+        update_fields=["sequence", "start_time", "end_time", "updated_at"],
+    )
+    batch.clear()
+
+
+def import_busy_intervals(
+    participant,
+    stream: Iterable,
+    *,
+    source: str = "",
+    full_sync: bool = True,
+    batch_size: int = 1000,
+) -> ImportResult:
+    """
+    একজন participant-এর external calendar ingest করে। UID/SEQUENCE না বদলালে
+    row ছোঁয়া হয় না; full_sync হলে calendar থেকে মুছে যাওয়া event-ও মোছে।
+    Recurring event-এর প্রতিটা occurrence আলাদা row (RECURRENCE-ID দিয়ে)।
+    """
+    result = ImportResult()
+    existing = {
+        (uid, rid): (pk, seq, start, end)
+        for pk, uid, rid, seq, start, end in ExternalBusyInterval.objects.filter(
+            participant=participant, source=source
+        ).values_list("id", "uid", "recurrence_id", "sequence", "start_time", "end_time")
+    }
+    # key -> ImportResult-এর যে counter বাড়ানো হয়েছিল; override এলে ফেরত নেওয়া হয়।
+    seen: dict = {}
+    generated: set = set()
+    cancelled: set = set()
+    stale_ids: set = set()
+    batch: list[ExternalBusyInterval] = []
+    default_tz = get_zone(participant.timezone) if participant.timezone else dt_timezone.utc
+
+    with transaction.atomic():
+        for event in iter_vevents(iter_unfolded_lines(stream), default_tz=default_tz):
+            key = (event.uid, event.recurrence_id)
+            overrides = key in generated and not event.generated
+            if key in seen and not overrides:
+                continue
+            # Generated occurrence লেখা হয়ে গেলে DB আর `existing` মেলে না — override লিখতেই হবে।
+            rewrite = False
+            if overrides:
+                # RRULE থেকে বানানো occurrence-এর জায়গায় file-এর নিজের override।
+                generated.discard(key)
+                rewrite = seen[key] in ("created", "updated")
+                setattr(result, seen[key], getattr(result, seen[key]) - 1)
+                del seen[key]
+                _flush(batch)
+
+            if event.generated:
+                generated.add(key)
+            if not event.busy:
+                # seen-এ রাখা হয়, যাতে পরে আসা master-এর occurrence এটাকে ফিরিয়ে না আনে।
+                result.skipped += 1
+                seen[key] = "skipped"
+                if key in existing:
+                    stale_ids.add(existing[key][0])
+                elif overrides:
+                    cancelled.add(key)
+                continue
+
+            current = existing.get(key)
+            if current is not None:
+                _, seq, start, end = current
+                if event.sequence <= seq and (start, end) == (event.start_time, event.end_time):
+                    result.unchanged += 1
+                    seen[key] = "unchanged"
+                    if not rewrite:
+                        continue
+                else:
+                    result.updated += 1
+                    seen[key] = "updated"
+            else:
+                result.created += 1
+                seen[key] = "created"
+
+            batch.append(
+                ExternalBusyInterval(
+                    participant=participant,
+                    source=source,
+                    uid=event.uid,
+                    recurrence_id=event.recurrence_id,
+                    sequence=event.sequence,
+                    start_time=event.start_time,
+                    end_time=event.end_time,
+                )
+            )
+            if len(batch) >= batch_size:
+                _flush(batch)
+        _flush(batch)
+
+        if full_sync:
+            stale_ids.update(pk for key, (pk, *_) in existing.items() if key not in seen)
+        stale_ids = list(stale_ids)
+        for i in range(0, len(stale_ids), batch_size):
+            ExternalBusyInterval.objects.filter(id__in=stale_ids[i : i + batch_size]).delete()
+        result.deleted = len(stale_ids)
+        if cancelled:
+            # এই import-এই তৈরি হয়ে পরে cancel হওয়া occurrence; আগে ছিল না, তাই deleted-এ গোনা হয় না।
+            match = Q()
+            for uid, recurrence_id in cancelled:
+                match |= Q(uid=uid, recurrence_id=recurrence_id)
+            ExternalBusyInterval.objects.filter(match, participant=participant, source=source).delete()
+
+    logger.info(
+        f"ICS import for {participant.email} ({source or 'default'}): "
+        f"{result.created} created, {result.updated} updated, "
+        f"{result.unchanged} unchanged, {result.deleted} deleted"
+    )
+    return result
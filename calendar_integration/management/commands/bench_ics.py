@@ -0,0 +1,54 @@
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from meetings.models import Meeting, Participant
+from calendar_integration.services import MeetingIcsBuilder
+
+
+class Command(BaseCommand):
+    help = "Compare outbound .ics bytes and build time for full vs compact attachments (no DB access)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--attendees", type=int, default=3000)
+
+    def handle(self, *args, **options):
+        attendees = options["attendees"]
+        start = timezone.now() + timedelta(days=1)
+        meeting = Meeting(
+            title="All hands",
+            description="Company update",
+            location="Auditorium",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            timezone="Asia/Dhaka",
+        )
+        links = [
+            SimpleNamespace(
+                participant=Participant(
+                    email=f"attendee{i}@example.com", name=f"Attendee Number {i}"
+                )
+            )
+            for i in range(attendees)
+        ]
+
+        began = time.perf_counter()
+        builder = MeetingIcsBuilder(meeting)
+        full = builder.build(links)
+        full_total = len(full) * attendees
+        full_elapsed = time.perf_counter() - began
+
+        began = time.perf_counter()
+        builder = MeetingIcsBuilder(meeting)
+        compact_total = sum(len(builder.build_for(mp)) for mp in links)
+        compact_elapsed = time.perf_counter() - began
+
+        self.stdout.write(
+            f"full:    {len(full) / 1024:.1f} KiB/attachment, "
+            f"{full_total / 1024 / 1024:.1f} MiB outbound, built in {full_elapsed * 1000:.1f} ms"
+        )
+        self.stdout.write(
+            f"compact: {compact_total / attendees:.0f} B/attachment, "
+            f"{compact_total / 1024 / 1024:.2f} MiB outbound, built in {compact_elapsed * 1000:.1f} ms"
+        )
@@ -0,0 +1,28 @@
+from dataclasses import asdict
+from django.core.management.base import BaseCommand, CommandError
+from meetings.services import MeetingService
+from calendar_integration.ics_import import import_busy_intervals
+
+
+class Command(BaseCommand):
+    help = "Import busy time from a dropped .ics file for one participant."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--email", required=True)
+        parser.add_argument("--source", default="")
+        parser.add_argument("--no-full-sync", action="store_true")
+
+    def handle(self, *args, **options):
+        participant = MeetingService.get_or_create_participant(email=options["email"])
+        try:
+            with open(options["path"], "rb") as stream:
+                result = import_busy_intervals(
+                    participant,
+                    stream,
+                    source=options["source"],
+                    full_sync=not options["no_full_sync"],
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+        self.stdout.write(", ".join(f"{k}={v}" for k, v in asdict(result).items()))
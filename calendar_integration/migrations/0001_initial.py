@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('meetings', '0004_participant_timezone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExternalBusyInterval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(blank=True, max_length=100)),
+                ('uid', models.CharField(max_length=255)),
+                ('recurrence_id', models.CharField(blank=True, max_length=64)),
+                ('sequence', models.PositiveIntegerField(default=0)),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='external_busy_intervals', to='meetings.participant')),
+            ],
+            options={
+                'ordering': ['start_time'],
+                'indexes': [models.Index(fields=['participant', 'start_time', 'end_time'], name='external_busy_range_idx')],
+                'constraints': [models.UniqueConstraint(fields=('participant', 'source', 'uid', 'recurrence_id'), name='unique_external_busy_event')],
+            },
+        ),
+    ]
@@ -1,3 +1,34 @@
 from django.db import models
 
-# Create your models here.
+
+class ExternalBusyInterval(models.Model):
+    participant = models.ForeignKey(
+        "meetings.Participant",
+        related_name="external_busy_intervals",
+        on_delete=models.CASCADE,
+    )
+    source = models.CharField(max_length=100, blank=True)
+    uid = models.CharField(max_length=255)
+    recurrence_id = models.CharField(max_length=64, blank=True)
+    sequence = models.PositiveIntegerField(default=0)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["start_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["participant", "source", "uid", "recurrence_id"],
+                name="unique_external_busy_event",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["participant", "start_time", "end_time"],
+                name="external_busy_range_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.participant} busy {self.start_time} - {self.end_time}"
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class IcsImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    source = serializers.CharField(required=False, allow_blank=True, max_length=100, default="")
+    full_sync = serializers.BooleanField(required=False, default=True)
+
+
+class IcsImportResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    unchanged = serializers.IntegerField()
+    deleted = serializers.IntegerField()
+    skipped = serializers.IntegerField()
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone as dt_timezone
-from zoneinfo import ZoneInfo
 from django.utils import timezone
 from django.conf import settings
+from .timezones import coerce_timezone, get_zone, vtimezone_block
 
 def _utc(dt: datetime) -> str:
     if timezone.is_naive(dt):
@@ -11,39 +11,92 @@ def _utc(dt: datetime) -> str:
 def _local(dt: datetime, tzid: str) -> str:
     if timezone.is_naive(dt):
         dt = timezone.make_aware(dt)
-    return dt.astimezone(ZoneInfo(tzid)).strftime("%Y%m%dT%H%M%S")
+    return dt.astimezone(get_zone(tzid)).strftime("%Y%m%dT%H%M%S")
 
 def _esc(s: str) -> str:
     return (s or "").replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;").replace("\n", "\\n")
 
-def generate_meeting_ics(meeting, meeting_participants=None) -> bytes:
-    tzid = meeting.timezone or "UTC"
-    domain = getattr(settings, "ICS_PRODID_DOMAIN", "meeting.local")
-
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "CALSCALE:GREGORIAN",
-        "METHOD:REQUEST",
-        f"X-WR-TIMEZONE:{tzid}",
-        "BEGIN:VEVENT",
-        f"UID:meeting-{meeting.id}@{domain}",
-        f"DTSTAMP:{_utc(timezone.now())}",
-        f"DTSTART;TZID={tzid}:{_local(meeting.start_time, tzid)}",
-        f"DTEND;TZID={tzid}:{_local(meeting.end_time, tzid)}",
-        f"SUMMARY:{_esc(meeting.title)}",
-    ]
-
-    if meeting.location:
-        lines.append(f"LOCATION:{_esc(meeting.location)}")
-
-    if meeting.description:
-        lines.append(f"DESCRIPTION:{_esc(meeting.description)}")
-
-    qs = meeting_participants or meeting.meeting_participants.select_related("participant")
-    for mp in qs:
-        p = mp.participant
-        lines.append(f'ATTENDEE;CN="{_esc(p.name or p.email)}":mailto:{p.email}')
-
-    lines += ["END:VEVENT", "END:VCALENDAR"]
-    return ("\r\n".join(lines) + "\r\n").encode()
+def _attendee_line(participant) -> str:
+    return f'ATTENDEE;CN="{_esc(participant.name or participant.email)}":mailto:{participant.email}'
+
+
+class MeetingIcsBuilder:
+    """
+    Meeting-এর header/footer একবারই তৈরি হয়; attendee অংশ আলাদা করে বসানো
+    যায়, তাই প্রতি recipient-এর জন্য ছোট ICS বানানো সস্তা।
+    """
+
+    def __init__(self, meeting):
+        tzid = coerce_timezone(meeting.timezone)
+        domain = getattr(settings, "ICS_PRODID_DOMAIN", "meeting.local")
+        start_year = meeting.start_time.astimezone(get_zone(tzid)).year
+
+        timezone_block = vtimezone_block(tzid, start_year).rstrip("\r\n")
+
+        def calendar(method):
+            return "\r\n".join(
+                [
+                    "BEGIN:VCALENDAR",
+                    "VERSION:2.0",
+                    "CALSCALE:GREGORIAN",
+                    f"METHOD:{method}",
+                    f"X-WR-TIMEZONE:{tzid}",
+                    timezone_block,
+                    "",
+                ]
+            ).encode()
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:meeting-{meeting.id}@{domain}",
+            f"SEQUENCE:{getattr(meeting, 'sequence', 0)}",
+            f"DTSTAMP:{_utc(timezone.now())}",
+            f"DTSTART;TZID={tzid}:{_local(meeting.start_time, tzid)}",
+            f"DTEND;TZID={tzid}:{_local(meeting.end_time, tzid)}",
+            f"SUMMARY:{_esc(meeting.title)}",
+        ]
+
+        if meeting.location:
+            lines.append(f"LOCATION:{_esc(meeting.location)}")
+
+        if meeting.description:
+            lines.append(f"DESCRIPTION:{_esc(meeting.description)}")
+
+        if meeting.created_by_id:
+            organizer = meeting.created_by
+            lines.append(
+                f'ORGANIZER;CN="{_esc(organizer.full_name)}":mailto:{organizer.email}'
+            )
+
+        event = ("\r\n".join(lines) + "\r\n").encode()
+        self.meeting = meeting
+        self.header = calendar("REQUEST") + event
+        self.cancel_header = calendar("CANCEL") + event + b"STATUS:CANCELLED\r\n"
+        self.footer = b"END:VEVENT\r\nEND:VCALENDAR\r\n"
+
+    def build(self, meeting_participants=(), *, attendee_limit: int | None = None) -> bytes:
+        parts = [self.header]
+        for count, mp in enumerate(meeting_participants):
+            if attendee_limit is not None and count >= attendee_limit:
+                break
+            parts.append((_attendee_line(mp.participant) + "\r\n").encode())
+        parts.append(self.footer)
+        return b"".join(parts)
+
+    def build_for(self, mp, *, cancelled: bool = False) -> bytes:
+        """Organizer + শুধু এই attendee — বড় meeting-এর email attachment-এর জন্য।"""
+        return b"".join(
+            (
+                self.cancel_header if cancelled else self.header,
+                (_attendee_line(mp.participant) + "\r\n").encode(),
+                self.footer,
+            )
+        )
+
+
+def generate_meeting_ics(meeting, meeting_participants=None, *, attendee_limit=None) -> bytes:
+    if meeting_participants is None:
+        meeting_participants = meeting.meeting_participants.select_related("participant")
+    return MeetingIcsBuilder(meeting).build(
+        meeting_participants, attendee_limit=attendee_limit
+    )
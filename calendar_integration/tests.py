@@ -1,3 +1,256 @@
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone as dt_timezone
+from types import SimpleNamespace
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import TestCase, override_settings
+from meetings.models import Meeting, Participant
+from meetings.services import MeetingService
+from notifications.services import send_meeting_invitations
+from .ics_import import import_busy_intervals, iter_unfolded_lines, iter_vevents
+from .models import ExternalBusyInterval
+from .services import MeetingIcsBuilder
+from .timezones import get_zone
 
-# Create your tests here.
+NOW = datetime(2030, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def calendar(*events: str) -> list[bytes]:
+    body = "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"
+    for event in events:
+        body += "BEGIN:VEVENT\r\n" + event.strip().replace("\n", "\r\n") + "\r\nEND:VEVENT\r\n"
+    body += "END:VCALENDAR\r\n"
+    return [line.encode() for line in body.splitlines(keepends=True)]
+
+
+def parse(*events: str, default_tz=dt_timezone.utc):
+    return list(iter_vevents(iter_unfolded_lines(calendar(*events)), default_tz=default_tz, now=NOW))
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+class IcsParserTests(TestCase):
+    def test_folded_lines_are_joined(self):
+        lines = list(iter_unfolded_lines([b"SUMMARY:Long\r\n", b"  title\r\n", b"\tcontinued\r\n", b"UID:x\r\n"]))
+        self.assertEqual(lines, ["SUMMARY:Long titlecontinued", "UID:x"])
+        [event] = parse("UID:folded-\n uid@example.com\nDTSTART:20300105T100000Z\nDTEND:20300105T110000Z")
+        self.assertEqual(event.uid, "folded-uid@example.com")
+
+    def test_tzid_and_utc_times(self):
+        [event] = parse(
+            "UID:a\nDTSTART;TZID=America/New_York:20300105T100000\nDTEND;TZID=America/New_York:20300105T110000"
+        )
+        self.assertEqual(event.start_time, utc(2030, 1, 5, 15))
+        self.assertEqual(event.end_time, utc(2030, 1, 5, 16))
+
+    def test_floating_time_uses_the_default_zone(self):
+        [event] = parse("UID:a\nDTSTART:20300105T100000\nDTEND:20300105T110000", default_tz=get_zone("Asia/Dhaka"))
+        self.assertEqual(event.start_time, utc(2030, 1, 5, 4))
+        [event] = parse("UID:a\nDTSTART;TZID=Nowhere/Land:20300105T100000\nDURATION:PT1H", default_tz=get_zone("Asia/Dhaka"))
+        self.assertEqual(event.start_time, utc(2030, 1, 5, 4))
+
+    def test_all_day_event_is_one_local_day(self):
+        [event] = parse("UID:a\nDTSTART;VALUE=DATE:20300105", default_tz=get_zone("Asia/Dhaka"))
+        self.assertEqual(event.start_time, utc(2030, 1, 4, 18))
+        self.assertEqual(event.end_time - event.start_time, timedelta(days=1))
+        self.assertTrue(event.busy)
+
+    def test_duration(self):
+        [event] = parse("UID:a\nDTSTART:20300105T100000Z\nDURATION:P1DT2H30M")
+        self.assertEqual(event.end_time, utc(2030, 1, 6, 12, 30))
+        self.assertEqual(parse("UID:a\nDTSTART:20300105T100000Z\nDURATION:bogus"), [])
+
+    def test_cancelled_and_transparent_are_not_busy(self):
+        events = parse(
+            "UID:a\nDTSTART:20300105T100000Z\nDURATION:PT1H\nSTATUS:CANCELLED",
+            "UID:b\nDTSTART:20300105T100000Z\nDURATION:PT1H\nTRANSP:TRANSPARENT",
+            "UID:c\nDTSTART:20300105T100000Z",
+        )
+        self.assertEqual([e.busy for e in events], [False, False, False])
+
+    def test_nested_components_do_not_leak_properties(self):
+        [event] = parse(
+            "UID:a\nDTSTART:20300105T100000Z\nBEGIN:VALARM\nDURATION:PT5M\nEND:VALARM\nDTEND:20300105T110000Z"
+        )
+        self.assertEqual(event.end_time, utc(2030, 1, 5, 11))
+
+    def test_weekly_rule_is_expanded_within_the_horizon(self):
+        with override_settings(ICS_RECURRENCE_HORIZON_DAYS=28):
+            events = parse(
+                "UID:standup\nDTSTART;TZID=America/New_York:20291201T090000\nDURATION:PT30M\n"
+                "RRULE:FREQ=WEEKLY;BYDAY=MO\nEXDATE;TZID=America/New_York:20300114T090000"
+            )
+        self.assertEqual(
+            [e.start_time for e in events],
+            [utc(2030, 1, 7, 14), utc(2030, 1, 21, 14), utc(2030, 1, 28, 14)],
+        )
+        self.assertEqual([e.recurrence_id for e in events][0], "20300107T140000Z")
+        self.assertTrue(all(e.generated and e.end_time - e.start_time == timedelta(minutes=30) for e in events))
+
+    def test_rdate_and_occurrence_in_progress(self):
+        events = parse(
+            "UID:r\nDTSTART:20291231T230000Z\nDURATION:PT2H\nRDATE:20300110T100000Z,20300111T100000Z"
+        )
+        self.assertEqual(
+            [e.start_time for e in events],
+            [utc(2029, 12, 31, 23), utc(2030, 1, 10, 10), utc(2030, 1, 11, 10)],
+        )
+
+    @override_settings(ICS_RECURRENCE_MAX_OCCURRENCES=3)
+    def test_occurrence_count_is_capped(self):
+        events = parse("UID:m\nDTSTART:20300101T100000Z\nDURATION:PT1M\nRRULE:FREQ=MINUTELY")
+        self.assertEqual(len(events), 3)
+
+    def test_override_keeps_its_own_recurrence_id(self):
+        [event] = parse(
+            "UID:standup\nRECURRENCE-ID;TZID=America/New_York:20300107T090000\n"
+            "DTSTART;TZID=America/New_York:20300107T100000\nDURATION:PT30M"
+        )
+        self.assertEqual((event.recurrence_id, event.generated), ("20300107T140000Z", False))
+
+
+@mock.patch("django.utils.timezone.now", return_value=NOW)
+@override_settings(ICS_RECURRENCE_HORIZON_DAYS=28)
+class IcsImportTests(TestCase):
+    def setUp(self):
+        self.participant = MeetingService.get_or_create_participant(email="ada@example.com")
+
+    def rows(self):
+        return list(
+            ExternalBusyInterval.objects.filter(participant=self.participant)
+            .order_by("start_time")
+            .values_list("uid", "recurrence_id", "sequence", "start_time")
+        )
+
+    def test_upsert_by_uid_and_sequence(self, _now):
+        first = calendar("UID:a\nSEQUENCE:1\nDTSTART:20300105T100000Z\nDURATION:PT1H")
+        result = import_busy_intervals(self.participant, first)
+        self.assertEqual((result.created, result.updated, result.unchanged), (1, 0, 0))
+        result = import_busy_intervals(self.participant, first)
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 0, 1))
+
+        moved = calendar("UID:a\nSEQUENCE:2\nDTSTART:20300105T120000Z\nDURATION:PT1H")
+        result = import_busy_intervals(self.participant, moved)
+        self.assertEqual((result.created, result.updated), (0, 1))
+        self.assertEqual(self.rows(), [("a", "", 2, utc(2030, 1, 5, 12))])
+
+    def test_full_sync_deletes_missing_events(self, _now):
+        import_busy_intervals(
+            self.participant,
+            calendar(
+                "UID:a\nDTSTART:20300105T100000Z\nDURATION:PT1H",
+                "UID:b\nDTSTART:20300106T100000Z\nDURATION:PT1H",
+            ),
+        )
+        only_a = calendar("UID:a\nDTSTART:20300105T100000Z\nDURATION:PT1H")
+        result = import_busy_intervals(self.participant, only_a, full_sync=False)
+        self.assertEqual(result.deleted, 0)
+        result = import_busy_intervals(self.participant, only_a)
+        self.assertEqual(result.deleted, 1)
+        self.assertEqual([row[0] for row in self.rows()], ["a"])
+
+    def test_event_cancelled_later_is_removed(self, _now):
+        import_busy_intervals(self.participant, calendar("UID:a\nDTSTART:20300105T100000Z\nDURATION:PT1H"))
+        result = import_busy_intervals(
+            self.participant,
+            calendar("UID:a\nSEQUENCE:1\nDTSTART:20300105T100000Z\nDURATION:PT1H\nSTATUS:CANCELLED"),
+            full_sync=False,
+        )
+        self.assertEqual((result.skipped, result.deleted), (1, 1))
+        self.assertEqual(self.rows(), [])
+
+    def test_floating_times_use_the_participants_zone(self, _now):
+        self.participant.timezone = "Asia/Dhaka"
+        self.participant.save()
+        import_busy_intervals(self.participant, calendar("UID:a\nDTSTART:20300105T100000\nDURATION:PT1H"))
+        self.assertEqual(self.rows()[0][3], utc(2030, 1, 5, 4))
+
+    def test_recurring_event_blocks_every_occurrence(self, _now):
+        weekly = (
+            "UID:standup\nDTSTART:20291202T090000Z\nDURATION:PT30M\n"
+            "RRULE:FREQ=WEEKLY;BYDAY=MO\nEXDATE:20300114T090000Z"
+        )
+        moved = "UID:standup\nRECURRENCE-ID:20300121T090000Z\nDTSTART:20300121T150000Z\nDURATION:PT30M"
+        dropped = "UID:standup\nRECURRENCE-ID:20300128T090000Z\nDTSTART:20300128T090000Z\nDURATION:PT30M\nSTATUS:CANCELLED"
+
+        # Override master-এর আগে বা পরে — দুই ক্রমেই override জেতে।
+        for order in ((weekly, moved, dropped), (moved, dropped, weekly)):
+            ExternalBusyInterval.objects.all().delete()
+            result = import_busy_intervals(self.participant, calendar(*order))
+            self.assertEqual(
+                [(rid, start) for _, rid, _, start in self.rows()],
+                [
+                    ("20300107T090000Z", utc(2030, 1, 7, 9)),
+                    ("20300121T090000Z", utc(2030, 1, 21, 15)),
+                ],
+            )
+            self.assertEqual(result.created, 2)
+
+        result = import_busy_intervals(self.participant, calendar(weekly, moved, dropped))
+        self.assertEqual((result.created, result.unchanged, result.deleted), (0, 2, 0))
+
+        # তৃতীয় সপ্তাহের standup-ও এখন conflict হিসেবে ধরা পড়ে।
+        conflicts = MeetingService.external_conflicts_for(
+            start_time=utc(2030, 1, 21, 15, 15),
+            end_time=utc(2030, 1, 21, 16),
+            participant_emails=["ada@example.com"],
+        )
+        self.assertEqual([c.uid for c in conflicts], ["standup"])
+
+
+class IcsAttachmentSizeTests(TestCase):
+    """
+    বড় meeting-এ compact attachment (organizer + শুধু নিজে) full-এর চেয়ে অনেক
+    ছোট; capped mode ICS_ATTENDEE_LIMIT মানে। bench_ics একই তুলনা বড় আকারে করে।
+    """
+
+    attendees = 300
+
+    def setUp(self):
+        self.organizer = get_user_model().objects.create_user(
+            email="organizer@example.com", first_name="Olive"
+        )
+        start = datetime(2030, 3, 1, 10, tzinfo=dt_timezone.utc)
+        self.meeting = Meeting(
+            title="All hands",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            timezone="Asia/Dhaka",
+            created_by=self.organizer,
+        )
+        self.links = [
+            SimpleNamespace(participant=Participant(email=f"attendee{i}@example.com", name=f"Attendee {i}"))
+            for i in range(self.attendees)
+        ]
+
+    def test_compact_has_organizer_and_one_attendee(self):
+        ics = MeetingIcsBuilder(self.meeting).build_for(self.links[7]).decode()
+        self.assertEqual(ics.count("ORGANIZER"), 1)
+        self.assertIn("mailto:organizer@example.com", ics)
+        attendees = [line for line in ics.splitlines() if line.startswith("ATTENDEE")]
+        self.assertEqual(attendees, ['ATTENDEE;CN="Attendee 7":mailto:attendee7@example.com'])
+
+    def test_compact_is_smaller_than_full(self):
+        builder = MeetingIcsBuilder(self.meeting)
+        full = builder.build(self.links)
+        compact = [builder.build_for(mp) for mp in self.links]
+        self.assertEqual(full.decode().count("ATTENDEE"), self.attendees)
+        self.assertLess(max(map(len, compact)) * 20, len(full))
+        self.assertLess(sum(map(len, compact)), len(full) * self.attendees / 20)
+
+    @override_settings(ICS_ATTENDEE_MODE="capped", ICS_ATTENDEE_LIMIT=5)
+    def test_capped_mode_respects_the_limit(self):
+        self.meeting.save()
+        MeetingService.book_participants(
+            self.meeting, [{"email": f"attendee{i}@example.com"} for i in range(12)]
+        )
+        send_meeting_invitations(self.meeting, dispatch_key="k")
+        self.assertEqual(len(mail.outbox), 12)
+        for message in mail.outbox:
+            ics = message.attachments[0][1]
+            ics = ics.decode() if isinstance(ics, bytes) else ics
+            self.assertEqual(
+                len([line for line in ics.splitlines() if line.startswith("ATTENDEE")]), 5
+            )
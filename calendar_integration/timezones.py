@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+from django.core.exceptions import ValidationError
+
+DEFAULT_TZID = "UTC"
+
+
+@lru_cache(maxsize=1)
+def known_timezones() -> frozenset[str]:
+    return frozenset(available_timezones()) | {DEFAULT_TZID}
+
+
+def is_valid_timezone(tzid: str) -> bool:
+    return bool(tzid) and tzid in known_timezones()
+
+
+@lru_cache(maxsize=None)
+def get_zone(tzid: str) -> ZoneInfo:
+    if not is_valid_timezone(tzid):
+        raise ZoneInfoNotFoundError(f"Unknown timezone {tzid!r}")
+    return ZoneInfo(tzid)
+
+
+def coerce_timezone(tzid: str | None, default: str = DEFAULT_TZID) -> str:
+    """পুরনো/ভুল value থাকলে crash না করে default zone ব্যবহার হয়।"""
+    return tzid if tzid and is_valid_timezone(tzid) else default
+
+
+def validate_timezone(value: str):
+    if value and not is_valid_timezone(value):
+        raise ValidationError(f"'{value}' is not a valid IANA timezone.", code="invalid_timezone")
+
+
+def _offset_at(zone: ZoneInfo, instant: datetime) -> timedelta:
+    return instant.astimezone(zone).utcoffset()
+
+
+@lru_cache(maxsize=1024)
+def offset_transitions(tzid: str, year: int) -> tuple:
+    """
+    একটা বছরের UTC-offset বদলের মুহূর্তগুলো:
+    (utc instant, offset before, offset after, tzname after)।
+    """
+    zone = get_zone(tzid)
+    start = datetime(year, 1, 1, tzinfo=dt_timezone.utc)
+    end = datetime(year + 1, 1, 1, tzinfo=dt_timezone.utc)
+    step = timedelta(days=1)
+
+    found = []
+    cursor = start
+    previous = _offset_at(zone, cursor)
+    while cursor < end:
+        nxt = min(cursor + step, end)
+        current = _offset_at(zone, nxt)
+        if current != previous:
+            lo, hi = cursor, nxt
+            while hi - lo > timedelta(minutes=1):
+                mid = lo + (hi - lo) / 2
+                if _offset_at(zone, mid) == previous:
+                    lo = mid
+                else:
+                    hi = mid
+            hi = hi.replace(second=0, microsecond=0)
+            found.append((hi, previous, current, hi.astimezone(zone).tzname()))
+            previous = current
+        cursor = nxt
+    return tuple(found)
+
+
+def _fmt_offset(offset: timedelta) -> str:
+    minutes = int(offset.total_seconds() // 60)
+    sign = "+" if minutes >= 0 else "-"
+    minutes = abs(minutes)
+    return f"{sign}{minutes // 60:02d}{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=512)
+def vtimezone_block(tzid: str, year: int) -> str:
+    """
+    একটা zone-এর VTIMEZONE block; (zone, year) প্রতি একবার তৈরি হয়ে cache থাকে।
+    আগের বছরের transition-ও রাখা হয় যাতে বছরের শুরুতে কোন offset চলছে তা বোঝা যায়।
+    """
+    zone = get_zone(tzid)
+    lines = ["BEGIN:VTIMEZONE", f"TZID:{tzid}"]
+
+    transitions = offset_transitions(tzid, year - 1) + offset_transitions(tzid, year)
+    if not transitions:
+        instant = datetime(year, 1, 1, tzinfo=dt_timezone.utc)
+        offset = _offset_at(zone, instant)
+        lines += [
+            "BEGIN:STANDARD",
+            "DTSTART:19700101T000000",
+            f"TZOFFSETFROM:{_fmt_offset(offset)}",
+            f"TZOFFSETTO:{_fmt_offset(offset)}",
+            f"TZNAME:{instant.astimezone(zone).tzname()}",
+            "END:STANDARD",
+        ]
+
+    for instant, before, after, name in transitions:
+        component = "DAYLIGHT" if after > before else "STANDARD"
+        local_start = (instant + before).strftime("%Y%m%dT%H%M%S")
+        lines += [
+            f"BEGIN:{component}",
+            f"DTSTART:{local_start}",
+            f"TZOFFSETFROM:{_fmt_offset(before)}",
+            f"TZOFFSETTO:{_fmt_offset(after)}",
+            f"TZNAME:{name}",
+            f"END:{component}",
+        ]
+
+    lines.append("END:VTIMEZONE")
+    return "\r\n".join(lines) + "\r\n"
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import IcsImportView
+
+urlpatterns = [
+    path("import/", IcsImportView.as_view(), name="calendar-import"),
+]
@@ -1,3 +1,31 @@
-from django.shortcuts import render
+from dataclasses import asdict
+from rest_framework import permissions, status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema
 
-# Create your views here.
+from meetings.services import MeetingService
+from .ics_import import import_busy_intervals
+from .serializers import IcsImportSerializer, IcsImportResultSerializer
+
+
+class IcsImportView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+    throttle_cost = 10
+
+    @extend_schema(request=IcsImportSerializer, responses=IcsImportResultSerializer, tags=["Calendar"])
+    def post(self, request):
+        serializer = IcsImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        participant = MeetingService.get_or_create_participant(email=request.user.email)
+        result = import_busy_intervals(
+            participant,
+            data["file"],
+            source=data["source"],
+            full_sync=data["full_sync"],
+        )
+        return Response(IcsImportResultSerializer(asdict(result)).data, status=status.HTTP_200_OK)
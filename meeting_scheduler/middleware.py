@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # brotli optional; না থাকলে শুধু gzip
+    brotli = None
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Accept-Encoding থেকে q=0 বাদ দিয়ে encoding-এর set।"""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    API response brotli (থাকলে) বা gzip-এ compress করে, যদি client চায় আর body
+    COMPRESSION_MIN_BYTES-এর বড় হয় — ছোট body-তে CPU খরচ লাভের চেয়ে বেশি।
+    gzip অংশ Django-র GZipMiddleware, তাই তার BREACH mitigation (random-length
+    gzip header) থাকে। Token ফেরত দেওয়া COMPRESSION_EXCLUDE_PATHS (/api/auth/)
+    কখনো compress হয় না। Streaming response (SSE) ছোঁয় না, তাহলে event আটকে থাকত।
+    """
+
+    def process_response(self, request, response):
+        path = request.path
+        if not path.startswith(tuple(getattr(settings, "COMPRESSION_PATHS", ("/api/",)))):
+            return response
+        if path.startswith(tuple(getattr(settings, "COMPRESSION_EXCLUDE_PATHS", ("/api/auth/",)))):
+            return response
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if len(response.content) < getattr(settings, "COMPRESSION_MIN_BYTES", 1024):
+            return response
+
+        accepted = accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if brotli is None or "br" not in accepted:
+            if "gzip" not in accepted:
+                # GZipMiddleware-এর regex "gzip;q=0"-কেও gzip ধরে।
+                patch_vary_headers(response, ("Accept-Encoding",))
+                return response
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed = brotli.compress(
+            response.content, quality=getattr(settings, "COMPRESSION_BROTLI_QUALITY", 5)
+        )
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = "br"
+        # Body বদলেছে, তাই strong ETag weak করি (RFC 9110 8.8.1); If-Match-এ W/ বাদ যায়।
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
@@ -0,0 +1,59 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    `Accept: text/event-stream` negotiation পার করার জন্য; SSE view নিজে
+    StreamingHttpResponse ফেরত দেয়, error হলে শুধু detail text যায়।
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict) and "detail" in data:
+            return f"event: error\ndata: {data['detail']}\n\n".encode()
+        return b""
+
+
+def _fallback_default(obj):
+    # Decimal, lazy string, timedelta ইত্যাদি DRF-এর encoder যেভাবে লেখে সেভাবেই।
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    একই application/json, কিন্তু orjson দিয়ে encode — বড় page-এ কয়েক গুণ দ্রুত।
+    Indent চাইলে (browsable API, ?indent) DRF-এর নিজের renderer-এ যায়।
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        import orjson
+
+        return orjson.dumps(
+            data, default=_fallback_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+class MsgPackRenderer(BaseRenderer):
+    """`Accept: application/msgpack` — JSON-এর চেয়ে ছোট, parse-ও সস্তা।"""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        import msgpack
+
+        return msgpack.packb(data, default=_fallback_default)
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import importlib.util
 import os
 from dotenv import load_dotenv
 
@@ -59,6 +60,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    "meeting_scheduler.middleware.CompressionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -104,6 +106,17 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # SQLite has no row locks; taking the write lock at BEGIN serializes
+        # bookings so the conflict check and insert cannot interleave.
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+        # In-memory shared-cache SQLite fails concurrent writers with "table is
+        # locked" instead of waiting, so the booking concurrency test needs a file.
+        'TEST': {
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        },
     }
 }
 
@@ -126,6 +139,37 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing. The preferred algorithm hashes new passwords; the others
+# stay listed so existing hashes still verify and get upgraded on next login.
+# argon2 needs `argon2-cffi` and bcrypt needs `bcrypt`; without them we fall
+# back to PBKDF2.
+_PASSWORD_HASHERS = {
+    "argon2": "accounts.hashers.Argon2PasswordHasher",
+    "bcrypt": "accounts.hashers.BCryptSHA256PasswordHasher",
+    "pbkdf2": "accounts.hashers.PBKDF2PasswordHasher",
+}
+_PASSWORD_HASH_LIBRARIES = {"argon2": "argon2", "bcrypt": "bcrypt", "pbkdf2": "hashlib"}
+PASSWORD_HASH_ALGORITHM = os.getenv(
+    "PASSWORD_HASH_ALGORITHM", "argon2" if importlib.util.find_spec("argon2") else "pbkdf2"
+)
+if PASSWORD_HASH_ALGORITHM not in _PASSWORD_HASHERS or not importlib.util.find_spec(
+    _PASSWORD_HASH_LIBRARIES[PASSWORD_HASH_ALGORITHM]
+):
+    PASSWORD_HASH_ALGORITHM = "pbkdf2"
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASH_ALGORITHM]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASH_ALGORITHM
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "1000000"))
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "102400"))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "8"))
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+
+# Password checks run in a small thread pool per process; when it and its
+# queue are full, login answers 503 instead of tying up request workers.
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", "0")) or None
+AUTH_HASH_QUEUE = int(os.getenv("AUTH_HASH_QUEUE", "8"))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -165,6 +209,14 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
 DEFAULT_FROM_EMAIL = os.getenv("EMAIL_HOST_USER")
 ICS_PRODID_DOMAIN = os.getenv("ICS_PRODID_DOMAIN", "meeting-scheduler.local")
+# Attendees listed in emailed .ics files: "compact" (organizer + recipient),
+# "capped" (first ICS_ATTENDEE_LIMIT attendees) or "full".
+ICS_ATTENDEE_MODE = os.getenv("ICS_ATTENDEE_MODE", "compact")
+ICS_ATTENDEE_LIMIT = int(os.getenv("ICS_ATTENDEE_LIMIT", "50"))
+# Imported recurring events (RRULE/RDATE) are expanded this far ahead, at most
+# ICS_RECURRENCE_MAX_OCCURRENCES busy rows per event.
+ICS_RECURRENCE_HORIZON_DAYS = int(os.getenv("ICS_RECURRENCE_HORIZON_DAYS", "180"))
+ICS_RECURRENCE_MAX_OCCURRENCES = int(os.getenv("ICS_RECURRENCE_MAX_OCCURRENCES", "500"))
 
 
 # CORS
@@ -177,25 +229,53 @@ CORS_ALLOWED_ORIGINS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.StatelessJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        # orjson থাকলে application/json সেটা দিয়েই; msgpack থাকলে Accept: application/msgpack চলে।
+        "meeting_scheduler.renderers.ORJSONRenderer"
+        if importlib.util.find_spec("orjson")
+        else "rest_framework.renderers.JSONRenderer",
+        *(["meeting_scheduler.renderers.MsgPackRenderer"] if importlib.util.find_spec("msgpack") else []),
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "meeting_scheduler.throttling.AnonTokenBucketThrottle",
+        "meeting_scheduler.throttling.UserTokenBucketThrottle",
     ],
+    # Refill rate of each token bucket.
     "DEFAULT_THROTTLE_RATES": {
         "anon": "20/minute",
         "user": "100/minute",
+        "login": "10/minute",
     },
 }
 
+# Bucket capacity, i.e. how many tokens a client can spend in a burst.
+THROTTLE_BURST = {
+    "anon": int(os.getenv("THROTTLE_BURST_ANON", "20")),
+    "user": int(os.getenv("THROTTLE_BURST_USER", "60")),
+    "login": int(os.getenv("THROTTLE_BURST_LOGIN", "5")),
+}
+
+# Throttle state has to be shared by every worker, so use Redis when it is
+# configured. The local-memory fallback is per process (fine for dev).
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
 from datetime import timedelta
 
 SIMPLE_JWT = {
@@ -203,11 +283,93 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.RevocationAwareTokenRefreshSerializer",
 }
 
+# Build request.user from the signed email/is_active claims instead of a DB
+# lookup. Only takes effect with REDIS_URL (revocations must be shared by every
+# worker); they reach other workers within AUTH_REVOCATION_CACHE_SECONDS.
+JWT_STATELESS_AUTH = os.getenv("JWT_STATELESS_AUTH", "True").lower() == "true"
+AUTH_REVOCATION_CACHE_SECONDS = int(os.getenv("AUTH_REVOCATION_CACHE_SECONDS", "30"))
+# Expired refresh tokens are pruned hourly by Huey, at most
+# TOKEN_PRUNE_BATCH_SIZE * TOKEN_PRUNE_MAX_BATCHES rows per run.
+TOKEN_PRUNE_BATCH_SIZE = int(os.getenv("TOKEN_PRUNE_BATCH_SIZE", "1000"))
+TOKEN_PRUNE_MAX_BATCHES = int(os.getenv("TOKEN_PRUNE_MAX_BATCHES", "50"))
+
 HUEY = {
     "huey_class": "huey.SqliteHuey",
     "filename": BASE_DIR / "huey.sqlite3",
     "immediate": False,
     "results": True,
-}
\ No newline at end of file
+}
+
+
+# Notifications outbox
+OUTBOX_RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "200"))
+# Edits to the same meeting within this window go out as one "updated" email.
+MEETING_UPDATE_DEBOUNCE_SECONDS = int(os.getenv("MEETING_UPDATE_DEBOUNCE_SECONDS", "120"))
+# ...but a meeting that keeps being edited still gets its update this long after
+# the oldest pending edit.
+MEETING_UPDATE_MAX_DELAY_SECONDS = int(os.getenv("MEETING_UPDATE_MAX_DELAY_SECONDS", "600"))
+# Participant rows read per query when sending to a meeting's attendees.
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "500"))
+
+# Per-recipient delivery tracking: failed sends retry with exponential backoff
+# (base * 2^(attempt-1), capped) until DELIVERY_MAX_ATTEMPTS; sent rows are
+# pruned after DELIVERY_RETENTION_DAYS.
+DELIVERY_MAX_ATTEMPTS = int(os.getenv("DELIVERY_MAX_ATTEMPTS", "5"))
+DELIVERY_RETRY_BASE_SECONDS = int(os.getenv("DELIVERY_RETRY_BASE_SECONDS", "60"))
+DELIVERY_RETRY_MAX_SECONDS = int(os.getenv("DELIVERY_RETRY_MAX_SECONDS", "3600"))
+DELIVERY_RETRY_BATCH_SIZE = int(os.getenv("DELIVERY_RETRY_BATCH_SIZE", "500"))
+# A row stuck in "queued"/"sending" this long (worker died mid-send) is retried.
+DELIVERY_SENDING_TIMEOUT_SECONDS = int(os.getenv("DELIVERY_SENDING_TIMEOUT_SECONDS", "600"))
+# Rows claimed (and sent over one SMTP connection) at a time; keep a chunk's
+# send time well under DELIVERY_SENDING_TIMEOUT_SECONDS.
+DELIVERY_SEND_CHUNK_SIZE = int(os.getenv("DELIVERY_SEND_CHUNK_SIZE", "50"))
+DELIVERY_RETENTION_DAYS = int(os.getenv("DELIVERY_RETENTION_DAYS", "30"))
+DELIVERY_FAILED_LIST_LIMIT = int(os.getenv("DELIVERY_FAILED_LIST_LIMIT", "100"))
+
+# Digest mode (per user, see User.email_digest): held invitations/cancellations
+# go out hourly, or once a day at DIGEST_DAILY_HOUR (UTC). The job reads
+# DIGEST_BATCH_SIZE recipients per query.
+DIGEST_DAILY_HOUR = int(os.getenv("DIGEST_DAILY_HOUR", "8"))
+DIGEST_BATCH_SIZE = int(os.getenv("DIGEST_BATCH_SIZE", "200"))
+DIGEST_MAX_BATCHES = int(os.getenv("DIGEST_MAX_BATCHES", "50"))
+
+# Meeting detail inlines at most this many participants (by email); the rest are
+# paged from /api/meetings/{id}/participants/.
+MEETING_INLINE_PARTICIPANTS = int(os.getenv("MEETING_INLINE_PARTICIPANTS", "100"))
+MEETING_PARTICIPANTS_PAGE_SIZE = int(os.getenv("MEETING_PARTICIPANTS_PAGE_SIZE", "100"))
+
+# Archival: meetings that ended this long ago (or were cancelled this long ago)
+# move to the archive tables nightly, in batches. History endpoints read both.
+MEETING_ARCHIVE_AFTER_DAYS = int(os.getenv("MEETING_ARCHIVE_AFTER_DAYS", "365"))
+MEETING_ARCHIVE_CANCELLED_AFTER_DAYS = int(os.getenv("MEETING_ARCHIVE_CANCELLED_AFTER_DAYS", "30"))
+MEETING_ARCHIVE_BATCH_SIZE = int(os.getenv("MEETING_ARCHIVE_BATCH_SIZE", "200"))
+MEETING_ARCHIVE_MAX_BATCHES = int(os.getenv("MEETING_ARCHIVE_MAX_BATCHES", "50"))
+
+# Reminders: minutes before start (comma-separated), e.g. "1440,15".
+REMINDER_OFFSETS_MINUTES = [
+    int(m) for m in os.getenv("REMINDER_OFFSETS_MINUTES", "15").split(",") if m.strip()
+]
+REMINDER_BUCKET_SECONDS = int(os.getenv("REMINDER_BUCKET_SECONDS", "60"))
+REMINDER_DISPATCH_BATCH_SIZE = int(os.getenv("REMINDER_DISPATCH_BATCH_SIZE", "500"))
+
+# Delta sync: change feed entries older than this are pruned nightly; clients
+# whose sync token is older get reset=true and must do a full resync.
+CHANGELOG_RETENTION_DAYS = int(os.getenv("CHANGELOG_RETENTION_DAYS", "30"))
+
+# Response compression for API paths (brotli if installed, else gzip). Bodies
+# smaller than COMPRESSION_MIN_BYTES are sent as-is. Endpoints that return
+# tokens are never compressed (BREACH); gzip also pads its header randomly.
+COMPRESSION_PATHS = ("/api/",)
+COMPRESSION_EXCLUDE_PATHS = ("/api/auth/",)
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# Live events (SSE). With Redis, events reach streams held by any worker;
+# otherwise only streams on the same process see them.
+LIVE_EVENTS_BROKER = os.getenv("LIVE_EVENTS_BROKER", "redis" if REDIS_URL else "local")
+LIVE_EVENTS_HEARTBEAT_SECONDS = int(os.getenv("LIVE_EVENTS_HEARTBEAT_SECONDS", "15"))
+# Streams close after this long and EventSource reconnects, freeing the worker.
+LIVE_EVENTS_MAX_SECONDS = int(os.getenv("LIVE_EVENTS_MAX_SECONDS", "300"))
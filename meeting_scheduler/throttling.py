@@ -0,0 +1,154 @@
+import threading
+import time
+from django.conf import settings
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+import logging
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = bucket key; ARGV = capacity, refill per second, cost, ttl.
+# Redis-এর নিজের clock ব্যবহার হয়, তাই worker-দের clock skew কোনো ব্যাপার না।
+_REDIS_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return {allowed, tostring(tokens)}
+"""
+
+
+_script = None
+_script_lock = threading.Lock()
+
+
+def get_bucket_script():
+    """
+    REDIS_URL থাকলে সব worker-এর জন্য shared bucket-এর registered Lua script
+    (EVALSHA), নইলে None — তখন bucket প্রতি process-এর cache-এ থাকে।
+    """
+    global _script
+    url = getattr(settings, "REDIS_URL", None)
+    if not url:
+        return None
+    if _script is None:
+        with _script_lock:
+            if _script is None:
+                try:
+                    import redis
+                except ImportError:
+                    return None
+                _script = redis.Redis.from_url(url).register_script(_REDIS_SCRIPT)
+    return _script
+
+
+def shared_buckets_available() -> bool:
+    if not getattr(settings, "REDIS_URL", None):
+        return False
+    try:
+        import redis  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class TokenBucketMixin:
+    """
+    Cost-weighted token bucket। Rate string ("100/minute") refill rate দেয়,
+    THROTTLE_BURST[scope] bucket-এর capacity। View `throttle_costs`
+    (action -> cost) বা `throttle_cost` দিয়ে দামি endpoint-এর cost বাড়াতে পারে।
+    """
+
+    cache_format = "throttle:bucket:%(scope)s:%(ident)s"
+    lock_attempts = 20
+
+    def get_capacity(self) -> int:
+        return getattr(settings, "THROTTLE_BURST", {}).get(self.scope, self.num_requests)
+
+    def get_cost(self, request, view) -> int:
+        costs = getattr(view, "throttle_costs", {})
+        cost = costs.get(getattr(view, "action", None), getattr(view, "throttle_cost", 1))
+        return max(1, min(int(cost), self.get_capacity()))
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.capacity = self.get_capacity()
+        self.refill = self.num_requests / self.duration
+        self.cost = self.get_cost(request, view)
+        allowed, self.tokens = self.consume()
+        return allowed
+
+    def _ttl(self) -> int:
+        return int(self.capacity / self.refill) + 1
+
+    def consume(self) -> tuple[bool, float]:
+        script = get_bucket_script()
+        if script is not None:
+            try:
+                allowed, tokens = script(
+                    keys=[self.key],
+                    args=[self.capacity, self.refill, self.cost, self._ttl()],
+                )
+                return bool(allowed), float(tokens)
+            except Exception as e:
+                logger.warning(f"Redis throttle failed, using local bucket: {str(e)}")
+        return self._consume_with_lock()
+
+    def _consume_with_lock(self) -> tuple[bool, float]:
+        # Redis ছাড়া অন্য backend-এ cache.add দিয়ে ছোট lock; add নিজে atomic।
+        lock_key = f"{self.key}:lock"
+        for _ in range(self.lock_attempts):
+            if self.cache.add(lock_key, 1, timeout=1):
+                break
+            time.sleep(0.001)
+        else:
+            logger.warning(f"Throttle lock busy for {self.key}, letting request through")
+            return True, 0.0
+
+        try:
+            now = self.timer()
+            tokens, ts = self.cache.get(self.key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + max(0.0, now - ts) * self.refill)
+            allowed = tokens >= self.cost
+            if allowed:
+                tokens -= self.cost
+            self.cache.set(self.key, (tokens, now), self._ttl())
+            return allowed, tokens
+        finally:
+            self.cache.delete(lock_key)
+
+    def wait(self):
+        return max(0.0, (self.cost - self.tokens) / self.refill)
+
+
+class AnonTokenBucketThrottle(TokenBucketMixin, AnonRateThrottle):
+    pass
+
+
+class UserTokenBucketThrottle(TokenBucketMixin, UserRateThrottle):
+    pass
+
+
+class LoginRateThrottle(TokenBucketMixin, SimpleRateThrottle):
+    """Login endpoint-এ client IP প্রতি আলাদা, ছোট bucket — password guessing আটকাতে।"""
+
+    scope = "login"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
@@ -39,5 +39,6 @@ urlpatterns = [
     ),
     path("api/auth/", include("accounts.urls")),
     path("api/meetings/", include("meetings.urls")),
+    path("api/calendar/", include("calendar_integration.urls")),
 ]
 
@@ -1,10 +1,17 @@
 from django.contrib import admin
-from .models import Meeting, Participant, MeetingParticipant
+from .models import (
+    AgendaEntry,
+    ArchivedMeeting,
+    ArchivedMeetingParticipant,
+    Meeting,
+    Participant,
+    MeetingParticipant,
+)
 
 @admin.register(Participant)
 class ParticipantAdmin(admin.ModelAdmin):
     list_display = ("email", "name", "created_at")
-    search_fields = ("email", "name")
+    search_fields = ("^email", "^name")
     ordering = ("email",)
 
 class MeetingParticipantInline(admin.TabularInline):
@@ -26,3 +33,25 @@ class MeetingParticipantAdmin(admin.ModelAdmin):
     list_filter = ("role", "response_status", "is_required")
     search_fields = ("meeting__title", "participant__email", "participant__name")
     autocomplete_fields = ("meeting", "participant")
+
+@admin.register(AgendaEntry)
+class AgendaEntryAdmin(admin.ModelAdmin):
+    list_display = ("user", "meeting", "start_time", "meeting_status", "is_creator", "response_status")
+    list_filter = ("meeting_status", "is_creator", "response_status")
+    search_fields = ("user__email", "meeting__title")
+    raw_id_fields = ("user", "meeting")
+
+class ArchivedMeetingParticipantInline(admin.TabularInline):
+    model = ArchivedMeetingParticipant
+    extra = 0
+    raw_id_fields = ("participant",)
+
+@admin.register(ArchivedMeeting)
+class ArchivedMeetingAdmin(admin.ModelAdmin):
+    list_display = ("title", "start_time", "end_time", "status", "created_by", "archived_at")
+    list_filter = ("status", "archived_at")
+    search_fields = ("title", "created_by__email")
+    date_hierarchy = "start_time"
+    raw_id_fields = ("created_by",)
+    inlines = [ArchivedMeetingParticipantInline]
+
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+from django.db import transaction
+from . import changes
+from .models import AgendaEntry, Meeting, MeetingParticipant
+
+_ROW_FIELDS = ("start_time", "meeting_status", "is_creator", "role", "response_status")
+
+
+@dataclass
+class AgendaDiff:
+    missing: list = field(default_factory=list)
+    stale: list = field(default_factory=list)
+    extra: list = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.missing or self.stale or self.extra)
+
+
+def _expected_rows(meeting_ids: list, user_ids: set | None = None) -> dict:
+    """Source table থেকে (user_id, meeting_id) -> row field যা থাকা উচিত।"""
+    rows: dict = {}
+    meetings = {}
+    for mid, creator_id, start, status in Meeting.objects.filter(id__in=meeting_ids).values_list(
+        "id", "created_by_id", "start_time", "status"
+    ):
+        meetings[mid] = {"start_time": start, "meeting_status": status}
+        if user_ids is None or creator_id in user_ids:
+            rows[(creator_id, mid)] = {
+                **meetings[mid],
+                "is_creator": True,
+                "role": "",
+                "response_status": "",
+            }
+
+    links = MeetingParticipant.objects.filter(
+        meeting_id__in=meeting_ids, participant__user__isnull=False
+    )
+    if user_ids is not None:
+        links = links.filter(participant__user_id__in=user_ids)
+    for mid, uid, role, response_status in links.values_list(
+        "meeting_id", "participant__user_id", "role", "response_status"
+    ):
+        row = rows.setdefault(
+            (uid, mid), {**meetings[mid], "is_creator": False, "role": "", "response_status": ""}
+        )
+        row["role"], row["response_status"] = role, response_status
+    return rows
+
+
+def diff(meeting_ids: list, user_ids: set | None = None) -> AgendaDiff:
+    expected = _expected_rows(meeting_ids, user_ids)
+    existing = AgendaEntry.objects.filter(meeting_id__in=meeting_ids)
+    if user_ids is not None:
+        existing = existing.filter(user_id__in=user_ids)
+
+    result = AgendaDiff()
+    for pk, uid, mid, *values in existing.values_list("id", "user_id", "meeting_id", *_ROW_FIELDS):
+        row = expected.pop((uid, mid), None)
+        if row is None:
+            result.extra.append((pk, uid, mid))
+        elif tuple(row[name] for name in _ROW_FIELDS) != tuple(values):
+            result.stale.append(AgendaEntry(user_id=uid, meeting_id=mid, **row))
+    result.missing = [
+        AgendaEntry(user_id=uid, meeting_id=mid, **row) for (uid, mid), row in expected.items()
+    ]
+    return result
+
+
+def apply(result: AgendaDiff):
+    """Row ঠিক করে; কেউ meeting দেখতে পেলে বা হারালে change feed-এ সেটা লেখে।"""
+    if result.extra:
+        AgendaEntry.objects.filter(id__in=[pk for pk, _, _ in result.extra]).delete()
+    changes.access_changed(
+        granted=[(entry.user_id, entry.meeting_id) for entry in result.missing],
+        revoked=[(uid, mid) for _, uid, mid in result.extra],
+    )
+    if result.missing or result.stale:
+        AgendaEntry.objects.bulk_create(
+            result.missing + result.stale,
+            update_conflicts=True,
+            unique_fields=["user", "meeting"],
+            update_fields=list(_ROW_FIELDS),
+        )
+
+
+def sync_meeting(meeting: Meeting, user_ids: Iterable | None = None):
+    """শুধু দেওয়া user-দের row মেলায়; None হলে meeting-এর সব row।"""
+    if user_ids is not None:
+        user_ids = {uid for uid in user_ids if uid is not None}
+        if not user_ids:
+            return
+    apply(diff([meeting.pk], user_ids))
+
+
+def sync_user(user_id):
+    """Participant নতুন করে user-এর সাথে link হলে তার সব meeting-এর row।"""
+    meeting_ids = list(
+        MeetingParticipant.objects.filter(participant__user_id=user_id)
+        .values_list("meeting_id", flat=True)
+        .distinct()
+    )
+    for i in range(0, len(meeting_ids), 500):
+        apply(diff(meeting_ids[i : i + 500], {user_id}))
+
+
+def refresh_meeting(meeting: Meeting):
+    """Time বা status বদলালে একটা UPDATE-এ meeting-এর সব row ঠিক হয়।"""
+    AgendaEntry.objects.filter(meeting_id=meeting.pk).update(
+        start_time=meeting.start_time, meeting_status=meeting.status
+    )
+
+
+def iter_meeting_id_batches(batch_size: int) -> Iterator[list]:
+    qs = Meeting.objects.order_by("id").values_list("id", flat=True)
+    last_id = None
+    while True:
+        page = qs if last_id is None else qs.filter(id__gt=last_id)
+        batch = list(page[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def rebuild(*, batch_size: int = 500, repair: bool = True) -> dict[str, int]:
+    """
+    পুরো table source থেকে মেলায়। repair=False হলে শুধু drift গুনে দেয়
+    (consistency check), কিছু লেখে না।
+    """
+    counts = {"missing": 0, "stale": 0, "extra": 0}
+    for meeting_ids in iter_meeting_id_batches(batch_size):
+        with transaction.atomic():
+            result = diff(meeting_ids)
+            if repair:
+                apply(result)
+        for name in counts:
+            counts[name] += len(getattr(result, name))
+    return counts
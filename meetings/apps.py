@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class MeetingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'meetings'
+
+    def ready(self):
+        from meeting_scheduler.throttling import shared_buckets_available
+        from . import signals  # noqa: F401
+
+        if not shared_buckets_available():
+            logger.warning(
+                "Throttle buckets are per process (set REDIS_URL and install redis); "
+                "with N workers each client gets N times its rate"
+            )
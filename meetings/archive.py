@@ -0,0 +1,171 @@
+import base64
+from datetime import datetime, timedelta
+from uuid import UUID
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from notifications.models import OutboxEvent
+from .models import ArchivedMeeting, ArchivedMeetingParticipant, Meeting, MeetingParticipant
+import logging
+
+logger = logging.getLogger(__name__)
+
+MEETING_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "location",
+    "start_time",
+    "end_time",
+    "timezone",
+    "status",
+    "sequence",
+    "version",
+    "invited_count",
+    "accepted_count",
+    "declined_count",
+    "tentative_count",
+    "created_by_id",
+    "created_at",
+    "updated_at",
+)
+LINK_COLUMNS = (
+    "id",
+    "meeting_id",
+    "participant_id",
+    "role",
+    "response_status",
+    "is_required",
+    "created_at",
+)
+
+
+def candidate_ids(*, limit: int, now=None) -> list:
+    """
+    End হওয়ার MEETING_ARCHIVE_AFTER_DAYS পরের meeting, আর cancel হওয়ার
+    MEETING_ARCHIVE_CANCELLED_AFTER_DAYS পরের meeting। যাদের outbox-এ এখনো
+    পাঠানো বাকি, তারা থাকে।
+    """
+    now = now or timezone.now()
+    ended_before = now - timedelta(days=getattr(settings, "MEETING_ARCHIVE_AFTER_DAYS", 365))
+    cancelled_before = now - timedelta(
+        days=getattr(settings, "MEETING_ARCHIVE_CANCELLED_AFTER_DAYS", 30)
+    )
+    pending = OutboxEvent.objects.filter(meeting=OuterRef("pk"), dispatched_at__isnull=True)
+    return list(
+        Meeting.objects.filter(
+            Q(end_time__lt=ended_before)
+            | Q(status=Meeting.Status.CANCELLED, updated_at__lt=cancelled_before)
+        )
+        .exclude(Exists(pending))
+        .order_by("end_time")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+@transaction.atomic
+def archive_meetings(meeting_ids) -> int:
+    """
+    Meeting আর তার link archive table-এ copy করে hot table থেকে মোছে (agenda,
+    outbox cascade-এ যায়)। Change feed-এ tombstone লেখা হয় না — archive হওয়া
+    meeting আর বদলায় না, তাই client-এর কাছে থাকা copy ঠিকই থাকে।
+    """
+    rows = list(Meeting.objects.filter(id__in=meeting_ids).values(*MEETING_COLUMNS))
+    if not rows:
+        return 0
+    ids = [row["id"] for row in rows]
+    ArchivedMeeting.objects.bulk_create(
+        (ArchivedMeeting(**row) for row in rows), ignore_conflicts=True
+    )
+    ArchivedMeetingParticipant.objects.bulk_create(
+        (
+            ArchivedMeetingParticipant(**row)
+            for row in MeetingParticipant.objects.filter(meeting_id__in=ids)
+            .order_by()
+            .values(*LINK_COLUMNS)
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    Meeting.objects.filter(id__in=ids).delete()
+    return len(ids)
+
+
+def archive(*, batch_size: int | None = None, max_batches: int | None = None) -> int:
+    """ছোট batch-এ চলে, প্রতিটা আলাদা transaction — hot table বেশিক্ষণ lock থাকে না।"""
+    batch_size = batch_size or getattr(settings, "MEETING_ARCHIVE_BATCH_SIZE", 200)
+    max_batches = max_batches or getattr(settings, "MEETING_ARCHIVE_MAX_BATCHES", 50)
+    archived = 0
+    for _ in range(max_batches):
+        ids = candidate_ids(limit=batch_size)
+        if not ids:
+            break
+        archived += archive_meetings(ids)
+
+    if archived:
+        logger.info(f"Archived {archived} meetings")
+    return archived
+
+
+def visible_for_user(user):
+    """User-এর তৈরি বা যেখানে সে linked participant ছিল এমন archived meeting।"""
+    invited = ArchivedMeetingParticipant.objects.filter(participant__user=user).values(
+        "meeting_id"
+    )
+    return ArchivedMeeting.objects.filter(Q(created_by=user) | Q(id__in=invited)).select_related(
+        "created_by"
+    )
+
+
+def get_for_user(user, pk) -> ArchivedMeeting | None:
+    return visible_for_user(user).filter(pk=pk).first()
+
+
+def encode_cursor(meeting) -> str:
+    raw = f"{meeting.start_time.isoformat()}|{meeting.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """ভুল cursor-এ ValueError।"""
+    try:
+        start, _, pk = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor.")
+    return datetime.fromisoformat(start), UUID(pk)
+
+
+def _before(queryset, cursor):
+    if cursor is None:
+        return queryset
+    start, pk = cursor
+    return queryset.filter(Q(start_time__lt=start) | Q(start_time=start, id__lt=pk))
+
+
+def history_for_user(user, *, cursor: str | None = None, limit: int = 50) -> dict:
+    """
+    শুরু হয়ে যাওয়া hot meeting আর archive-এর সব (cancel হয়ে archive হওয়া ভবিষ্যতের
+    meeting-ও), start_time-এর উল্টো ক্রমে। দুই table থেকেই (start_time, id)
+    keyset-এ limit করে পড়ে merge করা হয়, তাই archive job কখন চলল তাতে পাতা বদলায় না।
+    """
+    position = decode_cursor(cursor) if cursor else None
+    hot = (
+        Meeting.objects.filter(
+            agenda_entries__user=user, agenda_entries__start_time__lt=timezone.now()
+        )
+        .select_related("created_by")
+        .order_by("-start_time", "-id")
+    )
+    cold = visible_for_user(user).order_by("-start_time", "-id")
+    merged = sorted(
+        list(_before(hot, position)[: limit + 1]) + list(_before(cold, position)[: limit + 1]),
+        key=lambda m: (m.start_time, m.id),
+        reverse=True,
+    )
+    page = merged[:limit]
+    has_more = len(merged) > limit
+    return {
+        "results": page,
+        "next_cursor": encode_cursor(page[-1]) if has_more else None,
+    }
@@ -0,0 +1,198 @@
+from datetime import timedelta
+from typing import Iterable
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from .models import AgendaEntry, ChangeLogEntry
+import logging
+
+logger = logging.getLogger(__name__)
+
+MEETING = ChangeLogEntry.ObjectType.MEETING
+PARTICIPANT = ChangeLogEntry.ObjectType.PARTICIPANT
+UPSERT = ChangeLogEntry.Op.UPSERT
+DELETE = ChangeLogEntry.Op.DELETE
+
+
+def record(meeting_id, object_type: str, object_ids: Iterable, op: str, *, user_ids=None):
+    """
+    user_ids None হলে entry meeting-এর সবার জন্য (agenda দিয়ে মেলে);
+    দিলে শুধু সেই user-দের জন্য এক-একটা row।
+    """
+    object_ids = list(object_ids)
+    if not object_ids:
+        return
+    targets = [None] if user_ids is None else list(user_ids)
+    ChangeLogEntry.objects.bulk_create(
+        ChangeLogEntry(
+            meeting_id=meeting_id,
+            user_id=user_id,
+            object_type=object_type,
+            object_id=object_id,
+            op=op,
+        )
+        for user_id in targets
+        for object_id in object_ids
+    )
+
+
+def meeting_changed(meeting):
+    record(meeting.pk, MEETING, [meeting.pk], UPSERT)
+
+
+def meeting_deleted(meeting):
+    # Agenda row meeting-এর সাথেই cascade-এ মুছবে, তাই আগেই user ধরে tombstone লিখি।
+    user_ids = AgendaEntry.objects.filter(meeting_id=meeting.pk).values_list("user_id", flat=True)
+    record(meeting.pk, MEETING, [meeting.pk], DELETE, user_ids=user_ids)
+
+
+def links_changed(meeting_id, link_ids: Iterable):
+    record(meeting_id, PARTICIPANT, link_ids, UPSERT)
+
+
+def links_removed(meeting_id, link_ids: Iterable):
+    record(meeting_id, PARTICIPANT, link_ids, DELETE)
+
+
+def participant_profile_changed(participant):
+    """Name/timezone বদলালে এই participant-এর সব link-এর serialized data বদলায়।"""
+    from .models import MeetingParticipant
+
+    ChangeLogEntry.objects.bulk_create(
+        ChangeLogEntry(
+            meeting_id=meeting_id, object_type=PARTICIPANT, object_id=link_id, op=UPSERT
+        )
+        for meeting_id, link_id in MeetingParticipant.objects.filter(
+            participant=participant
+        ).values_list("meeting_id", "id")
+    )
+
+
+def access_changed(*, granted: Iterable = (), revoked: Iterable = ()):
+    """(user_id, meeting_id) জোড়া; agenda-য় row যোগ/বাদ হলে ডাকা হয়।"""
+    entries = [
+        ChangeLogEntry(
+            meeting_id=mid, user_id=uid, object_type=MEETING, object_id=mid, op=op
+        )
+        for op, pairs in ((UPSERT, granted), (DELETE, revoked))
+        for uid, mid in pairs
+    ]
+    if entries:
+        ChangeLogEntry.objects.bulk_create(entries)
+
+
+def latest_token() -> int:
+    return ChangeLogEntry.objects.order_by("-id").values_list("id", flat=True).first() or 0
+
+
+def is_expired(since: int) -> bool:
+    """
+    Pruning-এ since-এর পরের entry মুছে গিয়ে থাকলে client-কে full resync করতে হবে।
+    id কখনো reuse হয় না আর prune শেষ entry-টা রেখে দেয়, তাই oldest id-ই যথেষ্ট।
+    """
+    oldest = ChangeLogEntry.objects.order_by("id").values_list("id", flat=True).first()
+    return oldest is not None and since < oldest - 1
+
+
+def read_for_user(user, since: int, *, limit: int):
+    """
+    since-এর পরের entry (id ক্রমে) যা এই user দেখতে পায়: তার agenda-র meeting-এর
+    সাধারণ entry আর শুধু তার জন্য লেখা access entry। PK range read।
+    """
+    visible = AgendaEntry.objects.filter(user=user).values("meeting_id")
+    return list(
+        ChangeLogEntry.objects.filter(id__gt=since)
+        .filter(Q(user_id=user.pk) | Q(user_id__isnull=True, meeting_id__in=visible))
+        .order_by("id")[:limit]
+    )
+
+
+def collapse(entries) -> dict:
+    """একই object-এর একাধিক entry থেকে শুধু শেষটা রাখে।"""
+    latest: dict = {}
+    for entry in entries:
+        latest[(entry.object_type, entry.object_id)] = entry.op
+    result = {MEETING: ([], []), PARTICIPANT: ([], [])}
+    for (object_type, object_id), op in latest.items():
+        upserts, deletes = result[object_type]
+        (upserts if op == UPSERT else deletes).append(object_id)
+    return {
+        "meetings": result[MEETING][0],
+        "deleted_meetings": result[MEETING][1],
+        "participants": result[PARTICIPANT][0],
+        "removed_participants": result[PARTICIPANT][1],
+    }
+
+
+def build_feed(user, since: int | None, *, limit: int) -> dict:
+    """
+    Client-এর since token থেকে বদলানো meeting/link-এর বর্তমান অবস্থা আর
+    tombstone। since না থাকলে বা prune হয়ে গেলে reset=True — full resync লাগবে।
+    """
+    from .models import MeetingParticipant
+    from .serializers import MeetingListSerializer
+    from .services import MeetingService
+
+    # Head আগে পড়ি, যাতে পড়ার মাঝে আসা entry পরের sync-এ বাদ না পড়ে।
+    head = latest_token()
+    feed = {
+        "reset": since is None or is_expired(since),
+        "next_token": head,
+        "has_more": False,
+        "meetings": [],
+        "deleted_meetings": [],
+        "participants": [],
+        "removed_participants": [],
+    }
+    if feed["reset"]:
+        return feed
+
+    entries = [entry for entry in read_for_user(user, since, limit=limit + 1) if entry.id <= head]
+    if len(entries) > limit:
+        entries = entries[:limit]
+        feed["has_more"] = True
+        feed["next_token"] = entries[-1].id
+    collapsed = collapse(entries)
+
+    meetings = list(
+        MeetingService.list_visible_for_user(user, MeetingListSerializer.output_fields()).filter(
+            id__in=collapsed["meetings"]
+        )
+    )
+    links = list(
+        MeetingParticipant.objects.filter(
+            id__in=collapsed["participants"], meeting__agenda_entries__user=user
+        ).select_related("participant")
+    )
+    # Upsert-এর পরে মুছে গেছে বা access চলে গেছে — client-এর কাছে এগুলো delete।
+    found_meetings = {m.id for m in meetings}
+    found_links = {mp.id for mp in links}
+    feed.update(
+        meetings=meetings,
+        deleted_meetings=collapsed["deleted_meetings"]
+        + [pk for pk in collapsed["meetings"] if pk not in found_meetings],
+        participants=links,
+        removed_participants=collapsed["removed_participants"]
+        + [pk for pk in collapsed["participants"] if pk not in found_links],
+    )
+    return feed
+
+
+def prune(*, batch_size: int = 1000, max_batches: int = 100) -> int:
+    cutoff = timezone.now() - timedelta(days=getattr(settings, "CHANGELOG_RETENTION_DAYS", 30))
+    newest = latest_token()
+    deleted = 0
+    for _ in range(max_batches):
+        ids = list(
+            ChangeLogEntry.objects.filter(created_at__lt=cutoff, id__lt=newest)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        ChangeLogEntry.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+    if deleted:
+        logger.info(f"Pruned {deleted} change log entries older than {cutoff:%Y-%m-%d}")
+    return deleted
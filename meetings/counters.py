@@ -0,0 +1,76 @@
+from collections import Counter
+from typing import Mapping
+from django.db import transaction
+from django.db.models import Count, F
+from .agenda import iter_meeting_id_batches
+from .models import Meeting, MeetingParticipant
+import logging
+
+logger = logging.getLogger(__name__)
+
+# response_status -> Meeting-এর counter column
+FIELDS = {status: f"{status}_count" for status in MeetingParticipant.ResponseStatus.values}
+
+
+def total_expression():
+    """সব counter-এর যোগফল — participant_count annotation-এর জন্য।"""
+    columns = iter(FIELDS.values())
+    expression = F(next(columns))
+    for column in columns:
+        expression += F(column)
+    return expression
+
+
+def apply_deltas(meeting_id, deltas: Mapping[str, int]):
+    """
+    status -> +/- সংখ্যা। একটা UPDATE ... SET x = x + n, তাই একসাথে চলা
+    RSVP-রা একে অপরের লেখা মুছে ফেলে না।
+    """
+    updates = {FIELDS[status]: F(FIELDS[status]) + n for status, n in deltas.items() if n}
+    if updates:
+        Meeting.objects.filter(pk=meeting_id).update(**updates)
+
+
+def counts_for(meeting) -> dict[str, int]:
+    counts = {status: getattr(meeting, column) for status, column in FIELDS.items()}
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+def actual_counts(meeting_ids) -> dict:
+    """MeetingParticipant থেকে আসল সংখ্যা — একটা GROUP BY।"""
+    actual = {mid: Counter() for mid in meeting_ids}
+    for row in (
+        MeetingParticipant.objects.filter(meeting_id__in=meeting_ids)
+        .order_by()
+        .values("meeting_id", "response_status")
+        .annotate(c=Count("id"))
+    ):
+        actual[row["meeting_id"]][row["response_status"]] = row["c"]
+    return actual
+
+
+def reconcile(*, batch_size: int = 500, repair: bool = True) -> int:
+    """
+    Counter column-গুলো participant row থেকে মেলায় (admin edit, cascade delete
+    ইত্যাদিতে drift হতে পারে)। যতগুলো meeting-এ drift পাওয়া গেল সেই সংখ্যা ফেরত।
+    """
+    drifted = 0
+    for meeting_ids in iter_meeting_id_batches(batch_size):
+        with transaction.atomic():
+            stored = {
+                row["id"]: row
+                for row in Meeting.objects.filter(id__in=meeting_ids).values("id", *FIELDS.values())
+            }
+            for mid, counts in actual_counts(meeting_ids).items():
+                expected = {column: counts[status] for status, column in FIELDS.items()}
+                current = stored.get(mid)
+                if current is None or all(current[c] == n for c, n in expected.items()):
+                    continue
+                drifted += 1
+                if repair:
+                    Meeting.objects.filter(pk=mid).update(**expected)
+
+    if drifted:
+        logger.warning(f"RSVP counters drifted on {drifted} meetings (repair={repair})")
+    return drifted
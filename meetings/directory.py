@@ -0,0 +1,285 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from heapq import merge
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+from .models import AgendaEntry, MeetingParticipant, Participant
+
+
+def _tokens(*values: str) -> set[str]:
+    keys = set()
+    for value in values:
+        value = (value or "").strip().lower()
+        if not value:
+            continue
+        keys.add(value)
+        keys.update(part for part in value.replace("@", " ").replace(".", " ").split() if part)
+    return keys
+
+
+def _user_name(first: str, last: str) -> str:
+    """put_user আর rebuild একই নাম index করে (full_name-এর email fallback বাদে)।"""
+    return f"{first} {last}".strip()
+
+
+class ParticipantDirectory:
+    """
+    Participant আর User-এর email/name token-এর sorted list; bisect দিয়ে prefix
+    lookup হয়। প্রথম query-তে একবার build হয়, তারপর updated_at watermark আর
+    signal দিয়ে incrementally refresh হয়।
+
+    Build-এর পরের বদল বড় list-এ বসে না (সেটা প্রতি token-এ O(n) memmove) —
+    ছোট একটা sorted overlay-তে যায়, lookup দুটো merge করে পড়ে। পুরনো
+    (key, ref) list-এ থেকে যায়, কিন্তু _ref_keys-এ না থাকলে বাদ পড়ে। Overlay
+    DIRECTORY_OVERLAY_MAX_KEYS ছাড়ালে পরের ensure_fresh পুরো rebuild করে।
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._keys: list[tuple[str, str]] = []
+        self._overlay: list[tuple[str, str]] = []
+        self._entries: dict[str, dict] = {}
+        self._ref_keys: dict[str, set[str]] = {}
+        self._built_at: float | None = None
+        self._checked_at = 0.0
+        self._participant_watermark = None
+        self._user_watermark = None
+
+    # --- maintenance -------------------------------------------------------
+
+    def _put(self, ref: str, email: str, name: str, **extra):
+        keys = _tokens(email, name)
+        with self._lock:
+            added = keys - self._ref_keys.get(ref, set())
+            self._entries[ref] = {"email": email, "name": name, **extra}
+            self._ref_keys[ref] = keys
+            for key in added:
+                insort(self._overlay, (key, ref))
+
+    def _drop(self, ref: str):
+        with self._lock:
+            self._ref_keys.pop(ref, None)
+            self._entries.pop(ref, None)
+
+    def put_participant(self, participant: Participant):
+        if self._built_at is not None:
+            self._put(
+                f"p:{participant.id}",
+                participant.email,
+                participant.name,
+                participant_id=str(participant.id),
+                user_id=str(participant.user_id) if participant.user_id else None,
+            )
+
+    def put_user(self, user):
+        if self._built_at is not None:
+            self._put(
+                f"u:{user.id}",
+                user.email,
+                _user_name(user.first_name, user.last_name),
+                participant_id=None,
+                user_id=str(user.id),
+            )
+
+    def remove_participant(self, participant_id):
+        self._drop(f"p:{participant_id}")
+
+    def remove_user(self, user_id):
+        self._drop(f"u:{user_id}")
+
+    def rebuild(self):
+        keys, entries, ref_keys = [], {}, {}
+
+        def add(ref, email, name, **extra):
+            entries[ref] = {"email": email, "name": name, **extra}
+            ref_keys[ref] = _tokens(email, name)
+            keys.extend((key, ref) for key in ref_keys[ref])
+
+        started = timezone.now()
+        for pk, email, name, user_id in Participant.objects.values_list(
+            "id", "email", "name", "user_id"
+        ).iterator(chunk_size=5000):
+            add(
+                f"p:{pk}",
+                email,
+                name,
+                participant_id=str(pk),
+                user_id=str(user_id) if user_id else None,
+            )
+        for pk, email, first, last in get_user_model().objects.values_list(
+            "id", "email", "first_name", "last_name"
+        ).iterator(chunk_size=5000):
+            add(
+                f"u:{pk}",
+                email,
+                _user_name(first, last),
+                participant_id=None,
+                user_id=str(pk),
+            )
+        keys.sort()
+
+        with self._lock:
+            self._keys, self._entries, self._ref_keys = keys, entries, ref_keys
+            self._overlay = []
+            self._built_at = self._checked_at = time.monotonic()
+            self._participant_watermark = self._user_watermark = started
+
+    def refresh(self):
+        started = timezone.now()
+        for participant in Participant.objects.filter(
+            updated_at__gte=self._participant_watermark
+        ).iterator(chunk_size=1000):
+            self.put_participant(participant)
+        for user in get_user_model().objects.filter(
+            updated_at__gte=self._user_watermark
+        ).iterator(chunk_size=1000):
+            self.put_user(user)
+        self._participant_watermark = self._user_watermark = started
+        self._checked_at = time.monotonic()
+
+    def ensure_fresh(self):
+        now = time.monotonic()
+        full_every = getattr(settings, "DIRECTORY_FULL_REBUILD_SECONDS", 3600)
+        refresh_every = getattr(settings, "DIRECTORY_REFRESH_SECONDS", 30)
+        overlay_max = getattr(settings, "DIRECTORY_OVERLAY_MAX_KEYS", 100_000)
+        needs_rebuild = (
+            self._built_at is None
+            or now - self._built_at > full_every
+            or len(self._overlay) > overlay_max
+        )
+        if not needs_rebuild and now - self._checked_at <= refresh_every:
+            return
+
+        # Only the first request builds; others keep serving the current index.
+        if not self._refresh_lock.acquire(blocking=self._built_at is None):
+            return
+        try:
+            if (
+                self._built_at is None
+                or time.monotonic() - self._built_at > full_every
+                or len(self._overlay) > overlay_max
+            ):
+                self.rebuild()
+            else:
+                self.refresh()
+        finally:
+            self._refresh_lock.release()
+
+    # --- lookup ------------------------------------------------------------
+
+    def prefix_matches(self, prefix: str, *, limit: int) -> list[dict]:
+        prefix = prefix.strip().lower()
+        matches: list[dict] = []
+        seen_emails = set()
+        with self._lock:
+            for key, ref in merge(
+                self._scan(self._keys, prefix), self._scan(self._overlay, prefix)
+            ):
+                if key not in self._ref_keys.get(ref, ()):
+                    continue  # বদলে গেছে বা মুছে গেছে
+                entry = self._entries[ref]
+                if entry["email"] not in seen_emails:
+                    seen_emails.add(entry["email"])
+                    matches.append(entry)
+                    if len(matches) >= limit:
+                        break
+        return matches
+
+    @staticmethod
+    def _scan(keys: list[tuple[str, str]], prefix: str):
+        i = bisect_left(keys, (prefix, ""))
+        while i < len(keys) and keys[i][0].startswith(prefix):
+            yield keys[i]
+            i += 1
+
+    def entry_for_participant(self, participant_id):
+        return self._entries.get(f"p:{participant_id}")
+
+
+directory = ParticipantDirectory()
+
+
+def _contact_counts(user) -> dict[str, int]:
+    """এই user যাদের সাথে সবচেয়ে বেশি meeting করেছে — participant_id -> count।"""
+    key = f"directory:contacts:{user.pk}"
+    counts = cache.get(key)
+    if counts is None:
+        rows = (
+            MeetingParticipant.objects.filter(
+                Q(meeting__created_by=user)
+                | Q(meeting__meeting_participants__participant__user=user)
+            )
+            .exclude(participant__user=user)
+            .values("participant_id")
+            .annotate(n=Count("meeting", distinct=True))
+            .order_by("-n")[:500]
+        )
+        counts = {str(row["participant_id"]): row["n"] for row in rows}
+        cache.set(key, counts, getattr(settings, "DIRECTORY_CONTACTS_CACHE_SECONDS", 300))
+    return counts
+
+
+def _shared_with(user, entries: list[dict]) -> list[dict]:
+    """
+    entries থেকে শুধু তারা, যাদের সাথে user অন্তত একটা meeting-এ ছিল — index
+    সবার, কিন্তু অচেনা কারও email যেন suggestion-এ না আসে। একটা query।
+    """
+    participant_ids = {e["participant_id"] for e in entries if e["participant_id"]}
+    user_ids = {e["user_id"] for e in entries if e["user_id"]}
+    if not participant_ids and not user_ids:
+        return []
+    meetings = AgendaEntry.objects.filter(user=user).values("meeting_id")
+    known_participants, known_users = set(), set()
+    for participant_id, user_id, creator_id in MeetingParticipant.objects.filter(
+        Q(participant_id__in=participant_ids)
+        | Q(participant__user_id__in=user_ids)
+        | Q(meeting__created_by_id__in=user_ids),
+        meeting_id__in=meetings,
+    ).values_list("participant_id", "participant__user_id", "meeting__created_by_id"):
+        known_participants.add(str(participant_id))
+        known_users.update(str(pk) for pk in (user_id, creator_id) if pk)
+    return [
+        e for e in entries
+        if e["participant_id"] in known_participants or e["user_id"] in known_users
+    ]
+
+
+def autocomplete(user, query: str, *, limit: int = 10) -> list[dict]:
+    query = query.strip().lower()
+    if not query:
+        return []
+    directory.ensure_fresh()
+
+    results: list[dict] = []
+    emails = set()
+    counts = _contact_counts(user)
+    for participant_id, n in sorted(counts.items(), key=lambda item: -item[1]):
+        entry = directory.entry_for_participant(participant_id)
+        if entry is None or entry["email"] in emails:
+            continue
+        if any(key.startswith(query) for key in _tokens(entry["email"], entry["name"])):
+            results.append({**entry, "meeting_count": n})
+            emails.add(entry["email"])
+            if len(results) >= limit:
+                return results
+
+    candidates = [
+        entry
+        for entry in directory.prefix_matches(
+            query, limit=getattr(settings, "DIRECTORY_SCAN_LIMIT", 200)
+        )
+        if entry["email"] not in emails
+    ]
+    for entry in _shared_with(user, candidates):
+        if entry["email"] in emails:
+            continue
+        results.append({**entry, "meeting_count": counts.get(entry.get("participant_id"), 0)})
+        emails.add(entry["email"])
+        if len(results) >= limit:
+            break
+    return results
@@ -0,0 +1,6 @@
+class MeetingVersionConflict(Exception):
+    def __init__(self, current_version=None, precondition=False):
+        super().__init__("Meeting was modified by someone else. Reload and try again.")
+        self.current_version = current_version
+        # If-Match header থেকে আসা version মেলেনি (412); body-র version হলে 409।
+        self.precondition = precondition
@@ -0,0 +1,207 @@
+import json
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Iterator
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    def __init__(self, channels: list[str], maxsize: int = 100):
+        self.channels = channels
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def deliver(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # Slow client; পুরনো event ফেলে না দিয়ে নতুনটা বাদ দিই, reconnect-এ resync হবে।
+            logger.warning(f"Live event dropped for slow subscriber on {self.channels}")
+
+
+class LocalBroker:
+    """এক process-এর ভেতরের pub/sub; একাধিক worker হলে RedisBroker লাগে।"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, channels: list[str]) -> Subscription:
+        sub = Subscription(channels)
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            for channel in sub.channels:
+                subs = self._subscribers.get(channel)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subscribers[channel]
+
+    def deliver(self, channel: str, event: dict):
+        with self._lock:
+            subs = list(self._subscribers.get(channel, ()))
+        for sub in subs:
+            sub.deliver(event)
+
+    def publish(self, channel: str, event: dict):
+        self.deliver(channel, event)
+
+
+class RedisBroker(LocalBroker):
+    """
+    Redis PUBLISH দিয়ে সব worker-এ পাঠায়; প্রতি process-এ একটা listener thread
+    message নিয়ে local subscriber-দের দেয়। Redis না পেলে local-এ deliver করে।
+    """
+
+    prefix = "live:"
+
+    def __init__(self, url: str):
+        super().__init__()
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._listener: threading.Thread | None = None
+
+    def subscribe(self, channels: list[str]) -> Subscription:
+        if self._listener is None or not self._listener.is_alive():
+            with self._lock:
+                if self._listener is None or not self._listener.is_alive():
+                    self._listener = threading.Thread(
+                        target=self._listen, name="live-events", daemon=True
+                    )
+                    self._listener.start()
+        return super().subscribe(channels)
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{self.prefix}*")
+                for message in pubsub.listen():
+                    channel = message["channel"].decode()[len(self.prefix) :]
+                    self.deliver(channel, json.loads(message["data"]))
+            except Exception as e:
+                logger.error(f"Live event listener lost Redis connection: {str(e)}")
+                time.sleep(1)
+
+    def publish(self, channel: str, event: dict):
+        try:
+            self._client.publish(f"{self.prefix}{channel}", json.dumps(event))
+        except Exception as e:
+            logger.warning(f"Redis publish failed, delivering locally only: {str(e)}")
+            self.deliver(channel, event)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> LocalBroker:
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                url = getattr(settings, "REDIS_URL", None)
+                if getattr(settings, "LIVE_EVENTS_BROKER", "local") == "redis" and url:
+                    try:
+                        _broker = RedisBroker(url)
+                    except ImportError:
+                        logger.warning("redis is not installed, live events stay in-process")
+                if _broker is None:
+                    _broker = LocalBroker()
+    return _broker
+
+
+def meeting_channel(meeting_id) -> str:
+    return f"meeting:{meeting_id}"
+
+
+def user_channel(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def publish_meeting_event(meeting_id, event_type: str, data: dict):
+    """
+    Commit হওয়ার পরে meeting-এর channel আর agenda-র প্রতিটা user-এর channel-এ
+    event যায়; rollback হলে কিছুই যায় না।
+    """
+
+    def _send():
+        from .models import AgendaEntry
+
+        event = {
+            "id": time.time_ns(),
+            "type": event_type,
+            "data": {"meeting_id": str(meeting_id), **data},
+        }
+        broker = get_broker()
+        try:
+            broker.publish(meeting_channel(meeting_id), event)
+            for user_id in AgendaEntry.objects.filter(meeting_id=meeting_id).values_list(
+                "user_id", flat=True
+            ):
+                broker.publish(user_channel(user_id), event)
+        except Exception as e:
+            logger.error(f"Failed to publish {event_type} for meeting {meeting_id}: {str(e)}")
+
+    transaction.on_commit(_send)
+
+
+def _frame(event: dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+def _stream_limits() -> tuple[float, float]:
+    heartbeat = getattr(settings, "LIVE_EVENTS_HEARTBEAT_SECONDS", 15)
+    return heartbeat, time.monotonic() + getattr(settings, "LIVE_EVENTS_MAX_SECONDS", 300)
+
+
+def event_stream(channels: list[str]) -> Iterator[str]:
+    """
+    SSE frame-এর generator। Idle থাকলে heartbeat comment পাঠায়; LIVE_EVENTS_MAX_SECONDS
+    পরে শেষ হয় আর EventSource নিজে reconnect করে, তাই worker চিরকাল আটকে থাকে না।
+    """
+    broker = get_broker()
+    sub = broker.subscribe(channels)
+    heartbeat, deadline = _stream_limits()
+    try:
+        yield "retry: 3000\n\n"
+        while time.monotonic() < deadline:
+            try:
+                event = sub.queue.get(timeout=min(heartbeat, max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield _frame(event)
+    finally:
+        broker.unsubscribe(sub)
+
+
+async def async_event_stream(channels: list[str]):
+    """ASGI-তে sync iterator পুরোটা buffer হয়ে যায়, তাই একই loop-এর async রূপ।"""
+    broker = get_broker()
+    sub = broker.subscribe(channels)
+    get = sync_to_async(sub.queue.get, thread_sensitive=False)
+    heartbeat, deadline = _stream_limits()
+    try:
+        yield "retry: 3000\n\n"
+        while time.monotonic() < deadline:
+            try:
+                event = await get(timeout=min(heartbeat, max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield _frame(event)
+    finally:
+        broker.unsubscribe(sub)
@@ -0,0 +1,100 @@
+import gzip
+import importlib.util
+import time
+from datetime import timedelta
+from uuid import uuid4
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from meeting_scheduler.renderers import MsgPackRenderer, ORJSONRenderer
+from meetings.models import Meeting, MeetingParticipant, Participant
+from meetings.serializers import MeetingDetailSerializer, MeetingListSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark render time and bytes-on-wire for a meeting list page and a large "
+        "meeting detail across JSON, orjson and msgpack, raw/gzip/brotli (no DB access)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--attendees", type=int, default=2000)
+        parser.add_argument("--rounds", type=int, default=5)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        creator = User(email="organizer@example.com")
+        start = timezone.now() + timedelta(days=1)
+
+        def meeting(i):
+            m = Meeting(
+                id=uuid4(),
+                title=f"Weekly sync #{i}",
+                description="Agenda:\n- roadmap\n- hiring\n- open questions",
+                location="Main hall",
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=30),
+                timezone="Asia/Dhaka",
+                created_by=creator,
+                invited_count=8,
+                accepted_count=3,
+                declined_count=1,
+            )
+            m.participants_count = 12
+            return m
+
+        detail = meeting(0)
+        detail.inline_participants = [
+            MeetingParticipant(
+                meeting=detail,
+                participant=Participant(
+                    id=uuid4(), email=f"attendee{i}@example.com", name=f"Attendee {i}"
+                ),
+                created_at=start,
+            )
+            for i in range(options["attendees"])
+        ]
+        payloads = {
+            f"list x{options['rows']}": MeetingListSerializer(
+                [meeting(i) for i in range(options["rows"])], many=True
+            ).data,
+            f"detail x{options['attendees']}": MeetingDetailSerializer(detail).data,
+        }
+
+        renderers = [("json", JSONRenderer())]
+        if importlib.util.find_spec("orjson"):
+            renderers.append(("orjson", ORJSONRenderer()))
+        if importlib.util.find_spec("msgpack"):
+            renderers.append(("msgpack", MsgPackRenderer()))
+        compressors = [("raw", None), ("gzip", lambda body: gzip.compress(body, 6, mtime=0))]
+        if importlib.util.find_spec("brotli"):
+            import brotli
+
+            compressors.append(("br", lambda body: brotli.compress(body, quality=5)))
+
+        for label, data in payloads.items():
+            self.stdout.write(label)
+            for name, renderer in renderers:
+                render_ms = self._best(options["rounds"], lambda: renderer.render(data))
+                body = renderer.render(data)
+                for encoding, compress in compressors:
+                    extra_ms = 0.0 if compress is None else self._best(
+                        options["rounds"], lambda: compress(body)
+                    )
+                    size = len(body) if compress is None else len(compress(body))
+                    self.stdout.write(
+                        f"  {name:>8} {encoding:>4}: {render_ms + extra_ms:7.2f} ms "
+                        f"{size / 1024:9.1f} KiB"
+                    )
+
+    @staticmethod
+    def _best(rounds, fn) -> float:
+        best = None
+        for _ in range(rounds):
+            began = time.perf_counter()
+            fn()
+            elapsed = (time.perf_counter() - began) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
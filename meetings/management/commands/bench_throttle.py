@@ -0,0 +1,45 @@
+import time
+from uuid import uuid4
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import UserRateThrottle
+from meeting_scheduler.throttling import UserTokenBucketThrottle
+from meetings.views import MeetingViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark per-request throttle overhead against the configured cache "
+        "(token bucket vs DRF's sliding-window UserRateThrottle). No DB writes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20000)
+        parser.add_argument("--users", type=int, default=100)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        users = [User(id=uuid4(), email=f"bench{i}@example.invalid") for i in range(options["users"])]
+        factory = APIRequestFactory()
+        view = MeetingViewSet()
+        view.action = "retrieve"
+
+        requests = []
+        for user in users:
+            request = factory.get("/api/meetings/")
+            request.user = user
+            requests.append(request)
+
+        for throttle_class in (UserRateThrottle, UserTokenBucketThrottle):
+            throttle = throttle_class()
+            throttle.rate, throttle.num_requests, throttle.duration = "1000000/second", 1000000, 1
+            allowed = 0
+            began = time.perf_counter()
+            for i in range(options["requests"]):
+                allowed += throttle.allow_request(requests[i % len(requests)], view)
+            elapsed = time.perf_counter() - began
+            self.stdout.write(
+                f"{throttle_class.__name__}: {elapsed / options['requests'] * 1_000_000:.1f} "
+                f"us/request ({allowed} allowed, {options['users']} users)"
+            )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from meetings import agenda
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-user agenda table from meetings and participant links. "
+        "With --check, only report drift and exit non-zero if any is found."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        counts = agenda.rebuild(batch_size=options["batch_size"], repair=not options["check"])
+        summary = ", ".join(f"{n} {name}" for name, n in counts.items())
+
+        if options["check"]:
+            if any(counts.values()):
+                raise CommandError(f"Agenda drift found: {summary}")
+            self.stdout.write(self.style.SUCCESS("Agenda is consistent."))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Agenda rebuilt: {summary} rows fixed."))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from meetings import counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute per-meeting RSVP counters from participant links. "
+        "With --check, only report drift and exit non-zero if any is found."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        drifted = counters.reconcile(
+            batch_size=options["batch_size"], repair=not options["check"]
+        )
+
+        if options["check"]:
+            if drifted:
+                raise CommandError(f"RSVP counters drifted on {drifted} meetings.")
+            self.stdout.write(self.style.SUCCESS("RSVP counters are consistent."))
+            return
+        self.stdout.write(self.style.SUCCESS(f"RSVP counters fixed on {drifted} meetings."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0002_alter_participant_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='sequence',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0003_meeting_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='timezone',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:24
+
+import calendar_integration.timezones
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0004_participant_timezone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='meeting',
+            name='timezone',
+            field=models.CharField(default='UTC', max_length=64, validators=[calendar_integration.timezones.validate_timezone]),
+        ),
+        migrations.AlterField(
+            model_name='participant',
+            name='timezone',
+            field=models.CharField(blank=True, max_length=64, validators=[calendar_integration.timezones.validate_timezone]),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0005_alter_meeting_timezone_alter_participant_timezone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-19 19:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0006_meeting_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
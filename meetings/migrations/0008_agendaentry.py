@@ -0,0 +1,60 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_agenda(apps, schema_editor):
+    Meeting = apps.get_model("meetings", "Meeting")
+    MeetingParticipant = apps.get_model("meetings", "MeetingParticipant")
+    AgendaEntry = apps.get_model("meetings", "AgendaEntry")
+
+    rows = {}
+    for mid, creator_id, start, status in Meeting.objects.values_list(
+        "id", "created_by_id", "start_time", "status"
+    ).iterator():
+        rows[(creator_id, mid)] = AgendaEntry(
+            user_id=creator_id, meeting_id=mid, start_time=start,
+            meeting_status=status, is_creator=True,
+        )
+    for mid, uid, start, status, role, response_status in MeetingParticipant.objects.filter(
+        participant__user__isnull=False
+    ).values_list(
+        "meeting_id", "participant__user_id", "meeting__start_time", "meeting__status",
+        "role", "response_status",
+    ).iterator():
+        entry = rows.setdefault((uid, mid), AgendaEntry(
+            user_id=uid, meeting_id=mid, start_time=start, meeting_status=status,
+        ))
+        entry.role, entry.response_status = role, response_status
+    AgendaEntry.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0007_participant_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgendaEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_time', models.DateTimeField()),
+                ('meeting_status', models.CharField(choices=[('scheduled', 'Scheduled'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('is_creator', models.BooleanField(default=False)),
+                ('role', models.CharField(blank=True, choices=[('organizer', 'Organizer'), ('required', 'Required'), ('optional', 'Optional')], max_length=20)),
+                ('response_status', models.CharField(blank=True, choices=[('invited', 'Invited'), ('accepted', 'Accepted'), ('declined', 'Declined'), ('tentative', 'Tentative')], max_length=20)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='agenda_entries', to='meetings.meeting')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='agenda_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'start_time'], name='agenda_user_start_idx'), models.Index(fields=['user', 'is_creator', 'start_time'], name='agenda_user_invited_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'meeting'), name='agenda_user_meeting_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_agenda, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0008_agendaentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('meeting_id', models.UUIDField()),
+                ('user_id', models.UUIDField(blank=True, null=True)),
+                ('object_type', models.CharField(choices=[('meeting', 'Meeting'), ('participant', 'Participant link')], max_length=20)),
+                ('object_id', models.UUIDField()),
+                ('op', models.CharField(choices=[('upsert', 'Created or updated'), ('delete', 'Deleted')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['meeting_id', 'id'], name='changelog_meeting_idx'), models.Index(fields=['user_id', 'id'], name='changelog_user_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0009_changelogentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meetingparticipant',
+            index=models.Index(fields=['meeting', 'response_status'], name='meetings_me_meeting_79e980_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:50
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Meeting = apps.get_model("meetings", "Meeting")
+    MeetingParticipant = apps.get_model("meetings", "MeetingParticipant")
+
+    counts = {}
+    for row in (
+        MeetingParticipant.objects.order_by()
+        .values("meeting_id", "response_status")
+        .annotate(c=Count("id"))
+    ):
+        counts.setdefault(row["meeting_id"], {})[f"{row['response_status']}_count"] = row["c"]
+    for meeting_id, fields in counts.items():
+        Meeting.objects.filter(pk=meeting_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0010_meetingparticipant_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meeting',
+            name='accepted_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='declined_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='invited_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='tentative_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0011_meeting_rsvp_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedMeeting',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('location', models.CharField(blank=True, max_length=255)),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('timezone', models.CharField(default='UTC', max_length=64)),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('cancelled', 'Cancelled')], max_length=20)),
+                ('sequence', models.PositiveIntegerField(default=0)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('invited_count', models.IntegerField(default=0)),
+                ('accepted_count', models.IntegerField(default=0)),
+                ('declined_count', models.IntegerField(default=0)),
+                ('tentative_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedMeetingParticipant',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('role', models.CharField(choices=[('organizer', 'Organizer'), ('required', 'Required'), ('optional', 'Optional')], max_length=20)),
+                ('response_status', models.CharField(choices=[('invited', 'Invited'), ('accepted', 'Accepted'), ('declined', 'Declined'), ('tentative', 'Tentative')], max_length=20)),
+                ('is_required', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['meeting', 'participant__email'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['end_time'], name='meeting_end_time_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedmeeting',
+            name='created_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_meetings', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='archivedmeetingparticipant',
+            name='meeting',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meeting_participants', to='meetings.archivedmeeting'),
+        ),
+        migrations.AddField(
+            model_name='archivedmeetingparticipant',
+            name='participant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_meeting_participants', to='meetings.participant'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedmeeting',
+            index=models.Index(fields=['created_by', 'start_time'], name='archive_creator_start_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='archivedmeetingparticipant',
+            unique_together={('meeting', 'participant')},
+        ),
+    ]
@@ -1,11 +1,13 @@
 from django.db import models
 from uuid import uuid4
 from django.conf import settings
+from calendar_integration.timezones import validate_timezone
 
 class Participant(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     email = models.EmailField(max_length=255, unique=True, db_index=True)
     name = models.CharField(max_length=255, blank=True)
+    timezone = models.CharField(max_length=64, blank=True, validators=[validate_timezone])
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         related_name="participants",
@@ -14,6 +16,7 @@ class Participant(models.Model):
         blank=True,
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ["email"]
@@ -37,12 +40,19 @@ class Meeting(models.Model):
     location = models.CharField(max_length=255, blank=True)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
-    timezone = models.CharField(max_length=64, default="UTC")
+    timezone = models.CharField(max_length=64, default="UTC", validators=[validate_timezone])
     status = models.CharField(
         max_length=20,
         choices=Status.choices,
         default=Status.SCHEDULED,
     )
+    sequence = models.PositiveIntegerField(default=0)
+    version = models.PositiveIntegerField(default=1)
+    # RSVP counter — MeetingService update করে, reconcile_rsvp_counters মেলায়।
+    invited_count = models.IntegerField(default=0)
+    accepted_count = models.IntegerField(default=0)
+    declined_count = models.IntegerField(default=0)
+    tentative_count = models.IntegerField(default=0)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         related_name="created_meetings",
@@ -59,6 +69,10 @@ class Meeting(models.Model):
 
     class Meta:
         ordering = ["-start_time"]
+        indexes = [
+            # Archive job পুরনো meeting এখান থেকে খোঁজে।
+            models.Index(fields=["end_time"], name="meeting_end_time_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -103,7 +117,149 @@ class MeetingParticipant(models.Model):
     class Meta:
         unique_together = ("meeting", "participant")
         ordering = ["meeting", "participant__email"]
+        indexes = [
+            models.Index(fields=["meeting", "response_status"]),
+        ]
 
     def __str__(self):
         return f"{self.participant} @ {self.meeting}"
 
+
+
+class AgendaEntry(models.Model):
+    """
+    প্রতি (user, meeting)-এ একটা row — creator বা linked participant হলে।
+    MeetingService থেকে maintain হয়; "invited"/"upcoming" feed এখান থেকে পড়ে।
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="agenda_entries",
+        on_delete=models.CASCADE,
+    )
+    meeting = models.ForeignKey(
+        Meeting,
+        related_name="agenda_entries",
+        on_delete=models.CASCADE,
+    )
+    start_time = models.DateTimeField()
+    meeting_status = models.CharField(max_length=20, choices=Meeting.Status.choices)
+    is_creator = models.BooleanField(default=False)
+    role = models.CharField(max_length=20, choices=MeetingParticipant.Role.choices, blank=True)
+    response_status = models.CharField(
+        max_length=20, choices=MeetingParticipant.ResponseStatus.choices, blank=True
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "meeting"], name="agenda_user_meeting_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "start_time"], name="agenda_user_start_idx"),
+            models.Index(
+                fields=["user", "is_creator", "start_time"], name="agenda_user_invited_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} @ {self.meeting_id}"
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Append-only change feed; id-ই sync token। Meeting/link মুছে গেলেও row থাকে
+    (tombstone), তাই FK না রেখে শুধু UUID রাখা হয়। user_id থাকলে entry শুধু
+    সেই user-এর জন্য (কারো meeting-এ access পাওয়া বা হারানো)।
+    """
+
+    class ObjectType(models.TextChoices):
+        MEETING = "meeting", "Meeting"
+        PARTICIPANT = "participant", "Participant link"
+
+    class Op(models.TextChoices):
+        UPSERT = "upsert", "Created or updated"
+        DELETE = "delete", "Deleted"
+
+    id = models.BigAutoField(primary_key=True)
+    meeting_id = models.UUIDField()
+    user_id = models.UUIDField(null=True, blank=True)
+    object_type = models.CharField(max_length=20, choices=ObjectType.choices)
+    object_id = models.UUIDField()
+    op = models.CharField(max_length=10, choices=Op.choices)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["meeting_id", "id"], name="changelog_meeting_idx"),
+            models.Index(fields=["user_id", "id"], name="changelog_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.op} {self.object_type} {self.object_id}"
+
+
+class ArchivedMeeting(models.Model):
+    """
+    Retention পার হওয়া meeting-এর cold copy (meetings.archive সরায়)। Hot table-এর
+    একই id আর column; created_at/updated_at আসল মানই রাখে। শুধু পড়া হয় (history)।
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    location = models.CharField(max_length=255, blank=True)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    timezone = models.CharField(max_length=64, default="UTC")
+    status = models.CharField(max_length=20, choices=Meeting.Status.choices)
+    sequence = models.PositiveIntegerField(default=0)
+    version = models.PositiveIntegerField(default=1)
+    invited_count = models.IntegerField(default=0)
+    accepted_count = models.IntegerField(default=0)
+    declined_count = models.IntegerField(default=0)
+    tentative_count = models.IntegerField(default=0)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="archived_meetings",
+        on_delete=models.CASCADE,
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-start_time"]
+        indexes = [
+            models.Index(fields=["created_by", "start_time"], name="archive_creator_start_idx"),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedMeetingParticipant(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    meeting = models.ForeignKey(
+        ArchivedMeeting,
+        related_name="meeting_participants",
+        on_delete=models.CASCADE,
+    )
+    participant = models.ForeignKey(
+        Participant,
+        related_name="archived_meeting_participants",
+        on_delete=models.CASCADE,
+    )
+    role = models.CharField(max_length=20, choices=MeetingParticipant.Role.choices)
+    response_status = models.CharField(
+        max_length=20, choices=MeetingParticipant.ResponseStatus.choices
+    )
+    is_required = models.BooleanField(default=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ("meeting", "participant")
+        ordering = ["meeting", "participant__email"]
+
+    def __str__(self):
+        return f"{self.participant} @ {self.meeting}"
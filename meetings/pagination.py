@@ -0,0 +1,27 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class ParticipantCursorPagination(CursorPagination):
+    """
+    Participant email-এর উপর keyset pagination — OFFSET নেই, তাই হাজার
+    attendee-র meeting-এ শেষের page-ও প্রথমটার মতোই সস্তা। Meeting-এর ভেতরে
+    email unique, তাই cursor কখনো duplicate/skip করে না।
+    """
+
+    ordering = "email"
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def get_page_size(self, request):
+        self.page_size = getattr(settings, "MEETING_PARTICIPANTS_PAGE_SIZE", 100)
+        return super().get_page_size(request)
+
+    def get_paginated_response_schema(self, schema):
+        response = super().get_paginated_response_schema(schema)
+        response["properties"]["counts"] = {
+            "type": "object",
+            "additionalProperties": {"type": "integer"},
+            "example": {"invited": 3, "accepted": 10, "declined": 1, "tentative": 0, "total": 14},
+        }
+        return response
@@ -1,12 +1,19 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from .models import Meeting, Participant, MeetingParticipant
+from calendar_integration.timezones import validate_timezone
+from notifications.models import Delivery
+from . import archive, counters
+from .exceptions import MeetingVersionConflict
+from .models import ArchivedMeeting, Meeting, Participant, MeetingParticipant
 from .services import MeetingService
 
 
 class ParticipantSerializer(serializers.ModelSerializer):
     class Meta:
         model = Participant
-        fields = ("id", "email", "name")
+        fields = ("id", "email", "name", "timezone")
 
 
 class MeetingParticipantSerializer(serializers.ModelSerializer):
@@ -24,11 +31,96 @@ class MeetingParticipantSerializer(serializers.ModelSerializer):
         )
 
 
-class MeetingListSerializer(serializers.ModelSerializer):
+class RSVPCountsSerializer(serializers.Serializer):
+    """Meeting-এর counter column থেকে — participant row গোনা হয় না।"""
+
+    invited = serializers.IntegerField(source="invited_count")
+    accepted = serializers.IntegerField(source="accepted_count")
+    declined = serializers.IntegerField(source="declined_count")
+    tentative = serializers.IntegerField(source="tentative_count")
+
+
+@extend_schema_field(MeetingParticipantSerializer(many=True))
+class InlineParticipantsField(serializers.Field):
+    """
+    Meeting-এর প্রথম MEETING_INLINE_PARTICIPANTS জন (email ক্রমে)। Queryset-এ
+    capped prefetch (inline_participants) থাকলে সেটাই, নইলে prefetch cache থেকে।
+    পুরো তালিকা participants/ sub-resource-এ।
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, meeting):
+        participants = getattr(meeting, "inline_participants", None)
+        if participants is None:
+            limit = getattr(settings, "MEETING_INLINE_PARTICIPANTS", 100)
+            participants = meeting.meeting_participants.all()[:limit]
+        return MeetingParticipantSerializer(participants, many=True).data
+
+
+class SparseFieldsMixin:
+    """
+    Context-এর "fields" (set বা None) আর "expand" (set) দিয়ে output ছাঁটে।
+    optional_fields-এর field শুধু চাইলে আসে; বাকিগুলো fields না দিলে সব আসে।
+    """
+
+    optional_fields: tuple = ()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get("fields")
+        expand = self.context.get("expand") or set()
+        for name in list(fields):
+            if name in expand:
+                continue
+            if requested is not None:
+                keep = name in requested
+            else:
+                keep = name not in self.optional_fields
+            if not keep:
+                del fields[name]
+        return fields
+
+    @classmethod
+    def output_fields(cls, fields=None, expand=()) -> set[str]:
+        """যে field-গুলো serialize হবে — queryset ছাঁটার জন্য।"""
+        if fields is None:
+            fields = set(cls.Meta.fields) - set(cls.optional_fields)
+        return set(fields) | set(expand)
+
+
+class SparseFieldsQuerySerializer(serializers.Serializer):
+    """?fields=id,title,start_time&expand=participants (comma-separated)।"""
+
+    fields = serializers.CharField(required=False, allow_blank=True)
+    expand = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        allowed = set(self.context["serializer_class"].Meta.fields)
+        parsed = {"fields": None, "expand": set()}
+        for key in ("fields", "expand"):
+            if key not in attrs:
+                continue
+            names = {name.strip() for name in attrs[key].split(",") if name.strip()}
+            unknown = names - allowed
+            if unknown:
+                raise serializers.ValidationError(
+                    {key: f"Unknown field(s): {', '.join(sorted(unknown))}."}
+                )
+            parsed[key] = names
+        return parsed
+
+
+class MeetingListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     participant_count = serializers.IntegerField(
         source="participants_count", read_only=True
     )
+    rsvp_counts = RSVPCountsSerializer(source="*", read_only=True)
     created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
+    participants = InlineParticipantsField()
+    optional_fields = ("participants",)
 
     class Meta:
         model = Meeting
@@ -42,14 +134,18 @@ class MeetingListSerializer(serializers.ModelSerializer):
             "timezone",
             "status",
             "participant_count",
+            "rsvp_counts",
             "created_by_email",
+            "participants",
         )
 
 
-class MeetingDetailSerializer(serializers.ModelSerializer):
-    participants = MeetingParticipantSerializer(
-        source="meeting_participants", many=True, read_only=True
+class MeetingDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    participants = InlineParticipantsField()
+    participant_count = serializers.IntegerField(
+        source="participants_count", read_only=True
     )
+    rsvp_counts = RSVPCountsSerializer(source="*", read_only=True)
     created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
 
     class Meta:
@@ -64,7 +160,10 @@ class MeetingDetailSerializer(serializers.ModelSerializer):
             "timezone",
             "status",
             "created_by_email",
+            "participant_count",
+            "rsvp_counts",
             "participants",
+            "version",
             "created_at",
             "updated_at",
         )
@@ -77,6 +176,7 @@ class MeetingCreateUpdateSerializer(serializers.ModelSerializer):
         required=False,
     )
     conflicts = serializers.SerializerMethodField(read_only=True)
+    version = serializers.IntegerField(required=False, min_value=1)
 
     class Meta:
         model = Meeting
@@ -88,10 +188,19 @@ class MeetingCreateUpdateSerializer(serializers.ModelSerializer):
             "start_time",
             "end_time",
             "timezone",
+            "version",
             "participants",
             "conflicts",
         )
 
+    def validate_participants(self, value):
+        for item in value:
+            try:
+                validate_timezone(item.get("timezone") or "")
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError(exc.messages)
+        return value
+
     def validate(self, attrs):
         start = attrs.get("start_time")
         end = attrs.get("end_time")
@@ -110,93 +219,158 @@ class MeetingCreateUpdateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         participants_data = validated_data.pop("participants", [])
+        validated_data.pop("version", None)
         request = self.context.get("request")
         user = getattr(request, "user", None)
 
-        allowed_participants, conflict_info = self._partition_participants_by_conflict(
-            participants_data=participants_data,
-            start_time=validated_data["start_time"],
-            end_time=validated_data["end_time"],
-            exclude_meeting_id=None,
-        )
-
-        meeting = Meeting.objects.create(
+        meeting = MeetingService.create_meeting(
             created_by=user,
             **validated_data,
         )
 
-        MeetingService.sync_participants(meeting, allowed_participants)
-        self.conflict_info = conflict_info
+        self.new_participant_emails, self.conflict_info = MeetingService.book_participants(
+            meeting, participants_data
+        )
         return meeting
 
     def update(self, instance, validated_data):
         participants_data = validated_data.pop("participants", None)
+        expected_version = validated_data.pop("version", None)
+        from_if_match = expected_version is None and "expected_version" in self.context
+        if from_if_match:
+            expected_version = self.context["expected_version"]
+
+        try:
+            changed = MeetingService.update_meeting(
+                instance, changes=validated_data, expected_version=expected_version
+            )
+        except MeetingVersionConflict as exc:
+            exc.precondition = from_if_match
+            raise
 
         if participants_data is not None:
-            allowed_participants, conflict_info = self._partition_participants_by_conflict(
-                participants_data=participants_data,
-                start_time=validated_data.get("start_time", instance.start_time),
-                end_time=validated_data.get("end_time", instance.end_time),
-                exclude_meeting_id=instance.id,
+            # Column বদলালে version আগেই বেড়েছে; এক request-এ একবারই বাড়ে।
+            self.new_participant_emails, self.conflict_info = (
+                MeetingService.book_participants(
+                    instance, participants_data, bump_version=not changed
+                )
             )
-            MeetingService.sync_participants(instance, allowed_participants)
-            self.conflict_info = conflict_info
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-
-        instance.save()
         return instance
 
-    def _partition_participants_by_conflict(
-        self,
-        participants_data,
-        start_time,
-        end_time,
-        exclude_meeting_id=None,
-    ):
-        normalized = []
-        for item in participants_data:
-            email_raw = (item.get("email") or "").strip().lower()
-            if not email_raw:
-                continue
-            normalized.append((email_raw, item))
+    def get_conflicts(self, obj):
+        return getattr(self, "conflict_info", [])
+
 
-        emails = [email for email, _ in normalized]
-        if not emails:
-            return [item for _, item in normalized], []
+class ArchivedMeetingDetailSerializer(serializers.ModelSerializer):
+    """Archive থেকে read-through retrieve; hot detail-এর মতোই, সাথে archived_at।"""
+
+    participants = InlineParticipantsField()
+    participant_count = serializers.SerializerMethodField()
+    rsvp_counts = RSVPCountsSerializer(source="*", read_only=True)
+    created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
 
-        conflicts_qs = MeetingService.conflicts_for(
-            start_time=start_time,
-            end_time=end_time,
-            participant_emails=emails,
-            exclude_meeting_id=exclude_meeting_id,
+    class Meta:
+        model = ArchivedMeeting
+        fields = (
+            "id",
+            "title",
+            "description",
+            "location",
+            "start_time",
+            "end_time",
+            "timezone",
+            "status",
+            "created_by_email",
+            "participant_count",
+            "rsvp_counts",
+            "participants",
+            "version",
+            "created_at",
+            "updated_at",
+            "archived_at",
         )
 
-        conflicted_emails = set()
-        conflict_info = []
-
-        for mp in conflicts_qs:
-            m = mp.meeting
-            email = mp.participant.email.lower()
-            conflicted_emails.add(email)
-            conflict_info.append(
-                {
-                    "participant_email": mp.participant.email,
-                    "meeting_id": str(m.id),
-                    "meeting_title": m.title,
-                    "start_time": m.start_time,
-                    "end_time": m.end_time,
-                }
-            )
+    def get_participant_count(self, obj) -> int:
+        return sum(getattr(obj, column) for column in counters.FIELDS.values())
 
-        allowed_participants = [
-            item for email, item in normalized if email not in conflicted_emails
-        ]
-        return allowed_participants, conflict_info
 
-    def get_conflicts(self, obj):
-        return getattr(self, "conflict_info", [])
+class MeetingHistoryItemSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    title = serializers.CharField()
+    location = serializers.CharField()
+    start_time = serializers.DateTimeField()
+    end_time = serializers.DateTimeField()
+    timezone = serializers.CharField()
+    status = serializers.ChoiceField(choices=Meeting.Status.choices)
+    created_by_email = serializers.EmailField(source="created_by.email")
+    rsvp_counts = RSVPCountsSerializer(source="*")
+    archived = serializers.SerializerMethodField()
+
+    def get_archived(self, obj) -> bool:
+        return isinstance(obj, ArchivedMeeting)
+
+
+class MeetingHistorySerializer(serializers.Serializer):
+    results = MeetingHistoryItemSerializer(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
+
+
+class HistoryQuerySerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=200, default=50)
+
+    def validate_cursor(self, value):
+        try:
+            archive.decode_cursor(value)
+        except ValueError:
+            raise serializers.ValidationError("Invalid cursor.")
+        return value
+
+
+class FailedDeliverySerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    kind = serializers.ChoiceField(choices=Delivery.Kind.choices)
+    dispatch_key = serializers.CharField()
+    attempts = serializers.IntegerField()
+    last_error = serializers.CharField()
+    next_attempt_at = serializers.DateTimeField(allow_null=True)
+
+
+class DeliveryStatusSerializer(serializers.Serializer):
+    # kind -> status -> সংখ্যা
+    counts = serializers.DictField(child=serializers.DictField(child=serializers.IntegerField()))
+    failed = FailedDeliverySerializer(many=True)
+
+
+class ParticipantFilterSerializer(serializers.Serializer):
+    role = serializers.ChoiceField(choices=MeetingParticipant.Role.choices, required=False)
+    response_status = serializers.ChoiceField(
+        choices=MeetingParticipant.ResponseStatus.choices, required=False
+    )
+    is_required = serializers.BooleanField(required=False, allow_null=True)
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(required=False, min_value=0)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000, default=500)
+
+
+class ChangeFeedParticipantSerializer(MeetingParticipantSerializer):
+    meeting = serializers.UUIDField(source="meeting_id", read_only=True)
+
+    class Meta(MeetingParticipantSerializer.Meta):
+        fields = MeetingParticipantSerializer.Meta.fields + ("meeting",)
+
+
+class ChangeFeedSerializer(serializers.Serializer):
+    reset = serializers.BooleanField()
+    next_token = serializers.IntegerField()
+    has_more = serializers.BooleanField()
+    meetings = MeetingListSerializer(many=True)
+    deleted_meetings = serializers.ListField(child=serializers.UUIDField())
+    participants = ChangeFeedParticipantSerializer(many=True)
+    removed_participants = serializers.ListField(child=serializers.UUIDField())
 
 
 class ConflictCheckSerializer(serializers.Serializer):
@@ -234,5 +408,18 @@ class RSVPSerializer(serializers.Serializer):
     )
 
 
+class ParticipantSuggestionSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    name = serializers.CharField(allow_blank=True)
+    participant_id = serializers.UUIDField(allow_null=True)
+    user_id = serializers.UUIDField(allow_null=True)
+    meeting_count = serializers.IntegerField()
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=1, max_length=255)
+    limit = serializers.IntegerField(required=False, default=10, min_value=1, max_value=50)
+
+
 class MeetingCancelSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True, max_length=500)
\ No newline at end of file
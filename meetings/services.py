@@ -1,53 +1,137 @@
-from typing import Iterable, Sequence
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from collections import Counter
+from typing import Collection, Iterable, Sequence
+from django.db import transaction
+from django.conf import settings
+from django.db.models import F, Prefetch, QuerySet
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from . import agenda, changes as change_log, counters, live
+from .exceptions import MeetingVersionConflict
 from .models import Meeting, MeetingParticipant, Participant
+from calendar_integration.models import ExternalBusyInterval
 from calendar_integration.services import generate_meeting_ics
-from notifications.tasks import send_invitations_task, notify_cancelled_task
+from notifications.models import OutboxEvent
+from notifications import reminders
+from notifications.outbox import enqueue_event
 
 
 class MeetingService:
+    NOTIFY_ON_CHANGE_FIELDS = (
+        "title",
+        "description",
+        "location",
+        "start_time",
+        "end_time",
+        "timezone",
+    )
+
+    # Serializer-এর যে field-গুলো সরাসরি Meeting column না -> যে column লাগে।
+    RELATED_OUTPUT_FIELDS = {
+        "created_by_email": ("created_by__email",),
+        "participant_count": tuple(counters.FIELDS.values()),
+        "rsvp_counts": tuple(counters.FIELDS.values()),
+        "participants": (),
+    }
+
+    @classmethod
+    def with_output_fields(
+        cls, queryset: QuerySet[Meeting], fields: Collection[str] | None = None
+    ) -> QuerySet[Meeting]:
+        """
+        fields = যে serializer field-গুলো response-এ যাবে; None হলে সব join,
+        prefetch আর annotation। দিলে শুধু দরকারি column (.only()) load হয়।
+        """
+        if fields is None:
+            return (
+                queryset.select_related("created_by")
+                .prefetch_related("meeting_participants__participant")
+                .annotate(participants_count=counters.total_expression())
+            )
+
+        # ETag-এর জন্য version সবসময় লাগে।
+        columns = {"id", "version"}
+        for name in fields:
+            columns.update(cls.RELATED_OUTPUT_FIELDS.get(name, (name,)))
+        if "created_by_email" in fields:
+            queryset = queryset.select_related("created_by")
+        queryset = queryset.only(*columns)
+        if "participant_count" in fields:
+            queryset = queryset.annotate(participants_count=counters.total_expression())
+        if "participants" in fields:
+            queryset = queryset.prefetch_related(cls._inline_participants_prefetch())
+        return queryset
 
     @staticmethod
-    def _participant_count_subquery():
-        return Subquery(
-            MeetingParticipant.objects.filter(meeting=OuterRef("pk"))
-            .order_by()
-            .values("meeting")
-            .annotate(c=Count("id"))
-            .values("c")
+    def _inline_participants_prefetch() -> Prefetch:
+        """
+        Response-এ inline participant প্রতি meeting-এ MEETING_INLINE_PARTICIPANTS
+        পর্যন্ত (email ক্রমে); বাকিটা participants/ sub-resource থেকে page করে।
+        """
+        limit = getattr(settings, "MEETING_INLINE_PARTICIPANTS", 100)
+        return Prefetch(
+            "meeting_participants",
+            queryset=MeetingParticipant.objects.select_related("participant").order_by(
+                "participant__email"
+            )[:limit],
+            # Sliced prefetch-এ to_attr লাগে।
+            to_attr="inline_participants",
         )
 
-    @classmethod
-    def list_for_user(cls, user) -> QuerySet[Meeting]:
-        return (
-            Meeting.objects.filter(created_by=user)
-            .select_related("created_by")
-            .prefetch_related("meeting_participants__participant")
-            .annotate(participants_count=cls._participant_count_subquery())
+    @staticmethod
+    def list_participants(
+        meeting, *, role=None, response_status=None, is_required=None
+    ) -> QuerySet[MeetingParticipant]:
+        queryset = (
+            MeetingParticipant.objects.filter(meeting=meeting)
+            .select_related("participant")
+            .annotate(email=F("participant__email"))
         )
+        if role:
+            queryset = queryset.filter(role=role)
+        if response_status:
+            queryset = queryset.filter(response_status=response_status)
+        if is_required is not None:
+            queryset = queryset.filter(is_required=is_required)
+        return queryset
+
+    @staticmethod
+    def rsvp_counts(meeting) -> dict[str, int]:
+        """প্রতিটা response_status-এর সংখ্যা আর total — Meeting-এর counter column থেকে।"""
+        return counters.counts_for(meeting)
 
     @classmethod
-    def list_visible_for_user(cls, user) -> QuerySet[Meeting]:
-        return (
+    def list_for_user(cls, user, fields: Collection[str] | None = None) -> QuerySet[Meeting]:
+        return cls.with_output_fields(Meeting.objects.filter(created_by=user), fields)
+
+    @classmethod
+    def list_visible_for_user(
+        cls, user, fields: Collection[str] | None = None
+    ) -> QuerySet[Meeting]:
+        # AgendaEntry-তে (user, meeting) unique, তাই distinct লাগে না।
+        return cls.with_output_fields(Meeting.objects.filter(agenda_entries__user=user), fields)
+
+    @classmethod
+    def list_invited_for_user(
+        cls, user, fields: Collection[str] | None = None
+    ) -> QuerySet[Meeting]:
+        return cls.with_output_fields(
             Meeting.objects.filter(
-                Q(created_by=user) | Q(meeting_participants__participant__user=user)
-            )
-            .select_related("created_by")
-            .prefetch_related("meeting_participants__participant")
-            .annotate(participants_count=cls._participant_count_subquery())
-            .distinct()
+                agenda_entries__user=user, agenda_entries__is_creator=False
+            ).order_by("-agenda_entries__start_time"),
+            fields,
         )
 
     @classmethod
-    def list_invited_for_user(cls, user) -> QuerySet[Meeting]:
-        return (
-            Meeting.objects.filter(meeting_participants__participant__user=user)
-            .exclude(created_by=user)
-            .select_related("created_by")
-            .prefetch_related("meeting_participants__participant")
-            .annotate(participants_count=cls._participant_count_subquery())
-            .distinct()
+    def list_upcoming_for_user(
+        cls, user, fields: Collection[str] | None = None
+    ) -> QuerySet[Meeting]:
+        return cls.with_output_fields(
+            Meeting.objects.filter(
+                agenda_entries__user=user,
+                agenda_entries__start_time__gte=timezone.now(),
+                agenda_entries__meeting_status=Meeting.Status.SCHEDULED,
+            ).order_by("agenda_entries__start_time"),
+            fields,
         )
 
     @classmethod
@@ -79,6 +163,67 @@ class MeetingService:
             qs = qs.exclude(meeting_id=exclude_meeting_id)
         return qs
 
+    @classmethod
+    def external_conflicts_for(
+        cls,
+        *,
+        start_time,
+        end_time,
+        participant_emails: Sequence[str],
+    ) -> QuerySet[ExternalBusyInterval]:
+        if not participant_emails:
+            return ExternalBusyInterval.objects.none()
+
+        return ExternalBusyInterval.objects.select_related("participant").filter(
+            participant__email__in=[email.lower() for email in participant_emails],
+            start_time__lt=end_time,
+            end_time__gt=start_time,
+        )
+
+    @classmethod
+    def describe_conflicts(
+        cls,
+        *,
+        start_time,
+        end_time,
+        participant_emails: Sequence[str],
+        exclude_meeting_id=None,
+    ) -> list[dict]:
+        results = []
+        for mp in cls.conflicts_for(
+            start_time=start_time,
+            end_time=end_time,
+            participant_emails=participant_emails,
+            exclude_meeting_id=exclude_meeting_id,
+        ):
+            m = mp.meeting
+            results.append(
+                {
+                    "participant_email": mp.participant.email,
+                    "meeting_id": str(m.id),
+                    "meeting_title": m.title,
+                    "start_time": m.start_time,
+                    "end_time": m.end_time,
+                    "source": "meeting",
+                }
+            )
+        for busy in cls.external_conflicts_for(
+            start_time=start_time,
+            end_time=end_time,
+            participant_emails=participant_emails,
+        ):
+            results.append(
+                {
+                    "participant_email": busy.participant.email,
+                    "meeting_id": None,
+                    "meeting_title": "Busy (external calendar)",
+                    "start_time": busy.start_time,
+                    "end_time": busy.end_time,
+                    "source": "external",
+                }
+            )
+        return results
+
     @classmethod
     def invitation_targets(
         cls,
@@ -109,14 +254,22 @@ class MeetingService:
         send_to_all: bool,
         participant_ids: Iterable,
     ):
-        targets = cls.invitation_targets(
-            meeting=meeting,
-            send_to_all=send_to_all,
-            participant_ids=participant_ids,
-        )
-        target_ids = list(targets.values_list("id", flat=True))
-        send_invitations_task(meeting.id, target_ids)
-        return len(target_ids)
+        if send_to_all or not participant_ids:
+            queued = meeting.meeting_participants.count()
+            payload = {"send_to_all": True}
+        else:
+            target_ids = list(
+                cls.invitation_targets(
+                    meeting=meeting,
+                    send_to_all=False,
+                    participant_ids=participant_ids,
+                ).values_list("id", flat=True)
+            )
+            queued = len(target_ids)
+            payload = {"participant_ids": [str(pk) for pk in target_ids]}
+        if queued:
+            enqueue_event(meeting, OutboxEvent.Kind.INVITATION, payload)
+        return queued
 
     @classmethod
     def send_invitations_to_new_participants(cls, meeting: Meeting, new_emails: set[str]):
@@ -128,31 +281,166 @@ class MeetingService:
             ).values_list("id", flat=True)
         )
         if target_ids:
-            send_invitations_task(meeting.id, target_ids)
+            enqueue_event(
+                meeting,
+                OutboxEvent.Kind.INVITATION,
+                {"participant_ids": [str(pk) for pk in target_ids]},
+            )
         return len(target_ids)
 
     @classmethod
-    def get_or_create_participant(cls, *, email: str, name: str = "") -> Participant:
+    def create_meeting(cls, *, created_by, **fields) -> Meeting:
+        meeting = Meeting.objects.create(created_by=created_by, **fields)
+        change_log.meeting_changed(meeting)
+        reminders.schedule(meeting)
+        return meeting
+
+    @classmethod
+    @transaction.atomic
+    def delete_meeting(cls, meeting: Meeting):
+        change_log.meeting_deleted(meeting)
+        meeting.delete()
+
+    @classmethod
+    def update_meeting(
+        cls, meeting: Meeting, *, changes: dict, expected_version: int | None = None
+    ) -> list[str]:
+        """
+        Version মিলিয়ে (compare-and-swap) শুধু বদলানো column লেখে; অন্য কেউ
+        আগে save করলে MeetingVersionConflict ওঠে।
+        """
+        changed = {
+            field: value
+            for field, value in changes.items()
+            if getattr(meeting, field) != value
+        }
+        qs = Meeting.objects.filter(pk=meeting.pk)
+        if expected_version is not None:
+            qs = qs.filter(version=expected_version)
+
+        # কিছু না বদলালে version বাড়ে না, নইলে no-op PATCH সবার ETag বাতিল করে দেয়।
+        if changed:
+            updated = qs.update(
+                **changed, version=F("version") + 1, updated_at=timezone.now()
+            )
+        else:
+            updated = qs.exists()
+        if not updated:
+            current = (
+                Meeting.objects.filter(pk=meeting.pk).values_list("version", flat=True).first()
+            )
+            raise MeetingVersionConflict(current_version=current)
+
+        if not changed:
+            return []
+
+        for field, value in changed.items():
+            setattr(meeting, field, value)
+        meeting.refresh_from_db(fields=["version", "updated_at"])
+        if "start_time" in changed or "status" in changed:
+            agenda.refresh_meeting(meeting)
+            reminders.schedule(meeting)
+        if changed:
+            change_log.meeting_changed(meeting)
+            live.publish_meeting_event(
+                meeting.pk, "updated", {"fields": sorted(changed), "version": meeting.version}
+            )
+        return list(changed)
+
+    @classmethod
+    def snapshot(cls, meeting: Meeting) -> dict:
+        return {field: getattr(meeting, field) for field in cls.NOTIFY_ON_CHANGE_FIELDS}
+
+    @classmethod
+    def notify_meeting_updated(cls, meeting: Meeting, *, previous: dict) -> bool:
+        if meeting.status == Meeting.Status.CANCELLED:
+            return False
+        if cls.snapshot(meeting) == previous:
+            return False
+
+        Meeting.objects.filter(pk=meeting.pk).update(sequence=F("sequence") + 1)
+        meeting.refresh_from_db(fields=["sequence"])
+        enqueue_event(meeting, OutboxEvent.Kind.UPDATE)
+        return True
+
+    @classmethod
+    def get_or_create_participant(
+        cls, *, email: str, name: str = "", timezone: str = ""
+    ) -> Participant:
         email = email.strip().lower()
         participant, created = Participant.objects.get_or_create(
             email=email,
-            defaults={"name": name},
+            defaults={"name": name, "timezone": timezone},
         )
-        if not created and name and participant.name != name:
-            participant.name = name
-            participant.save(update_fields=["name"])
+        if not created:
+            changed = []
+            if name and participant.name != name:
+                participant.name = name
+                changed.append("name")
+            if timezone and participant.timezone != timezone:
+                participant.timezone = timezone
+                changed.append("timezone")
+            if changed:
+                participant.save(update_fields=[*changed, "updated_at"])
+                change_log.participant_profile_changed(participant)
 
         if participant.user_id is None:
             matched_user = get_user_model().objects.filter(email=email).first()
             if matched_user:
                 participant.user = matched_user
-                participant.save(update_fields=["user"])
+                participant.save(update_fields=["user", "updated_at"])
+                agenda.sync_user(matched_user.pk)
 
         return participant
 
+    @classmethod
+    def _lock_participants(cls, emails: list[str]):
+        for email in emails:
+            cls.get_or_create_participant(email=email)
+        # Fixed lock order so two bookings sharing participants cannot deadlock.
+        return list(
+            Participant.objects.select_for_update()
+            .filter(email__in=emails)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    @classmethod
+    @transaction.atomic
+    def book_participants(
+        cls, meeting: Meeting, participants_data: list[dict], *, bump_version: bool = False
+    ) -> tuple[set[str], list[dict]]:
+        """
+        Participant row lock করে conflict check আর link insert একই transaction-এ
+        করে, যাতে দুটো booking একসাথে একই মানুষকে double-book করতে না পারে।
+        """
+        normalized: dict[str, dict] = {}
+        for item in participants_data:
+            email = (item.get("email") or "").strip().lower()
+            if email and email not in normalized:
+                normalized[email] = item
+
+        cls._lock_participants(sorted(normalized))
+
+        conflict_info = cls.describe_conflicts(
+            start_time=meeting.start_time,
+            end_time=meeting.end_time,
+            participant_emails=list(normalized),
+            exclude_meeting_id=meeting.id,
+        )
+        conflicted_emails = {c["participant_email"].lower() for c in conflict_info}
+
+        allowed_participants = [
+            item for email, item in normalized.items() if email not in conflicted_emails
+        ]
+        new_emails = cls.sync_participants(
+            meeting, allowed_participants, bump_version=bump_version
+        )
+        return new_emails, conflict_info
+
     @classmethod
     def sync_participants(
-        cls, meeting: Meeting, participants_data: list[dict]
+        cls, meeting: Meeting, participants_data: list[dict], *, bump_version: bool = False
     ) -> set[str]:
 
         normalized: dict[str, dict] = {}
@@ -169,10 +457,17 @@ class MeetingService:
         }
 
         newly_added_emails: set[str] = set()
+        # Agenda row শুধু এই user-দের জন্য মেলানো হয় — creator আর যাদের link বদলেছে।
+        touched_user_ids = {meeting.created_by_id}
+        touched_user_ids.update(mp.participant.user_id for mp in existing_links.values())
+        changed_link_ids = []
+        rsvp_deltas = Counter()
 
         for email, item in normalized.items():
             participant = cls.get_or_create_participant(
-                email=email, name=item.get("name") or ""
+                email=email,
+                name=item.get("name") or "",
+                timezone=item.get("timezone") or "",
             )
             role = item.get("role") or MeetingParticipant.Role.REQUIRED
             response_status = (
@@ -182,12 +477,20 @@ class MeetingService:
 
             if email in existing_links:
                 mp = existing_links.pop(email)
-                mp.role = role
-                mp.response_status = response_status
-                mp.is_required = is_required
-                mp.save(update_fields=["role", "response_status", "is_required"])
+                if (mp.role, mp.response_status, mp.is_required) != (
+                    role,
+                    response_status,
+                    is_required,
+                ):
+                    rsvp_deltas[mp.response_status] -= 1
+                    rsvp_deltas[response_status] += 1
+                    mp.role = role
+                    mp.response_status = response_status
+                    mp.is_required = is_required
+                    mp.save(update_fields=["role", "response_status", "is_required"])
+                    changed_link_ids.append(mp.id)
             else:
-                MeetingParticipant.objects.create(
+                mp = MeetingParticipant.objects.create(
                     meeting=meeting,
                     participant=participant,
                     role=role,
@@ -195,17 +498,43 @@ class MeetingService:
                     is_required=is_required,
                 )
                 newly_added_emails.add(email)
+                changed_link_ids.append(mp.id)
+                rsvp_deltas[response_status] += 1
+            touched_user_ids.add(participant.user_id)
 
         stale_ids = [mp.id for mp in existing_links.values()]
         if stale_ids:
             MeetingParticipant.objects.filter(id__in=stale_ids).delete()
+            rsvp_deltas.subtract(mp.response_status for mp in existing_links.values())
+        counters.apply_deltas(meeting.pk, rsvp_deltas)
 
+        change_log.links_changed(meeting.pk, changed_link_ids)
+        change_log.links_removed(meeting.pk, stale_ids)
+        agenda.sync_meeting(meeting, touched_user_ids)
+        if bump_version and (changed_link_ids or stale_ids):
+            # Participant list detail-এর অংশ, তাই link বদলালে ETag-ও বদলায়।
+            Meeting.objects.filter(pk=meeting.pk).update(
+                version=F("version") + 1, updated_at=timezone.now()
+            )
+            meeting.refresh_from_db(fields=["version", "updated_at"])
+        if changed_link_ids or stale_ids:
+            live.publish_meeting_event(
+                meeting.pk,
+                "participants_changed",
+                {
+                    "added": len(newly_added_emails),
+                    "updated": len(changed_link_ids) - len(newly_added_emails),
+                    "removed": len(stale_ids),
+                },
+            )
         return newly_added_emails
 
     @classmethod
+    @transaction.atomic
     def record_response(cls, meeting: Meeting, *, user, response_status: str) -> MeetingParticipant:
         mp = (
-            MeetingParticipant.objects.select_related("participant")
+            MeetingParticipant.objects.select_for_update(of=("self",))
+            .select_related("participant")
             .filter(meeting=meeting, participant__user=user)
             .first()
         )
@@ -213,15 +542,36 @@ class MeetingService:
             raise MeetingParticipant.DoesNotExist(
                 "You are not a participant of this meeting."
             )
+        # Row lock-এর ভেতরে পুরনো status পড়া, তাই counter-এ একই বদল দুবার গোনা হয় না।
+        if mp.response_status != response_status:
+            counters.apply_deltas(meeting.pk, {mp.response_status: -1, response_status: 1})
         mp.response_status = response_status
         mp.save(update_fields=["response_status"])
+        agenda.sync_meeting(meeting, [user.pk])
+        change_log.links_changed(meeting.pk, [mp.id])
+        live.publish_meeting_event(
+            meeting.pk,
+            "rsvp",
+            {
+                "participant_id": str(mp.id),
+                "email": mp.participant.email,
+                "response_status": response_status,
+            },
+        )
         return mp
 
     @classmethod
+    @transaction.atomic
     def cancel(cls, meeting: Meeting, *, reason: str = "") -> Meeting:
         if meeting.status == Meeting.Status.CANCELLED:
             return meeting
         meeting.status = Meeting.Status.CANCELLED
-        meeting.save(update_fields=["status"])
-        notify_cancelled_task(meeting.id, reason)
-        return meeting
\ No newline at end of file
+        meeting.version = F("version") + 1
+        meeting.save(update_fields=["status", "version", "updated_at"])
+        meeting.refresh_from_db(fields=["version"])
+        agenda.refresh_meeting(meeting)
+        reminders.schedule(meeting)
+        change_log.meeting_changed(meeting)
+        live.publish_meeting_event(meeting.pk, "cancelled", {"reason": reason})
+        enqueue_event(meeting, OutboxEvent.Kind.CANCELLATION, {"reason": reason})
+        return meeting
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .directory import directory
+from .models import Participant
+
+
+@receiver(post_save, sender=Participant)
+def participant_saved(sender, instance, **kwargs):
+    directory.put_participant(instance)
+
+
+@receiver(post_delete, sender=Participant)
+def participant_deleted(sender, instance, **kwargs):
+    directory.remove_participant(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_saved(sender, instance, **kwargs):
+    directory.put_user(instance)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_deleted(sender, instance, **kwargs):
+    directory.remove_user(instance.pk)
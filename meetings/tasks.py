@@ -0,0 +1,26 @@
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task
+
+
+@db_periodic_task(crontab(hour="3", minute="30"))
+def prune_change_log_periodic():
+    """CHANGELOG_RETENTION_DAYS-এর পুরনো change feed entry মোছে।"""
+    from .changes import prune
+
+    return prune()
+
+
+@db_periodic_task(crontab(hour="4", minute="10"))
+def reconcile_rsvp_counters_periodic():
+    """Meeting-এর RSVP counter participant row থেকে মিলিয়ে drift ঠিক করে।"""
+    from .counters import reconcile
+
+    return reconcile()
+
+
+@db_periodic_task(crontab(hour="2", minute="45"))
+def archive_meetings_periodic():
+    """পুরনো আর cancel হওয়া meeting archive table-এ সরায়, batch-এ।"""
+    from .archive import archive
+
+    return archive()
@@ -1,3 +1,634 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from notifications.models import OutboxEvent
+from . import archive
+from .directory import ParticipantDirectory, _shared_with
+from .models import AgendaEntry, ArchivedMeeting, Meeting, MeetingParticipant, Participant
+from .services import MeetingService
 
-# Create your tests here.
+
+class ConcurrentBookingTests(TransactionTestCase):
+    """
+    একই participant-দের একসাথে অনেকগুলো overlapping booking; কেউ যেন দুটো
+    meeting-এ না পড়ে। Thread-গুলো নিজের connection-এ আলাদা transaction চালায়।
+    """
+
+    workers = 8
+    bookings = 40
+    participants = 5
+
+    def test_overlapping_bookings_never_double_book(self):
+        organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        emails = [f"attendee{i}@example.com" for i in range(self.participants)]
+        start = timezone.now() + timedelta(days=30)
+        end = start + timedelta(hours=1)
+
+        def book(n):
+            try:
+                with transaction.atomic():
+                    meeting = Meeting.objects.create(
+                        title=f"Booking #{n}",
+                        start_time=start + timedelta(minutes=n % 30),
+                        end_time=end + timedelta(minutes=n % 30),
+                        created_by=organizer,
+                    )
+                    new_emails, _ = MeetingService.book_participants(
+                        meeting, [{"email": email} for email in emails]
+                    )
+                return len(new_emails)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            booked = sum(pool.map(book, range(self.bookings)))
+
+        # সবাই overlap করে, তাই প্রত্যেকে ঠিক একটা meeting-এ।
+        self.assertEqual(booked, len(emails))
+        for email in emails:
+            self.assertEqual(
+                MeetingParticipant.objects.filter(participant__email=email).count(), 1, email
+            )
+
+
+class DirectoryRefreshTests(TestCase):
+    """
+    অন্য process-এর signal এই process-এর index-এ পৌঁছায় না; সেটা আলাদা
+    ParticipantDirectory দিয়ে ধরা হয়, যেটা শুধু refresh() থেকেই জানে।
+    """
+
+    def test_refresh_picks_up_user_renamed_elsewhere(self):
+        user = get_user_model().objects.create_user(email="grace@example.com", first_name="Grace")
+        other = ParticipantDirectory()
+        other.rebuild()
+        self.assertEqual([e["email"] for e in other.prefix_matches("grace", limit=5)], ["grace@example.com"])
+
+        user.email = "admiral@example.com"
+        user.last_name = "Hopper"
+        user.save()
+        self.assertEqual([e["email"] for e in other.prefix_matches("hopper", limit=5)], [])
+
+        other.refresh()
+        self.assertEqual([e["email"] for e in other.prefix_matches("hopper", limit=5)], ["admiral@example.com"])
+        self.assertEqual(other.prefix_matches("grace@", limit=5), [])
+
+
+class DirectoryLookupTests(TestCase):
+    def setUp(self):
+        self.directory = ParticipantDirectory()
+        for email, name in [
+            ("alice@example.com", "Alice Liddell"),
+            ("alan@example.com", "Alan Turing"),
+            ("bob@example.com", "Bob"),
+        ]:
+            MeetingService.get_or_create_participant(email=email, name=name)
+        self.directory.rebuild()
+
+    def emails(self, prefix, limit=10):
+        return [e["email"] for e in self.directory.prefix_matches(prefix, limit=limit)]
+
+    def test_prefix_matches_email_and_name_tokens(self):
+        self.assertEqual(self.emails("al"), ["alan@example.com", "alice@example.com"])
+        self.assertEqual(self.emails("TURING"), ["alan@example.com"])
+        self.assertEqual(
+            set(self.emails("example")), {"alan@example.com", "alice@example.com", "bob@example.com"}
+        )
+        self.assertEqual(self.emails("al", limit=1), ["alan@example.com"])
+        self.assertEqual(self.emails("zed"), [])
+
+    def test_changes_after_build_go_to_the_overlay(self):
+        base = list(self.directory._keys)
+        alice = Participant.objects.get(email="alice@example.com")
+        alice.name = "Alice Kingsleigh"
+        self.directory.put_participant(alice)
+        albert = MeetingService.get_or_create_participant(email="albert@example.com", name="Albert")
+        self.directory.put_participant(albert)
+        self.directory.remove_participant(Participant.objects.get(email="bob@example.com").id)
+
+        self.assertEqual(self.directory._keys, base)
+        self.assertEqual(
+            self.emails("al"), ["alan@example.com", "albert@example.com", "alice@example.com"]
+        )
+        self.assertEqual(self.emails("kingsleigh"), ["alice@example.com"])
+        self.assertEqual(self.emails("liddell"), [])
+        self.assertEqual(self.emails("bob"), [])
+
+        # আবার আগের নামে ফিরলে base-এর key আবার গণ্য, একবারই আসে।
+        alice.name = "Alice Liddell"
+        self.directory.put_participant(alice)
+        self.assertEqual(self.emails("liddell"), ["alice@example.com"])
+        self.assertEqual(self.emails("kingsleigh"), [])
+
+        self.directory.rebuild()
+        self.assertEqual(self.directory._overlay, [])
+        self.assertEqual(self.emails("bob"), ["bob@example.com"])
+
+
+class SharedWithTests(TestCase):
+    """Autocomplete শুধু তাদের দেখায় যাদের সাথে requester অন্তত একটা meeting-এ ছিল।"""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.me = users.create_user(email="me@example.com")
+        self.host = users.create_user(email="host@example.com")
+        self.stranger = users.create_user(email="stranger@example.com")
+        start = timezone.now() + timedelta(days=3)
+        meeting = MeetingService.create_meeting(
+            created_by=self.host, title="Sync", start_time=start, end_time=start + timedelta(hours=1)
+        )
+        MeetingService.book_participants(
+            meeting, [{"email": "me@example.com"}, {"email": "colleague@example.com"}]
+        )
+        Participant.objects.filter(email="me@example.com").update(user=self.me)
+        AgendaEntry.objects.get_or_create(
+            user=self.me,
+            meeting=meeting,
+            defaults={"start_time": start, "meeting_status": meeting.status},
+        )
+        MeetingService.get_or_create_participant(email="outsider@example.com")
+
+    def entry(self, *, participant=None, user=None):
+        return {
+            "email": (participant or user).email,
+            "participant_id": str(participant.id) if participant else None,
+            "user_id": str(user.id) if user else None,
+        }
+
+    def test_only_people_from_shared_meetings(self):
+        colleague = Participant.objects.get(email="colleague@example.com")
+        outsider = Participant.objects.get(email="outsider@example.com")
+        entries = [
+            self.entry(participant=colleague),
+            self.entry(participant=outsider),
+            self.entry(user=self.host),
+            self.entry(user=self.stranger),
+        ]
+        self.assertEqual(
+            [e["email"] for e in _shared_with(self.me, entries)],
+            ["colleague@example.com", "host@example.com"],
+        )
+        self.assertEqual(_shared_with(self.stranger, entries), [])
+        self.assertEqual(_shared_with(self.me, []), [])
+
+
+class AgendaTests(TestCase):
+    """Agenda row booking, RSVP আর cancel-এর সাথে মেলে; rebuild_agenda --check পরিষ্কার থাকে।"""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.organizer = users.create_user(email="organizer@example.com")
+        self.invitee = users.create_user(email="invitee@example.com")
+        start = timezone.now() + timedelta(days=2)
+        self.meeting = MeetingService.create_meeting(
+            created_by=self.organizer, title="Sync", start_time=start, end_time=start + timedelta(hours=1)
+        )
+        MeetingService.book_participants(
+            self.meeting, [{"email": "invitee@example.com"}, {"email": "guest@example.com"}]
+        )
+
+    def rows(self):
+        return {
+            (entry.user.email, entry.is_creator, entry.response_status, entry.meeting_status)
+            for entry in AgendaEntry.objects.filter(meeting=self.meeting).select_related("user")
+        }
+
+    def assertConsistent(self):
+        call_command("rebuild_agenda", "--check", stdout=StringIO())
+
+    def test_rows_after_booking(self):
+        self.assertEqual(
+            self.rows(),
+            {
+                ("organizer@example.com", True, "", "scheduled"),
+                ("invitee@example.com", False, "invited", "scheduled"),
+            },
+        )
+        self.assertEqual(
+            list(MeetingService.list_invited_for_user(self.invitee, None)), [self.meeting]
+        )
+        self.assertEqual(list(MeetingService.list_invited_for_user(self.organizer, None)), [])
+        self.assertConsistent()
+
+    def test_response_updates_the_row(self):
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="accepted")
+        self.assertIn(("invitee@example.com", False, "accepted", "scheduled"), self.rows())
+        self.assertConsistent()
+
+    def test_late_registration_links_existing_meetings(self):
+        guest = get_user_model().objects.create_user(email="guest@example.com")
+        MeetingService.get_or_create_participant(email="guest@example.com")
+        self.assertIn(("guest@example.com", False, "invited", "scheduled"), self.rows())
+        self.assertEqual(list(MeetingService.list_upcoming_for_user(guest, None)), [self.meeting])
+        self.assertConsistent()
+
+    def test_cancel_and_removal(self):
+        MeetingService.cancel(self.meeting)
+        self.assertEqual({row[3] for row in self.rows()}, {"cancelled"})
+        self.assertEqual(list(MeetingService.list_upcoming_for_user(self.invitee, None)), [])
+
+        MeetingService.book_participants(self.meeting, [{"email": "guest@example.com"}])
+        self.assertEqual({row[0] for row in self.rows()}, {"organizer@example.com"})
+        self.assertConsistent()
+
+    def test_check_reports_drift(self):
+        AgendaEntry.objects.filter(user=self.invitee).delete()
+        with self.assertRaisesMessage(CommandError, "1 missing"):
+            call_command("rebuild_agenda", "--check", stdout=StringIO())
+        call_command("rebuild_agenda", stdout=StringIO())
+        self.assertConsistent()
+
+
+class MeetingVersionTests(TestCase):
+    """ETag/If-Match আর body version দিয়ে optimistic concurrency।"""
+
+    def setUp(self):
+        self.organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.organizer)
+        start = timezone.now() + timedelta(days=7)
+        self.meeting = MeetingService.create_meeting(
+            created_by=self.organizer,
+            title="Planning",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+        )
+        MeetingService.book_participants(self.meeting, [{"email": "a@example.com"}])
+        self.url = f"/api/meetings/{self.meeting.id}/"
+
+    def patch(self, data, **headers):
+        return self.client.patch(self.url, data, format="json", **headers)
+
+    def version(self):
+        return Meeting.objects.values_list("version", flat=True).get(pk=self.meeting.pk)
+
+    def test_get_returns_the_etag(self):
+        self.assertEqual(self.client.get(self.url)["ETag"], '"1"')
+
+    def test_matching_if_match_updates_and_returns_the_new_etag(self):
+        response = self.patch({"title": "Retro"}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response["ETag"], '"2"')
+
+    def test_weak_etag_is_accepted(self):
+        response = self.patch({"title": "Retro"}, HTTP_IF_MATCH='W/"1"')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.version(), 2)
+
+    def test_star_skips_the_check(self):
+        Meeting.objects.filter(pk=self.meeting.pk).update(version=5)
+        response = self.patch({"title": "Retro"}, HTTP_IF_MATCH="*")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response["ETag"], '"6"')
+
+    def test_malformed_if_match_is_rejected(self):
+        response = self.patch({"title": "Retro"}, HTTP_IF_MATCH="abc")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.version(), 1)
+        # Read-এ If-Match দেখা হয় না।
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MATCH="abc").status_code, 200)
+
+    def test_stale_if_match_is_a_failed_precondition(self):
+        self.patch({"title": "Retro"})
+        response = self.patch({"title": "Review"}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(response.json()["current_version"], 2)
+        self.assertEqual(Meeting.objects.get(pk=self.meeting.pk).title, "Retro")
+
+    def test_stale_body_version_is_a_conflict(self):
+        self.patch({"title": "Retro"})
+        response = self.patch({"title": "Review", "version": 1})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["current_version"], 2)
+        # Body version header-এর চেয়ে অগ্রাধিকার পায়।
+        response = self.patch({"title": "Review", "version": 1}, HTTP_IF_MATCH='"2"')
+        self.assertEqual(response.status_code, 409)
+
+    def test_noop_patch_keeps_the_etag(self):
+        response = self.patch({"title": "Planning"}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response["ETag"], '"1"')
+        self.assertEqual(self.client.get(self.url)["ETag"], '"1"')
+
+    def test_noop_patch_with_a_stale_etag_still_fails(self):
+        self.patch({"title": "Retro"})
+        response = self.patch({"title": "Retro"}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 412)
+
+    def test_participant_change_bumps_the_version_once(self):
+        response = self.patch(
+            {"participants": [{"email": "a@example.com"}, {"email": "b@example.com"}]}
+        )
+        self.assertEqual(response["ETag"], '"2"')
+        response = self.patch(
+            {"title": "Retro", "participants": [{"email": "b@example.com"}]}
+        )
+        self.assertEqual(response["ETag"], '"3"')
+        response = self.patch({"participants": [{"email": "b@example.com"}]})
+        self.assertEqual(response["ETag"], '"3"')
+
+
+class SparseFieldsTests(TestCase):
+    """?fields= আর ?expand= শুধু response না, load হওয়া column-ও ছাঁটে।"""
+
+    def setUp(self):
+        self.organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.organizer)
+        start = timezone.now() + timedelta(days=7)
+        self.meeting = MeetingService.create_meeting(
+            created_by=self.organizer,
+            title="Planning",
+            description="Quarterly planning",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+        )
+        MeetingService.book_participants(
+            self.meeting, [{"email": "a@example.com"}, {"email": "b@example.com"}]
+        )
+
+    def loaded_columns(self, fields):
+        qs = MeetingService.with_output_fields(Meeting.objects.all(), fields)
+        columns, defer = qs.query.deferred_loading
+        self.assertFalse(defer)
+        return set(columns)
+
+    def test_column_sets(self):
+        self.assertEqual(self.loaded_columns({"title"}), {"id", "version", "title"})
+        self.assertEqual(
+            self.loaded_columns({"id", "created_by_email", "participant_count"}),
+            {
+                "id",
+                "version",
+                "created_by__email",
+                "invited_count",
+                "accepted_count",
+                "declined_count",
+                "tentative_count",
+            },
+        )
+        self.assertEqual(self.loaded_columns({"participants"}), {"id", "version"})
+
+    def test_list_fields_select_only_those_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/meetings/?fields=id,title,start_time")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "start_time"})
+        sql = " ".join(q["sql"] for q in ctx.captured_queries if "meetings_meeting" in q["sql"])
+        self.assertNotIn('"description"', sql)
+        self.assertFalse(
+            any('FROM "meetings_meetingparticipant"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_participants_only_when_expanded(self):
+        response = self.client.get("/api/meetings/")
+        self.assertNotIn("participants", response.data["results"][0])
+        self.assertIn("description", response.data["results"][0])
+
+        response = self.client.get("/api/meetings/?expand=participants")
+        row = response.data["results"][0]
+        self.assertEqual(len(row["participants"]), 2)
+        self.assertIn("description", row)
+
+        response = self.client.get("/api/meetings/?fields=id&expand=participants")
+        self.assertEqual(set(response.data["results"][0]), {"id", "participants"})
+
+    def test_retrieve_keeps_the_etag(self):
+        response = self.client.get(f"/api/meetings/{self.meeting.id}/?fields=title")
+        self.assertEqual(dict(response.data), {"title": "Planning"})
+        self.assertEqual(response["ETag"], '"1"')
+        response = self.client.get(f"/api/meetings/{self.meeting.id}/")
+        self.assertEqual(len(response.data["participants"]), 2)
+
+    def test_unknown_names_are_rejected(self):
+        self.assertEqual(self.client.get("/api/meetings/?fields=bogus").status_code, 400)
+        self.assertEqual(self.client.get("/api/meetings/?expand=secrets").status_code, 400)
+        response = self.client.get(
+            "/api/meetings/upcoming/?fields=id,created_by_email,participant_count"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            dict(response.data["results"][0]),
+            {
+                "id": str(self.meeting.id),
+                "created_by_email": "organizer@example.com",
+                "participant_count": 2,
+            },
+        )
+
+
+@override_settings(MEETING_INLINE_PARTICIPANTS=5, MEETING_PARTICIPANTS_PAGE_SIZE=10)
+class ParticipantsResourceTests(TestCase):
+    def setUp(self):
+        users = get_user_model().objects
+        self.organizer = users.create_user(email="organizer@example.com")
+        self.invitee = users.create_user(email="p00@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.organizer)
+        start = timezone.now() + timedelta(days=7)
+        self.meeting = MeetingService.create_meeting(
+            created_by=self.organizer, title="All hands", start_time=start, end_time=start + timedelta(hours=1)
+        )
+        self.emails = [f"p{i:02d}@example.com" for i in range(25)]
+        MeetingService.book_participants(self.meeting, [{"email": email} for email in self.emails])
+        self.url = f"/api/meetings/{self.meeting.id}/participants/"
+
+    def walk(self, url, client=None, between_pages=None):
+        client = client or self.client
+        pages = []
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200, response.content)
+            pages.append([row["participant"]["email"] for row in response.data["results"]])
+            url = response.data["next"]
+            if between_pages:
+                between_pages()
+        return pages, response.data["counts"]
+
+    def test_detail_inlines_a_capped_list(self):
+        response = self.client.get(f"/api/meetings/{self.meeting.id}/")
+        self.assertEqual(len(response.data["participants"]), 5)
+        self.assertEqual(response.data["participant_count"], 25)
+
+    def test_cursor_walks_every_participant_once(self):
+        pages, counts = self.walk(self.url)
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual(sum(pages, []), self.emails)
+        self.assertEqual(
+            counts, {"invited": 25, "accepted": 0, "declined": 0, "tentative": 0, "total": 25}
+        )
+        pages, _ = self.walk(self.url + "?page_size=20")
+        self.assertEqual([len(page) for page in pages], [20, 5])
+
+    def test_insert_during_the_walk_does_not_shift_pages(self):
+        def add_early_participant():
+            if not MeetingParticipant.objects.filter(participant__email="a@example.com").exists():
+                MeetingService.book_participants(
+                    self.meeting,
+                    [{"email": "a@example.com"}] + [{"email": email} for email in self.emails],
+                )
+
+        pages, counts = self.walk(self.url, between_pages=add_early_participant)
+        self.assertEqual(sum(pages, []), self.emails)
+        self.assertEqual(counts["total"], 26)
+
+    def test_filters_and_counts(self):
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="accepted")
+        invitee_client = APIClient()
+        invitee_client.force_authenticate(self.invitee)
+
+        pages, counts = self.walk(self.url + "?response_status=accepted", client=invitee_client)
+        self.assertEqual(pages, [["p00@example.com"]])
+        # Counts পুরো meeting-এর, filter-এর না।
+        self.assertEqual(counts["accepted"], 1)
+        self.assertEqual(counts["invited"], 24)
+
+        self.assertEqual(self.walk(self.url + "?is_required=false")[0], [[]])
+        self.assertEqual(self.client.get(self.url + "?role=bad").status_code, 400)
+
+    def test_strangers_get_404(self):
+        stranger = get_user_model().objects.create_user(email="stranger@example.com")
+        client = APIClient()
+        client.force_authenticate(stranger)
+        self.assertEqual(client.get(self.url).status_code, 404)
+
+
+class RsvpCounterTests(TestCase):
+    """প্রতিটা বদলের পর counter column-গুলো reconcile_rsvp_counters --check পার করে।"""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.organizer = users.create_user(email="organizer@example.com")
+        self.invitee = users.create_user(email="a@example.com")
+        start = timezone.now() + timedelta(days=7)
+        self.meeting = MeetingService.create_meeting(
+            created_by=self.organizer, title="Review", start_time=start, end_time=start + timedelta(hours=1)
+        )
+        emails = ("a@example.com", "b@example.com", "c@example.com")
+        MeetingService.book_participants(self.meeting, [{"email": email} for email in emails])
+
+    def assertCounts(self, **expected):
+        self.meeting.refresh_from_db()
+        counts = MeetingService.rsvp_counts(self.meeting)
+        self.assertEqual(
+            {status: n for status, n in counts.items() if n and status != "total"}, expected
+        )
+        self.assertEqual(counts["total"], sum(expected.values()))
+        call_command("reconcile_rsvp_counters", "--check", stdout=StringIO())
+
+    def test_booking_counts_invites(self):
+        self.assertCounts(invited=3)
+
+    def test_response_moves_one_count(self):
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="accepted")
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="accepted")
+        self.assertCounts(invited=2, accepted=1)
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="tentative")
+        self.assertCounts(invited=2, tentative=1)
+
+    def test_resync_applies_status_changes_additions_and_removals(self):
+        MeetingService.record_response(self.meeting, user=self.invitee, response_status="accepted")
+        MeetingService.book_participants(
+            self.meeting,
+            [{"email": "a@example.com", "response_status": "declined"}, {"email": "d@example.com"}],
+        )
+        self.assertCounts(invited=1, declined=1)
+
+    def test_check_reports_drift_and_repair_fixes_it(self):
+        MeetingParticipant.objects.filter(meeting=self.meeting).delete()
+        with self.assertRaisesMessage(CommandError, "drifted on 1 meetings"):
+            call_command("reconcile_rsvp_counters", "--check", stdout=StringIO())
+        call_command("reconcile_rsvp_counters", stdout=StringIO())
+        self.assertCounts()
+
+
+class ArchiveTests(TestCase):
+    def setUp(self):
+        users = get_user_model().objects
+        self.organizer = users.create_user(email="organizer@example.com")
+        self.invitee = users.create_user(email="invitee@example.com")
+        self.client = APIClient()
+        self.client.force_authenticate(self.invitee)
+
+        self.old = self.make(days=-400)
+        self.older = self.make(days=-500)
+        self.recent = self.make(days=-100)
+        self.cancelled = self.make(days=30)
+        MeetingService.cancel(self.cancelled)
+        Meeting.objects.filter(pk=self.cancelled.pk).update(
+            updated_at=timezone.now() - timedelta(days=40)
+        )
+        OutboxEvent.objects.update(dispatched_at=timezone.now())
+
+    def make(self, *, days):
+        start = timezone.now() + timedelta(days=days)
+        meeting = MeetingService.create_meeting(
+            created_by=self.organizer,
+            title=f"Day {days}",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+        )
+        MeetingService.book_participants(
+            meeting, [{"email": "invitee@example.com"}, {"email": "guest@example.com"}]
+        )
+        return meeting
+
+    def history(self, limit, between_pages=None):
+        ids, response = [], self.client.get("/api/meetings/history/", {"limit": limit})
+        while True:
+            self.assertEqual(response.status_code, 200, response.content)
+            ids += [row["id"] for row in response.data["results"]]
+            if not response.data["next_cursor"]:
+                return ids
+            if between_pages:
+                between_pages()
+            response = self.client.get(
+                "/api/meetings/history/", {"limit": limit, "cursor": response.data["next_cursor"]}
+            )
+
+    def test_archives_old_and_cancelled_but_not_pending(self):
+        OutboxEvent.objects.create(meeting=self.older, kind=OutboxEvent.Kind.UPDATE)
+        self.assertEqual(archive.archive(batch_size=1), 2)
+        self.assertEqual(
+            set(ArchivedMeeting.objects.values_list("id", flat=True)),
+            {self.old.id, self.cancelled.id},
+        )
+        self.assertEqual(
+            set(Meeting.objects.values_list("id", flat=True)), {self.older.id, self.recent.id}
+        )
+        self.assertEqual(ArchivedMeeting.objects.get(pk=self.old.pk).meeting_participants.count(), 2)
+
+    def test_retrieve_reads_through_to_the_archive(self):
+        archive.archive()
+        response = self.client.get(f"/api/meetings/{self.old.id}/")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.data["participants"]), 2)
+        self.assertIsNotNone(response.data["archived_at"])
+        self.assertEqual(response["ETag"], '"1"')
+
+        stranger = get_user_model().objects.create_user(email="stranger@example.com")
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.client.get(f"/api/meetings/{self.old.id}/").status_code, 404)
+
+    def test_history_merges_hot_and_archived_rows(self):
+        past = [str(m.id) for m in (self.recent, self.old, self.older)]
+        self.assertEqual(self.history(limit=10), past)
+        archive.archive()
+        # Cancel হয়ে archive হওয়া ভবিষ্যতের meeting-ও history-তে আসে।
+        expected = [str(self.cancelled.id)] + past
+        self.assertEqual(self.history(limit=1), expected)
+        self.assertEqual(self.history(limit=3), expected)
+
+    def test_archiving_mid_walk_does_not_skip_or_repeat(self):
+        past = [str(m.id) for m in (self.recent, self.old, self.older)]
+        self.assertEqual(self.history(limit=1, between_pages=archive.archive), past)
+
+    def test_bad_cursor_is_rejected(self):
+        response = self.client.get("/api/meetings/history/", {"cursor": "zzz"})
+        self.assertEqual(response.status_code, 400)
@@ -1,10 +1,15 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from .views import MeetingViewSet
+from .views import MeetingViewSet, ParticipantAutocompleteView
 
 router = DefaultRouter()
 router.register("", MeetingViewSet, basename="meeting")
 
 urlpatterns = [
+    path(
+        "participants/autocomplete/",
+        ParticipantAutocompleteView.as_view(),
+        name="participant-autocomplete",
+    ),
     path("", include(router.urls)),
 ]
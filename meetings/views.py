@@ -1,9 +1,16 @@
-from django.http import HttpResponse
-from rest_framework import status, viewsets
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
+from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from .exceptions import MeetingVersionConflict
 from .models import Meeting, MeetingParticipant
 from .serializers import (
     MeetingCreateUpdateSerializer,
@@ -15,13 +22,29 @@ from .serializers import (
     IcsExportOptionsSerializer,
     RSVPSerializer,
     MeetingCancelSerializer,
+    AutocompleteQuerySerializer,
+    ParticipantSuggestionSerializer,
+    ChangeFeedQuerySerializer,
+    ChangeFeedSerializer,
+    SparseFieldsQuerySerializer,
+    ParticipantFilterSerializer,
+    ArchivedMeetingDetailSerializer,
+    HistoryQuerySerializer,
+    MeetingHistorySerializer,
+    DeliveryStatusSerializer,
 )
+from meeting_scheduler.renderers import EventStreamRenderer
+from notifications import deliveries
+from . import changes as change_log
+from . import archive, live
+from .directory import autocomplete
+from .pagination import ParticipantCursorPagination
 from .services import MeetingService
 
 
 @extend_schema_view(
-    list=extend_schema(tags=["Meetings"]),
-    retrieve=extend_schema(tags=["Meetings"]),
+    list=extend_schema(tags=["Meetings"], parameters=[SparseFieldsQuerySerializer]),
+    retrieve=extend_schema(tags=["Meetings"], parameters=[SparseFieldsQuerySerializer]),
     create=extend_schema(tags=["Meetings"]),
     update=extend_schema(tags=["Meetings"]),
     partial_update=extend_schema(tags=["Meetings"]),
@@ -29,28 +52,92 @@ from .services import MeetingService
     check_conflicts=extend_schema(tags=["Meetings"]),
     send_invitations=extend_schema(tags=["Meetings"]),
     export_ics=extend_schema(tags=["Meetings"]),
-    invited=extend_schema(tags=["Meetings"]),
+    invited=extend_schema(tags=["Meetings"], parameters=[SparseFieldsQuerySerializer]),
+    upcoming=extend_schema(tags=["Meetings"], parameters=[SparseFieldsQuerySerializer]),
+    history=extend_schema(
+        tags=["Meetings"],
+        parameters=[HistoryQuerySerializer],
+        responses=MeetingHistorySerializer,
+    ),
+    events=extend_schema(
+        tags=["Live"],
+        operation_id="meetings_events_stream",
+        responses={(200, "text/event-stream"): str},
+    ),
+    my_events=extend_schema(
+        tags=["Live"],
+        operation_id="meetings_my_events_stream",
+        responses={(200, "text/event-stream"): str},
+    ),
+    changes=extend_schema(
+        tags=["Meetings"],
+        parameters=[ChangeFeedQuerySerializer],
+        responses=ChangeFeedSerializer,
+    ),
     respond=extend_schema(tags=["Meetings"]),
+    participants=extend_schema(
+        tags=["Meetings"],
+        parameters=[ParticipantFilterSerializer],
+        responses=MeetingParticipantSerializer(many=True),
+    ),
     cancel=extend_schema(tags=["Meetings"]),
+    delivery_status=extend_schema(tags=["Meetings"], responses=DeliveryStatusSerializer),
 )
 class MeetingViewSet(viewsets.ModelViewSet):
     queryset = Meeting.objects.none()
+    # Token cost per action; anything not listed costs 1.
+    throttle_costs = {
+        "create": 3,
+        "update": 3,
+        "partial_update": 3,
+        "check_conflicts": 3,
+        "export_ics": 5,
+        "send_invitations": 10,
+    }
+
+    # এই action-গুলোতে ?fields= / ?expand= চলে।
+    sparse_actions = ("list", "retrieve", "invited", "upcoming")
+
+    def get_sparse_fields(self) -> dict:
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = {"fields": None, "expand": set()}
+            if self.action in self.sparse_actions:
+                query = SparseFieldsQuerySerializer(
+                    data=self.request.query_params,
+                    context={"serializer_class": self.get_serializer_class()},
+                )
+                query.is_valid(raise_exception=True)
+                self._sparse_fields = query.validated_data
+        return self._sparse_fields
+
+    def get_output_fields(self):
+        """Sparse action-এ যে field serialize হবে; অন্য action-এ None (সব load)।"""
+        if self.action == "participants":
+            # Permission check আর RSVP counter; participant আলাদা query-তে আসে।
+            return ("rsvp_counts",)
+        if self.action == "delivery_status":
+            # শুধু permission check; delivery আলাদা query-তে আসে।
+            return ()
+        if self.action not in self.sparse_actions:
+            return None
+        return self.get_serializer_class().output_fields(**self.get_sparse_fields())
 
     def get_queryset(self):
         user = self.request.user
         if not user.is_authenticated:
             return Meeting.objects.none()
-        if self.action in ("retrieve", "respond"):
-            return MeetingService.list_visible_for_user(user)
-        return MeetingService.list_for_user(user)
+        if self.action in ("retrieve", "respond", "events", "participants"):
+            return MeetingService.list_visible_for_user(user, self.get_output_fields())
+        return MeetingService.list_for_user(user, self.get_output_fields())
 
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action in ("list", "invited", "upcoming"):
             return MeetingListSerializer
         if self.action == "retrieve":
             return MeetingDetailSerializer
         return MeetingCreateUpdateSerializer
 
+    @transaction.atomic
     def perform_create(self, serializer):
         meeting = serializer.save()
         MeetingService.send_invitations(
@@ -59,28 +146,157 @@ class MeetingViewSet(viewsets.ModelViewSet):
             participant_ids=[],
         )
 
-    def perform_update(self, serializer):
-        previous_emails = set(
-            serializer.instance.meeting_participants.values_list(
-                "participant__email", flat=True
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if_match = self.request.META.get("HTTP_IF_MATCH", "").strip()
+        if self.action in ("update", "partial_update") and if_match and if_match != "*":
+            version = if_match.removeprefix("W/").strip('"')
+            if not version.isdigit():
+                raise ParseError('If-Match must be the meeting ETag, e.g. "3".')
+            context["expected_version"] = int(version)
+        context.update(self.get_sparse_fields())
+        return context
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            instance = self.get_object()
+            serializer = self.get_serializer(instance)
+        except Http404:
+            # Hot table-এ নেই — archive-এ গেছে কিনা দেখি (read-through)।
+            instance = get_object_or_404(
+                archive.visible_for_user(request.user).prefetch_related(
+                    "meeting_participants__participant"
+                ),
+                pk=kwargs["pk"],
             )
-        )
+            serializer = ArchivedMeetingDetailSerializer(instance)
+        # fields= দিয়ে version বাদ পড়লেও ETag থাকে।
+        return Response(serializer.data, headers={"ETag": f'"{instance.version}"'})
+
+    def update(self, request, *args, **kwargs):
+        try:
+            response = super().update(request, *args, **kwargs)
+        except MeetingVersionConflict as exc:
+            return Response(
+                {"detail": str(exc), "current_version": exc.current_version},
+                status=(
+                    status.HTTP_412_PRECONDITION_FAILED
+                    if exc.precondition
+                    else status.HTTP_409_CONFLICT
+                ),
+            )
+        response["ETag"] = f'"{response.data["version"]}"'
+        return response
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        previous = MeetingService.snapshot(serializer.instance)
         meeting = serializer.save()
-        current_emails = set(
-            meeting.meeting_participants.values_list("participant__email", flat=True)
+        MeetingService.send_invitations_to_new_participants(
+            meeting, getattr(serializer, "new_participant_emails", set())
         )
-        new_emails = current_emails - previous_emails
-        MeetingService.send_invitations_to_new_participants(meeting, new_emails)
+        MeetingService.notify_meeting_updated(meeting, previous=previous)
 
     @action(detail=False, methods=["get"], url_path="invited")
     def invited(self, request):
-        meetings = MeetingService.list_invited_for_user(request.user)
+        meetings = MeetingService.list_invited_for_user(request.user, self.get_output_fields())
+        page = self.paginate_queryset(meetings)
+        serializer = self.get_serializer(page if page is not None else meetings, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="upcoming")
+    def upcoming(self, request):
+        meetings = MeetingService.list_upcoming_for_user(request.user, self.get_output_fields())
         page = self.paginate_queryset(meetings)
-        serializer = MeetingListSerializer(page if page is not None else meetings, many=True)
+        serializer = self.get_serializer(page if page is not None else meetings, many=True)
         if page is not None:
             return self.get_paginated_response(serializer.data)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="participants",
+        pagination_class=ParticipantCursorPagination,
+    )
+    def participants(self, request, pk=None):
+        meeting = self.get_object()
+        filters = ParticipantFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        participants = MeetingService.list_participants(meeting, **filters.validated_data)
+        page = self.paginate_queryset(participants)
+        response = self.get_paginated_response(
+            MeetingParticipantSerializer(page, many=True).data
+        )
+        response.data["counts"] = MeetingService.rsvp_counts(meeting)
+        return response
+
+    @action(detail=True, methods=["get"], url_path="deliveries")
+    def delivery_status(self, request, pk=None):
+        """Email delivery-র অবস্থা; শুধু creator দেখে (default queryset)।"""
+        meeting = self.get_object()
+        return Response(
+            DeliveryStatusSerializer(deliveries.status_summary(meeting)).data,
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get"], url_path="history")
+    def history(self, request):
+        query = HistoryQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        page = archive.history_for_user(
+            request.user,
+            cursor=query.validated_data.get("cursor"),
+            limit=query.validated_data["limit"],
+        )
+        return Response(MeetingHistorySerializer(page).data, status=status.HTTP_200_OK)
+
+    def perform_destroy(self, instance):
+        MeetingService.delete_meeting(instance)
+
+    def _sse_response(self, request, channels: list[str]):
+        stream = (
+            live.async_event_stream(channels)
+            if isinstance(request._request, ASGIRequest)
+            else live.event_stream(channels)
+        )
+        response = StreamingHttpResponse(stream, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="events",
+        renderer_classes=[EventStreamRenderer, JSONRenderer],
+    )
+    def events(self, request, pk=None):
+        meeting = self.get_object()
+        return self._sse_response(request, [live.meeting_channel(meeting.pk)])
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="events",
+        renderer_classes=[EventStreamRenderer, JSONRenderer],
+    )
+    def my_events(self, request):
+        return self._sse_response(request, [live.user_channel(request.user.pk)])
+
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request):
+        query = ChangeFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        feed = change_log.build_feed(
+            request.user,
+            query.validated_data.get("since"),
+            limit=query.validated_data["limit"],
+        )
+        return Response(ChangeFeedSerializer(feed).data, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=["post"], url_path="respond")
     def respond(self, request, pk=None):
         meeting = self.get_object()
@@ -114,24 +330,12 @@ class MeetingViewSet(viewsets.ModelViewSet):
         serializer = ConflictCheckSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
-        conflicts = MeetingService.conflicts_for(
+        results = MeetingService.describe_conflicts(
             start_time=data["start_time"],
             end_time=data["end_time"],
             participant_emails=data["participant_emails"],
             exclude_meeting_id=meeting.id,
         )
-        results = []
-        for mp in conflicts:
-            m = mp.meeting
-            results.append(
-                {
-                    "participant_email": mp.participant.email,
-                    "meeting_id": str(m.id),
-                    "meeting_title": m.title,
-                    "start_time": m.start_time,
-                    "end_time": m.end_time,
-                }
-            )
         return Response({"conflicts": results}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["post"], url_path="send-invitations")
@@ -162,4 +366,26 @@ class MeetingViewSet(viewsets.ModelViewSet):
             content_type="text/calendar; charset=utf-8",
         )
         response["Content-Disposition"] = f'attachment; filename="meeting-{meeting.id}.ics"'
-        return response
\ No newline at end of file
+        return response
+
+
+class ParticipantAutocompleteView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        parameters=[AutocompleteQuerySerializer],
+        responses=ParticipantSuggestionSerializer(many=True),
+        tags=["Participants"],
+    )
+    def get(self, request):
+        serializer = AutocompleteQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        results = autocomplete(
+            request.user,
+            serializer.validated_data["q"],
+            limit=serializer.validated_data["limit"],
+        )
+        return Response(
+            ParticipantSuggestionSerializer(results, many=True).data,
+            status=status.HTTP_200_OK,
+        )
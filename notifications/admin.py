@@ -1,3 +1,27 @@
 from django.contrib import admin
+from .models import Delivery, OutboxEvent, ScheduledReminder
 
-# Register your models here.
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ("meeting", "kind", "created_at", "dispatched_at")
+    list_filter = ("kind", "dispatched_at")
+    search_fields = ("meeting__title",)
+    raw_id_fields = ("meeting",)
+
+
+@admin.register(ScheduledReminder)
+class ScheduledReminderAdmin(admin.ModelAdmin):
+    list_display = ("meeting", "offset_minutes", "fire_at", "dispatched_at")
+    list_filter = ("offset_minutes", "dispatched_at")
+    search_fields = ("meeting__title",)
+    raw_id_fields = ("meeting",)
+
+
+
+@admin.register(Delivery)
+class DeliveryAdmin(admin.ModelAdmin):
+    list_display = ("email", "meeting", "kind", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("kind", "status")
+    search_fields = ("email", "meeting__title", "dispatch_key")
+    raw_id_fields = ("meeting", "meeting_participant")
@@ -0,0 +1,230 @@
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from .models import Delivery
+from .outbox import cancellation_reason
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def default_dispatch_key(meeting, kind: str) -> str:
+    """Caller key না দিলে: একই SEQUENCE-এর একই kind দুবার যায় না।"""
+    return f"{kind}-seq{meeting.sequence}"
+
+
+def _sending_timeout() -> timedelta:
+    return timedelta(seconds=getattr(settings, "DELIVERY_SENDING_TIMEOUT_SECONDS", 600))
+
+
+def backoff(attempts: int) -> timedelta | None:
+    """attempts-তম failure-এর পরে কত দেরি; max attempts ছুঁলে None (আর retry নেই)."""
+    if attempts >= getattr(settings, "DELIVERY_MAX_ATTEMPTS", 5):
+        return None
+    base = getattr(settings, "DELIVERY_RETRY_BASE_SECONDS", 60)
+    cap = getattr(settings, "DELIVERY_RETRY_MAX_SECONDS", 3600)
+    return timedelta(seconds=min(cap, base * 2 ** (attempts - 1)))
+
+
+def _claimable(now) -> Q:
+    return (
+        Q(status=Delivery.Status.QUEUED)
+        | Q(status=Delivery.Status.FAILED, next_attempt_at__lte=now)
+        | _stale(now)
+    )
+
+
+def claim(meeting, kind: str, dispatch_key: str, links) -> dict:
+    """
+    Recipient batch-এর delivery row তৈরি করে (আগে থাকলে সেটাই), আর যেগুলো
+    পাঠানো দরকার সেগুলো sending চিহ্ন দিয়ে link id -> Delivery ফেরত দেয়।
+    Sent row, backoff-এ থাকা failed row আর অন্য worker-এর হাতে থাকা row বাদ
+    যায় — তাই একই task দুবার চললেও কেউ দুটো email পায় না।
+    """
+    links = [mp for mp in links if mp.participant.email]
+    if not links:
+        return {}
+    Delivery.objects.bulk_create(
+        (
+            Delivery(
+                meeting=meeting,
+                meeting_participant=mp,
+                kind=kind,
+                dispatch_key=dispatch_key,
+                email=mp.participant.email,
+            )
+            for mp in links
+        ),
+        ignore_conflicts=True,
+    )
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            Delivery.objects.select_for_update(skip_locked=True)
+            .filter(
+                _claimable(now),
+                kind=kind,
+                dispatch_key=dispatch_key,
+                meeting_participant_id__in=[mp.id for mp in links],
+            )
+        )
+        Delivery.objects.filter(id__in=[d.id for d in claimed]).update(
+            status=Delivery.Status.SENDING, updated_at=now
+        )
+    return {d.meeting_participant_id: d for d in claimed}
+
+
+def record(sent: list[Delivery], failed: list[tuple[Delivery, str]]):
+    """একটা batch-এর ফল দুটো query-তে লেখে; failed row-এ exponential backoff।"""
+    now = timezone.now()
+    if sent:
+        Delivery.objects.filter(id__in=[d.id for d in sent]).update(
+            status=Delivery.Status.SENT,
+            sent_at=now,
+            last_error="",
+            next_attempt_at=None,
+            updated_at=now,
+        )
+    for delivery, error in failed:
+        delivery.status = Delivery.Status.FAILED
+        delivery.attempts += 1
+        delivery.last_error = error[:1000]
+        delay = backoff(delivery.attempts)
+        delivery.next_attempt_at = now + delay if delay is not None else None
+        delivery.updated_at = now
+    if failed:
+        Delivery.objects.bulk_update(
+            [d for d, _ in failed],
+            ["status", "attempts", "last_error", "next_attempt_at", "updated_at"],
+        )
+
+
+def _given_up(kind: str, meeting, now) -> str:
+    """Retry আর অর্থহীন হলে কারণ, নইলে ""।"""
+    if meeting.end_time <= now:
+        return "meeting already ended"
+    if kind != Delivery.Kind.CANCELLATION and meeting.status == meeting.Status.CANCELLED:
+        # Cancellation email-এর পরে নতুন invite/update পৌঁছালে ভুল বার্তা যায়।
+        return "meeting cancelled"
+    if kind == Delivery.Kind.REMINDER and meeting.start_time <= now:
+        return "meeting already started"
+    return ""
+
+
+def _enqueue(meeting, kind: str, dispatch_key: str, ids: list[str]):
+    from .tasks import (
+        notify_cancelled_task,
+        send_invitations_task,
+        send_reminders_task,
+        send_updates_task,
+    )
+
+    selector = {"ids": ids}
+    if kind == Delivery.Kind.CANCELLATION:
+        notify_cancelled_task(
+            meeting.id,
+            cancellation_reason(meeting),
+            selector=selector,
+            dispatch_key=dispatch_key,
+        )
+    elif kind == Delivery.Kind.UPDATE:
+        send_updates_task(meeting.id, selector, dispatch_key=dispatch_key)
+    elif kind == Delivery.Kind.REMINDER:
+        send_reminders_task(meeting.id, selector, dispatch_key=dispatch_key)
+    else:
+        send_invitations_task(meeting.id, selector, dispatch_key=dispatch_key)
+
+
+def _stale(now) -> Q:
+    """Worker মাঝপথে মরে গেলে sending-এ, বা enqueue না হলে queued-এ আটকে থাকা row।"""
+    return Q(
+        status__in=(Delivery.Status.QUEUED, Delivery.Status.SENDING),
+        updated_at__lt=now - _sending_timeout(),
+    )
+
+
+def retry_due(*, limit: int | None = None) -> int:
+    """
+    Backoff শেষ হওয়া failed row আর আটকে থাকা row তুলে queued করে, তারপর
+    (meeting, kind, dispatch_key) অনুযায়ী প্রতি group-এ শুধু ওই recipient-দের id
+    দিয়ে একটা task queue করে; task সেগুলোই claim করে। Enqueue commit-এর পরে হয়,
+    যাতে task lock করা row না পায়; enqueue fail হলে row stale হয়ে আবার আসে।
+    """
+    limit = limit or getattr(settings, "DELIVERY_RETRY_BATCH_SIZE", 500)
+    now = timezone.now()
+    groups: dict = defaultdict(list)
+
+    with transaction.atomic():
+        due = list(
+            Delivery.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(Q(status=Delivery.Status.FAILED, next_attempt_at__lte=now) | _stale(now))
+            .select_related("meeting")
+            .order_by("next_attempt_at", "id")[:limit]
+        )
+        given_up = []
+        for delivery in due:
+            reason = _given_up(delivery.kind, delivery.meeting, now)
+            if reason:
+                delivery.status = Delivery.Status.FAILED
+                delivery.last_error = reason
+                delivery.next_attempt_at = None
+                delivery.updated_at = now
+                given_up.append(delivery)
+                continue
+            groups[(delivery.meeting, delivery.kind, delivery.dispatch_key)].append(delivery)
+
+        Delivery.objects.bulk_update(
+            given_up, ["status", "last_error", "next_attempt_at", "updated_at"]
+        )
+        Delivery.objects.filter(
+            id__in=[d.id for group in groups.values() for d in group]
+        ).update(status=Delivery.Status.QUEUED, updated_at=now)
+
+    retried = 0
+    for (meeting, kind, dispatch_key), group in groups.items():
+        try:
+            _enqueue(meeting, kind, dispatch_key, [str(d.meeting_participant_id) for d in group])
+        except Exception as e:
+            logger.error(f"Delivery retry could not be queued for meeting {meeting.id}: {str(e)}")
+            continue
+        retried += len(group)
+
+    if retried:
+        logger.info(f"Re-queued {retried} failed deliveries")
+    return retried
+
+
+def status_summary(meeting, *, failed_limit: int | None = None) -> dict:
+    """
+    Meeting-এর সব delivery-র kind/status অনুযায়ী সংখ্যা (একটা GROUP BY) আর
+    সবচেয়ে সাম্প্রতিক failed recipient-দের ছোট তালিকা।
+    """
+    failed_limit = failed_limit or getattr(settings, "DELIVERY_FAILED_LIST_LIMIT", 100)
+    counts: dict = defaultdict(lambda: {status: 0 for status in Delivery.Status.values})
+    for row in (
+        Delivery.objects.filter(meeting=meeting)
+        .order_by()
+        .values("kind", "status")
+        .annotate(c=Count("id"))
+    ):
+        counts[row["kind"]][row["status"]] = row["c"]
+    failed = list(
+        Delivery.objects.filter(meeting=meeting, status=Delivery.Status.FAILED)
+        .order_by("-updated_at")
+        .values(
+            "email", "kind", "dispatch_key", "attempts", "last_error", "next_attempt_at"
+        )[:failed_limit]
+    )
+    return {"counts": dict(counts), "failed": failed}
+
+
+def prune(*, older_than_days: int | None = None) -> int:
+    """পুরনো sent row মোছে; failed row থাকে যাতে কেউ দেখতে পারে।"""
+    days = older_than_days or getattr(settings, "DELIVERY_RETENTION_DAYS", 30)
+    deleted, _ = Delivery.objects.filter(
+        status=Delivery.Status.SENT, sent_at__lt=timezone.now() - timedelta(days=days)
+    ).delete()
+    return deleted
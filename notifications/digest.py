@@ -0,0 +1,198 @@
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from calendar_integration.services import MeetingIcsBuilder
+from .deliveries import backoff, record
+from .models import Delivery
+from .outbox import cancellation_reason
+from .rendering import render_digest
+import logging
+
+logger = logging.getLogger(__name__)
+
+# এই kind-গুলো digest-এ যায়; update শুধু তখন, যখন একই meeting-এর invite আগে
+# থেকেই digest-এ অপেক্ষা করছে (নইলে invite-এর আগেই "updated" পৌঁছাত)।
+DIGEST_KINDS = (Delivery.Kind.INVITATION, Delivery.Kind.CANCELLATION)
+
+
+def wants_digest(mp) -> bool:
+    user = mp.participant.user
+    return user is not None and user.email_digest != user.EmailDigest.OFF
+
+
+def divert(meeting, kind: str, links, claimed: dict) -> int:
+    """
+    Claim করা delivery-র মধ্যে যাদের recipient digest চায়, তাদের status digest
+    করে claimed থেকে সরিয়ে দেয় — সেগুলো এখন আর পাঠানো হয় না।
+    """
+    if kind not in DIGEST_KINDS and kind != Delivery.Kind.UPDATE:
+        return 0
+    ids = {mp.id for mp in links if mp.id in claimed and wants_digest(mp)}
+    if ids and kind == Delivery.Kind.UPDATE:
+        ids &= set(
+            Delivery.objects.filter(
+                meeting=meeting, status=Delivery.Status.DIGEST, meeting_participant_id__in=ids
+            ).values_list("meeting_participant_id", flat=True)
+        )
+    if not ids:
+        return 0
+    Delivery.objects.filter(id__in=[claimed.pop(pk).id for pk in ids]).update(
+        status=Delivery.Status.DIGEST, updated_at=timezone.now()
+    )
+    return len(ids)
+
+
+def held_modes(now) -> list[str]:
+    """
+    এই run-এ যে preference-এর row অপেক্ষা করবে: daily শুধু DIGEST_DAILY_HOUR
+    (UTC)-এর run-এ যায়। Preference off হয়ে গেলে বাকি row পরের run-এই চলে যায়।
+    """
+    from accounts.models import User
+
+    if now.hour == getattr(settings, "DIGEST_DAILY_HOUR", 8):
+        return []
+    return [User.EmailDigest.DAILY]
+
+
+def _plan(rows, now):
+    """
+    এক recipient-এর pending row meeting ধরে মেলায়। (kind, meeting, reason)
+    item আর যেসব row item ছাড়াই শেষ (skipped) সেগুলো ফেরত।
+    """
+    by_meeting = defaultdict(list)
+    for row in rows:
+        by_meeting[row.meeting_id].append(row)
+
+    items = []
+    skipped = []
+    for group in by_meeting.values():
+        meeting = group[0].meeting
+        kinds = {row.kind for row in group}
+        cancelled = Delivery.Kind.CANCELLATION in kinds or meeting.status == meeting.Status.CANCELLED
+        if meeting.end_time <= now:
+            # শেষ হয়ে যাওয়া meeting-এর খবর digest-এ রাখা অর্থহীন।
+            skipped.extend(group)
+        elif cancelled and Delivery.Kind.INVITATION in kinds:
+            # Invite-ই পায়নি এমন কাউকে cancel-এর খবর দেওয়ার দরকার নেই।
+            skipped.extend(group)
+        elif cancelled:
+            items.append((Delivery.Kind.CANCELLATION, meeting, cancellation_reason(meeting)))
+        elif Delivery.Kind.INVITATION in kinds:
+            items.append((Delivery.Kind.INVITATION, meeting, ""))
+        else:
+            items.append((Delivery.Kind.UPDATE, meeting, ""))
+    return items, skipped
+
+
+def _build_email(mp, items, builders):
+    from .services import _build_message
+
+    participant = mp.participant
+    msg = _build_message(render_digest(participant, items), participant.email)
+    # iTIP message প্রতি UID-এ একটা, তাই meeting প্রতি আলাদা .ics।
+    for kind, meeting, _ in items:
+        builder = builders.get(meeting.id)
+        if builder is None:
+            builder = builders[meeting.id] = MeetingIcsBuilder(meeting)
+        method = "CANCEL" if kind == Delivery.Kind.CANCELLATION else "REQUEST"
+        msg.attach(
+            f"meeting-{meeting.id}.ics",
+            builder.build_for(mp, cancelled=method == "CANCEL"),
+            f"text/calendar; charset=utf-8; method={method}",
+        )
+    return msg
+
+
+def _claim(participant_ids) -> list[Delivery]:
+    with transaction.atomic():
+        rows = list(
+            Delivery.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(
+                status=Delivery.Status.DIGEST,
+                meeting_participant__participant_id__in=participant_ids,
+            )
+            .select_related("meeting__created_by", "meeting_participant__participant")
+            .order_by("id")
+        )
+        Delivery.objects.filter(id__in=[row.id for row in rows]).update(
+            status=Delivery.Status.SENDING, updated_at=timezone.now()
+        )
+    return rows
+
+
+def _send_batch(rows, now, builders) -> int:
+    by_participant = defaultdict(list)
+    for row in rows:
+        by_participant[row.meeting_participant.participant_id].append(row)
+
+    sent_emails = 0
+    sent, failed, skipped, retry = [], [], [], []
+    for group in by_participant.values():
+        items, dropped = _plan(group, now)
+        skipped.extend(dropped)
+        dropped_ids = {row.id for row in dropped}
+        pending = [row for row in group if row.id not in dropped_ids]
+        if not items:
+            continue
+        mp = pending[0].meeting_participant
+        try:
+            _build_email(mp, items, builders).send(fail_silently=False)
+        except Exception as e:
+            logger.error(f"Failed to send digest to {mp.participant.email}: {str(e)}")
+            for row in pending:
+                # Backoff ছাড়াই পরের digest run-এ আবার; max attempts-এ failed।
+                if backoff(row.attempts + 1) is None:
+                    failed.append((row, str(e)))
+                else:
+                    row.attempts += 1
+                    row.last_error = str(e)[:1000]
+                    retry.append(row)
+            continue
+        sent.extend(pending)
+        sent_emails += 1
+
+    record(sent, failed)
+    Delivery.objects.filter(id__in=[row.id for row in skipped]).update(
+        status=Delivery.Status.SKIPPED, updated_at=now
+    )
+    for row in retry:
+        row.status = Delivery.Status.DIGEST
+        row.updated_at = now
+    Delivery.objects.bulk_update(retry, ["status", "attempts", "last_error", "updated_at"])
+    return sent_emails
+
+
+def send_due(*, batch_size: int | None = None, max_batches: int | None = None) -> int:
+    """
+    যাদের digest-এর সময় হয়েছে তাদের pending row recipient-এর keyset ধরে
+    DIGEST_BATCH_SIZE জন করে তোলে, প্রতি batch এক query-তে load করে প্রতি
+    recipient-এ একটাই email পাঠায়। পাঠানো email-এর সংখ্যা ফেরত।
+    """
+    batch_size = batch_size or getattr(settings, "DIGEST_BATCH_SIZE", 200)
+    max_batches = max_batches or getattr(settings, "DIGEST_MAX_BATCHES", 50)
+    now = timezone.now()
+    pending = (
+        Delivery.objects.filter(status=Delivery.Status.DIGEST)
+        .exclude(meeting_participant__participant__user__email_digest__in=held_modes(now))
+        .order_by("meeting_participant__participant_id")
+        .values_list("meeting_participant__participant_id", flat=True)
+        .distinct()
+    )
+    # ICS header meeting প্রতি একবারই তৈরি হয়, batch জুড়ে।
+    builders: dict = {}
+    sent = 0
+    after = None
+    for _ in range(max_batches):
+        page = pending if after is None else pending.filter(
+            meeting_participant__participant_id__gt=after
+        )
+        participant_ids = list(page[:batch_size])
+        if not participant_ids:
+            break
+        after = participant_ids[-1]
+        sent += _send_batch(_claim(participant_ids), now, builders)
+
+    if sent:
+        logger.info(f"Sent {sent} notification digests")
+    return sent
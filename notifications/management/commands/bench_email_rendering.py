@@ -0,0 +1,53 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from meetings.models import Meeting, Participant
+from notifications.rendering import MeetingEmailRenderer
+
+TIMEZONES = ["UTC", "Asia/Dhaka", "Europe/London", "America/New_York", "Asia/Tokyo", ""]
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-recipient email rendering for a large meeting (no DB or SMTP access)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--attendees", type=int, default=5000)
+        parser.add_argument("--rounds", type=int, default=3)
+
+    def handle(self, *args, **options):
+        attendees = options["attendees"]
+        start = timezone.now() + timedelta(days=1)
+        meeting = Meeting(
+            title="Quarterly planning",
+            description="Agenda:\n- roadmap\n- hiring",
+            location="Main hall",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            timezone="Asia/Dhaka",
+        )
+        participants = [
+            Participant(
+                email=f"attendee{i}@example.com",
+                name=f"Attendee {i}",
+                timezone=TIMEZONES[i % len(TIMEZONES)],
+            )
+            for i in range(attendees)
+        ]
+
+        best = None
+        for _ in range(options["rounds"]):
+            began = time.perf_counter()
+            renderer = MeetingEmailRenderer(meeting, "invitation")
+            total_bytes = 0
+            for participant in participants:
+                rendered = renderer.render(participant)
+                total_bytes += len(rendered.text) + len(rendered.html)
+            elapsed = time.perf_counter() - began
+            best = elapsed if best is None else min(best, elapsed)
+
+        self.stdout.write(
+            f"{attendees} recipients: {best * 1000:.1f} ms total, "
+            f"{best / attendees * 1_000_000:.2f} us/recipient, "
+            f"{total_bytes / attendees:.0f} bytes/recipient (best of {options['rounds']})"
+        )
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('meetings', '0002_alter_participant_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('invitation', 'Invitation'), ('cancellation', 'Cancellation')], max_length=20)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbox_events', to='meetings.meeting')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['dispatched_at', 'id'], name='outbox_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='kind',
+            field=models.CharField(choices=[('invitation', 'Invitation'), ('update', 'Update'), ('cancellation', 'Cancellation')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:57
+
+import django.db.models.deletion
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_upcoming(apps, schema_editor):
+    # Live code (notifications.reminders) import না করে — পরে বদলালেও migration একই থাকে।
+    offsets = list(getattr(settings, "REMINDER_OFFSETS_MINUTES", [15]))
+    bucket_seconds = getattr(settings, "REMINDER_BUCKET_SECONDS", 60)
+
+    Meeting = apps.get_model("meetings", "Meeting")
+    ScheduledReminder = apps.get_model("notifications", "ScheduledReminder")
+
+    now = timezone.now()
+    rows = []
+    for meeting_id, start in Meeting.objects.filter(
+        status="scheduled", start_time__gt=now
+    ).values_list("id", "start_time").iterator():
+        for minutes in offsets:
+            fire_at = start - timedelta(minutes=minutes)
+            if fire_at > now:
+                epoch = int(fire_at.timestamp())
+                rows.append(ScheduledReminder(
+                    meeting_id=meeting_id, offset_minutes=minutes, fire_at=fire_at,
+                    bucket=datetime.fromtimestamp(epoch - epoch % bucket_seconds, tz=dt_timezone.utc),
+                ))
+    ScheduledReminder.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0012_meeting_archive'),
+        ('notifications', '0002_alter_outboxevent_kind'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduledReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('offset_minutes', models.PositiveIntegerField()),
+                ('fire_at', models.DateTimeField()),
+                ('bucket', models.DateTimeField()),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='meetings.meeting')),
+            ],
+            options={
+                'ordering': ['bucket', 'id'],
+                'indexes': [models.Index(condition=models.Q(('dispatched_at__isnull', True)), fields=['bucket'], name='reminder_due_idx')],
+                'constraints': [models.UniqueConstraint(fields=('meeting', 'offset_minutes'), name='reminder_meeting_offset_uniq')],
+            },
+        ),
+        migrations.RunPython(schedule_upcoming, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.9 on 2026-10-19 18:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0012_meeting_archive'),
+        ('notifications', '0003_scheduledreminder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Delivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('invitation', 'Invitation'), ('update', 'Update'), ('cancellation', 'Cancellation'), ('reminder', 'Reminder')], max_length=20)),
+                ('dispatch_key', models.CharField(max_length=64)),
+                ('email', models.EmailField(max_length=255)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='meetings.meeting')),
+                ('meeting_participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deliveries', to='meetings.meetingparticipant')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(condition=models.Q(('status', 'failed')), fields=['next_attempt_at'], name='delivery_retry_idx'), models.Index(fields=['meeting', 'kind', 'status'], name='delivery_meeting_status_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'dispatch_key', 'meeting_participant'), name='delivery_idempotency_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-19 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meetings', '0012_meeting_archive'),
+        ('notifications', '0004_delivery'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='delivery',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed'), ('digest', 'Waiting for digest'), ('skipped', 'Skipped')], default='queued', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='delivery',
+            index=models.Index(condition=models.Q(('status', 'digest')), fields=['meeting_participant'], name='delivery_digest_idx'),
+        ),
+    ]
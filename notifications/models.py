@@ -1,3 +1,140 @@
 from django.db import models
 
-# Create your models here.
+
+class OutboxEvent(models.Model):
+    class Kind(models.TextChoices):
+        INVITATION = "invitation", "Invitation"
+        UPDATE = "update", "Update"
+        CANCELLATION = "cancellation", "Cancellation"
+
+    meeting = models.ForeignKey(
+        "meetings.Meeting",
+        related_name="outbox_events",
+        on_delete=models.CASCADE,
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["dispatched_at", "id"], name="outbox_pending_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} @ {self.meeting_id}"
+
+
+class ScheduledReminder(models.Model):
+    """
+    প্রতি (meeting, offset)-এ একটা row, attendee প্রতি না। bucket = fire_at
+    REMINDER_BUCKET_SECONDS-এ নামানো; dispatcher একটা index query-তে due bucket
+    তুলে recipient batch-এ fan out করে।
+    """
+
+    meeting = models.ForeignKey(
+        "meetings.Meeting",
+        related_name="reminders",
+        on_delete=models.CASCADE,
+    )
+    offset_minutes = models.PositiveIntegerField()
+    fire_at = models.DateTimeField()
+    bucket = models.DateTimeField()
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["bucket", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["meeting", "offset_minutes"], name="reminder_meeting_offset_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["bucket"],
+                condition=models.Q(dispatched_at__isnull=True),
+                name="reminder_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.offset_minutes}m before {self.meeting_id} @ {self.bucket:%Y-%m-%d %H:%M}"
+
+
+class Delivery(models.Model):
+    """
+    প্রতি recipient-এ প্রতি dispatch-এর একটা row। (kind, dispatch_key, link)
+    unique — এটাই idempotency key, তাই একই task দুবার চললেও sent row আর যায় না;
+    failed row backoff মেনে শুধু নিজেরাই retry হয়।
+    """
+
+    class Kind(models.TextChoices):
+        INVITATION = "invitation", "Invitation"
+        UPDATE = "update", "Update"
+        CANCELLATION = "cancellation", "Cancellation"
+        REMINDER = "reminder", "Reminder"
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+        # Recipient digest চায়; পরের digest job-এ একসাথে যাবে।
+        DIGEST = "digest", "Waiting for digest"
+        # Digest-এ গিয়ে আর দরকার পড়েনি (যেমন invite-এর আগেই cancel)।
+        SKIPPED = "skipped", "Skipped"
+
+    meeting = models.ForeignKey(
+        "meetings.Meeting",
+        related_name="deliveries",
+        on_delete=models.CASCADE,
+    )
+    meeting_participant = models.ForeignKey(
+        "meetings.MeetingParticipant",
+        related_name="deliveries",
+        on_delete=models.CASCADE,
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    # যে dispatch থেকে এসেছে — যেমন "outbox-42" বা "reminder-7"।
+    dispatch_key = models.CharField(max_length=64)
+    email = models.EmailField(max_length=255)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    # Failed row কখন আবার চেষ্টা হবে; null মানে আর retry নেই।
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "dispatch_key", "meeting_participant"],
+                name="delivery_idempotency_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="failed"),
+                name="delivery_retry_idx",
+            ),
+            models.Index(fields=["meeting", "kind", "status"], name="delivery_meeting_status_idx"),
+            models.Index(
+                fields=["meeting_participant"],
+                condition=models.Q(status="digest"),
+                name="delivery_digest_idx",
+            ),
+        ]
+
+    @property
+    def idempotency_key(self) -> str:
+        return f"{self.kind}:{self.dispatch_key}:{self.meeting_participant_id}"
+
+    def __str__(self):
+        return f"{self.kind} to {self.email}: {self.status}"
+
@@ -0,0 +1,197 @@
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .models import OutboxEvent
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_event(meeting, kind: str, payload: dict | None = None) -> OutboxEvent:
+    """Outbox-এ event লেখে; caller-এর transaction commit হলে তবেই relay চালু হয়।"""
+    event = OutboxEvent.objects.create(meeting=meeting, kind=kind, payload=payload or {})
+    if kind == OutboxEvent.Kind.UPDATE:
+        transaction.on_commit(schedule_update_flush)
+    else:
+        transaction.on_commit(_kick_relay)
+    return event
+
+
+def cancellation_reason(meeting) -> str:
+    """Meeting-এ reason column নেই; শেষ cancellation event-এর payload থেকে।"""
+    latest = (
+        OutboxEvent.objects.filter(meeting=meeting, kind=OutboxEvent.Kind.CANCELLATION)
+        .order_by("-id")
+        .first()
+    )
+    return latest.payload.get("reason", "") if latest else ""
+
+
+def _kick_relay():
+    from .tasks import relay_outbox_task
+
+    try:
+        relay_outbox_task()
+    except Exception as e:
+        # The periodic relay drains whatever is left, so the request never
+        # has to wait on (or fail because of) the queue.
+        logger.warning(f"Outbox relay could not be enqueued: {str(e)}")
+
+
+def update_debounce_window() -> timedelta:
+    return timedelta(seconds=getattr(settings, "MEETING_UPDATE_DEBOUNCE_SECONDS", 120))
+
+
+def update_max_delay() -> timedelta:
+    return timedelta(seconds=getattr(settings, "MEETING_UPDATE_MAX_DELAY_SECONDS", 600))
+
+
+def schedule_update_flush():
+    from .tasks import relay_outbox_task
+
+    delay = int(update_debounce_window().total_seconds()) + 1
+    try:
+        relay_outbox_task.schedule(delay=delay)
+    except Exception as e:
+        logger.warning(f"Delayed outbox relay could not be scheduled: {str(e)}")
+
+
+def _coalesce(events: list[OutboxEvent]) -> list[tuple[str, dict]]:
+    cancellation = next(
+        (e for e in reversed(events) if e.kind == OutboxEvent.Kind.CANCELLATION), None
+    )
+    if cancellation is not None:
+        return [(OutboxEvent.Kind.CANCELLATION, cancellation.payload)]
+
+    send_to_all = False
+    participant_ids: set[str] = set()
+    has_update = False
+    # আগে invite পেয়ে গেছে এমন link (held update-এ লেখা); সব update-এ থাকলে তবেই বাদ।
+    update_excludes: set[str] | None = None
+    for event in events:
+        if event.kind == OutboxEvent.Kind.UPDATE:
+            has_update = True
+            excludes = set(event.payload.get("exclude_ids") or [])
+            update_excludes = excludes if update_excludes is None else update_excludes & excludes
+            continue
+        if event.payload.get("send_to_all"):
+            send_to_all = True
+        participant_ids.update(event.payload.get("participant_ids") or [])
+
+    # An invitation always carries the latest details, so whoever gets one
+    # does not also need the "updated" email.
+    if send_to_all:
+        return [(OutboxEvent.Kind.INVITATION, {"send_to_all": True})]
+
+    deliveries = []
+    if participant_ids:
+        deliveries.append(
+            (OutboxEvent.Kind.INVITATION, {"participant_ids": sorted(participant_ids)})
+        )
+    if has_update:
+        deliveries.append(
+            (OutboxEvent.Kind.UPDATE, {"exclude_ids": sorted(participant_ids | update_excludes)})
+        )
+    return deliveries
+
+
+def _deliver(meeting_id, kind: str, payload: dict, dispatch_key: str):
+    from .tasks import send_invitations_task, send_updates_task, notify_cancelled_task
+
+    if kind == OutboxEvent.Kind.CANCELLATION:
+        notify_cancelled_task(meeting_id, payload.get("reason", ""), dispatch_key=dispatch_key)
+    elif kind == OutboxEvent.Kind.UPDATE:
+        send_updates_task(
+            meeting_id,
+            {"all": True, "exclude_ids": payload.get("exclude_ids") or []},
+            dispatch_key=dispatch_key,
+        )
+    elif payload.get("send_to_all"):
+        send_invitations_task(meeting_id, {"all": True}, dispatch_key=dispatch_key)
+    else:
+        send_invitations_task(
+            meeting_id, {"ids": payload["participant_ids"]}, dispatch_key=dispatch_key
+        )
+
+
+def _exclude_from_held_updates(meeting_id, participant_ids: set[str], before_id):
+    """
+    Debounce-এ আটকে থাকা update-এর আগেই invitation চলে গেলে, সেই invite-এ
+    সর্বশেষ তথ্য ছিল — তাই আগের update এদের আর যায় না।
+    """
+    for event in OutboxEvent.objects.filter(
+        meeting_id=meeting_id,
+        kind=OutboxEvent.Kind.UPDATE,
+        dispatched_at__isnull=True,
+        id__lt=before_id,
+    ):
+        excludes = set(event.payload.get("exclude_ids") or []) | participant_ids
+        event.payload["exclude_ids"] = sorted(excludes)
+        event.save(update_fields=["payload"])
+
+
+def _debounced_meeting_ids(pending):
+    """
+    যেসব meeting-এ window-এর মধ্যে edit হয়েছে, সেগুলোর update আপাতত ধরে রাখা হয় —
+    যদি না সবচেয়ে পুরনো pending event MEETING_UPDATE_MAX_DELAY_SECONDS পার করে
+    ফেলে; নইলে টানা edit হতে থাকা meeting-এর খবর কখনো যেত না।
+    """
+    now = timezone.now()
+    recent_updates = pending.filter(
+        kind=OutboxEvent.Kind.UPDATE, created_at__gt=now - update_debounce_window()
+    ).values("meeting_id")
+    overdue = pending.filter(created_at__lte=now - update_max_delay()).values("meeting_id")
+    cancelled = pending.filter(kind=OutboxEvent.Kind.CANCELLATION).values("meeting_id")
+    return recent_updates.exclude(meeting_id__in=cancelled).exclude(meeting_id__in=overdue)
+
+
+def relay_pending_events(*, batch_size: int | None = None) -> int:
+    """
+    Pending outbox event-গুলো batch করে পড়ে, meeting অনুযায়ী একত্র করে
+    প্রতি meeting-এ একটাই delivery queue করে।
+    """
+    batch_size = batch_size or getattr(settings, "OUTBOX_RELAY_BATCH_SIZE", 200)
+    relayed = 0
+
+    with transaction.atomic():
+        pending = OutboxEvent.objects.filter(dispatched_at__isnull=True)
+        events = list(
+            pending.select_for_update(skip_locked=True)
+            # শুধু update ধরে রাখা হয়; নতুন participant-এর invitation অপেক্ষা করে না।
+            .exclude(kind=OutboxEvent.Kind.UPDATE, meeting_id__in=_debounced_meeting_ids(pending))
+            .order_by("id")[:batch_size]
+        )
+
+        by_meeting: dict = defaultdict(list)
+        for event in events:
+            by_meeting[event.meeting_id].append(event)
+
+        for meeting_id, group in by_meeting.items():
+            # একই event group আবার relay হলে (বা task retry হলে) key একই থাকে,
+            # তাই যারা আগেই পেয়েছে তারা আর পায় না।
+            dispatch_key = f"outbox-{group[-1].id}"
+            try:
+                for kind, payload in _coalesce(group):
+                    _deliver(meeting_id, kind, payload, dispatch_key)
+            except Exception as e:
+                logger.error(f"Outbox relay failed for meeting {meeting_id}: {str(e)}")
+                continue
+
+            OutboxEvent.objects.filter(id__in=[e.id for e in group]).update(
+                dispatched_at=timezone.now()
+            )
+            invited = {
+                pk
+                for e in group
+                if e.kind == OutboxEvent.Kind.INVITATION
+                for pk in e.payload.get("participant_ids") or []
+            }
+            if invited:
+                _exclude_from_held_updates(meeting_id, invited, group[-1].id)
+            relayed += len(group)
+
+    if relayed:
+        logger.info(f"Outbox relay dispatched {relayed} events")
+    return relayed
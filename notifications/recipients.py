@@ -0,0 +1,68 @@
+from typing import Iterator
+from django.conf import settings
+from django.db.models import Q
+
+# A selector describes which of a meeting's participant links a delivery
+# targets, so Huey payloads stay the same size however big the meeting is:
+#   {"all": True}
+#   {"ids": [<MeetingParticipant id>, ...]}
+#   {"all": True, "exclude_ids": [...]}
+#   {"all": True, "after_id": ..., "until_id": ..., "skip_declined": True}
+# after_id/until_id হলো link id-এর keyset range (after_id বাদ, until_id সহ) —
+# একটা বড় meeting কয়েকটা task-এ ভাগ করতে।
+ALL = {"all": True}
+
+
+def normalize_selector(selector) -> dict:
+    # Tasks queued before selectors existed carried a plain id list.
+    if isinstance(selector, (list, tuple)):
+        return {"ids": [str(pk) for pk in selector]}
+    return selector or ALL
+
+
+def selector_q(selector: dict) -> Q:
+    selector = normalize_selector(selector)
+    q = Q() if selector.get("all") else Q(id__in=selector.get("ids") or [])
+    if selector.get("exclude_ids"):
+        q &= ~Q(id__in=selector["exclude_ids"])
+    if selector.get("after_id"):
+        q &= Q(id__gt=selector["after_id"])
+    if selector.get("until_id"):
+        q &= Q(id__lte=selector["until_id"])
+    if selector.get("skip_declined"):
+        q &= ~Q(response_status="declined")
+    return q
+
+
+def recipients_queryset(meeting_id, selector):
+    from meetings.models import MeetingParticipant
+
+    return (
+        MeetingParticipant.objects.filter(meeting_id=meeting_id)
+        .filter(selector_q(selector))
+        .select_related("participant__user")
+        .order_by("id")
+    )
+
+
+def batch_size() -> int:
+    return getattr(settings, "NOTIFICATION_BATCH_SIZE", 500)
+
+
+def iter_recipient_batches(meeting_id, selector, *, chunk_size: int | None = None) -> Iterator[list]:
+    """id-এর keyset ধরে batch করে পড়ে, তাই memory meeting size-এর উপর নির্ভর করে না।"""
+    chunk_size = chunk_size or batch_size()
+    qs = recipients_queryset(meeting_id, selector)
+    last_id = None
+    while True:
+        page = qs if last_id is None else qs.filter(id__gt=last_id)
+        batch = list(page[:chunk_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+
+
+def iter_recipients(meeting_id, selector, *, chunk_size: int | None = None):
+    for batch in iter_recipient_batches(meeting_id, selector, chunk_size=chunk_size):
+        yield from batch
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .models import ScheduledReminder
+from .recipients import batch_size, recipients_queryset
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def offsets() -> list[int]:
+    """Meeting শুরুর কত মিনিট আগে reminder যায়।"""
+    return list(getattr(settings, "REMINDER_OFFSETS_MINUTES", [15]))
+
+
+def bucket_for(when: datetime) -> datetime:
+    seconds = getattr(settings, "REMINDER_BUCKET_SECONDS", 60)
+    epoch = int(when.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=dt_timezone.utc)
+
+
+def schedule(meeting):
+    """
+    Meeting-এর reminder row নতুন start_time অনুযায়ী আবার লেখে — সময় বদলালে আগে
+    পাঠানো offset-ও আবার যায়। Create, reschedule আর cancel-এ MeetingService
+    ডাকে; অতীতের fire time বাদ।
+    """
+    ScheduledReminder.objects.filter(meeting=meeting).delete()
+    if meeting.status != meeting.Status.SCHEDULED:
+        return
+    now = timezone.now()
+    reminders = []
+    for minutes in offsets():
+        fire_at = meeting.start_time - timedelta(minutes=minutes)
+        if fire_at <= now:
+            continue
+        reminders.append(
+            ScheduledReminder(
+                meeting=meeting,
+                offset_minutes=minutes,
+                fire_at=fire_at,
+                bucket=bucket_for(fire_at),
+            )
+        )
+    ScheduledReminder.objects.bulk_create(reminders)
+
+
+def _fan_out(meeting_id, dispatch_key: str) -> int:
+    """
+    Recipient link id-এর keyset range ধরে batch বানিয়ে প্রতি batch-এ একটা task —
+    শুধু id পড়া হয়, আর task payload meeting যত বড়ই হোক দুটো id-ই।
+    """
+    from .tasks import send_reminders_task
+
+    selector = {"all": True, "skip_declined": True}
+    size = batch_size()
+    tasks = 0
+    after_id = None
+    ids = recipients_queryset(meeting_id, selector).values_list("id", flat=True)
+    while True:
+        page = ids if after_id is None else ids.filter(id__gt=after_id)
+        batch = list(page[:size])
+        if not batch:
+            return tasks
+        send_reminders_task(
+            meeting_id,
+            {**selector, "after_id": after_id, "until_id": str(batch[-1])},
+            dispatch_key=dispatch_key,
+        )
+        tasks += 1
+        after_id = str(batch[-1])
+
+
+def _fan_out_claimed(reminders):
+    """
+    Commit-এর পরে চলে (Huey queue আলাদা SQLite file, তাই transaction-এর ভেতরে
+    enqueue করলে rollback-এও task থেকে যেত)। Fan-out fail হলে dispatched_at
+    মুছে দেয়, পরের মিনিটে আবার চেষ্টা হবে; একই dispatch_key-এ কেউ দুবার পায় না।
+    """
+    failed = []
+    for reminder in reminders:
+        try:
+            _fan_out(reminder.meeting_id, f"reminder-{reminder.id}")
+        except Exception as e:
+            logger.error(f"Reminder fan-out failed for meeting {reminder.meeting_id}: {str(e)}")
+            failed.append(reminder.id)
+    if failed:
+        ScheduledReminder.objects.filter(id__in=failed).update(dispatched_at=None)
+
+
+def dispatch_due(*, limit: int | None = None) -> int:
+    """
+    bucket <= এখন এমন unsent reminder এক query-তে তোলে (partial index), dispatched
+    চিহ্ন দেয়, আর commit-এর পরে প্রতিটার recipient fan out করে। Meeting শুরু হয়ে
+    গেলে (worker down ছিল) পাঠানো হয় না, শুধু চিহ্ন পড়ে।
+    """
+    limit = limit or getattr(settings, "REMINDER_DISPATCH_BATCH_SIZE", 500)
+    now = timezone.now()
+
+    with transaction.atomic():
+        due = list(
+            ScheduledReminder.objects.select_for_update(skip_locked=True)
+            .filter(dispatched_at__isnull=True, bucket__lte=bucket_for(now))
+            .select_related("meeting")
+            .order_by("bucket", "id")[:limit]
+        )
+        fan_outs = []
+        for reminder in due:
+            if reminder.meeting.start_time <= now:
+                logger.warning(
+                    f"Skipping reminder {reminder.id}: meeting {reminder.meeting_id} already started"
+                )
+                continue
+            fan_outs.append(reminder)
+        ScheduledReminder.objects.filter(id__in=[r.id for r in due]).update(dispatched_at=now)
+        if fan_outs:
+            transaction.on_commit(lambda: _fan_out_claimed(fan_outs))
+
+    if fan_outs:
+        logger.info(f"Dispatching {len(fan_outs)} meeting reminders")
+    return len(fan_outs)
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.html import escape
+from calendar_integration.timezones import coerce_timezone, get_zone
+
+KIND_COPY = {
+    "invitation": ("Meeting Invitation: {title}", "You are invited to a meeting."),
+    "update": ("Updated: {title}", "A meeting you are invited to has been updated."),
+    "cancellation": ("Cancelled: {title}", "The following meeting has been cancelled:"),
+    "reminder": ("Reminder: {title}", "This meeting is starting soon."),
+}
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    text: str
+    html: str
+
+
+@lru_cache(maxsize=None)
+def _templates():
+    return (
+        get_template("notifications/email/meeting.txt"),
+        get_template("notifications/email/meeting.html"),
+    )
+
+
+def _format_range(start: datetime, end: datetime, tzid: str) -> str:
+    if timezone.is_naive(start):
+        start = timezone.make_aware(start)
+    if timezone.is_naive(end):
+        end = timezone.make_aware(end)
+    zone = get_zone(tzid)
+    start, end = start.astimezone(zone), end.astimezone(zone)
+    if start.date() == end.date():
+        return f"{start:%a, %d %b %Y %H:%M} - {end:%H:%M} ({tzid})"
+    return f"{start:%a, %d %b %Y %H:%M} - {end:%a, %d %b %Y %H:%M} ({tzid})"
+
+
+class MeetingEmailRenderer:
+    """
+    একটা meeting-এর জন্য একবার তৈরি হয়; shared অংশ timezone অনুযায়ী
+    cache থাকে, প্রতি recipient-এ শুধু greeting বসে।
+    """
+
+    def __init__(self, meeting, kind: str, *, reason: str = "", has_ics: bool = True):
+        subject, intro = KIND_COPY[kind]
+        self.meeting = meeting
+        self.subject = subject.format(title=meeting.title)
+        self._intro = intro
+        self._reason = reason
+        self._has_ics = has_ics
+        self._shared: dict[str, tuple[str, str]] = {}
+
+    def _recipient_tz(self, participant) -> str:
+        meeting_tz = coerce_timezone(self.meeting.timezone)
+        return coerce_timezone(getattr(participant, "timezone", ""), default=meeting_tz)
+
+    def shared_parts(self, tzid: str) -> tuple[str, str]:
+        parts = self._shared.get(tzid)
+        if parts is None:
+            text_template, html_template = _templates()
+            context = {
+                "meeting": self.meeting,
+                "intro": self._intro,
+                "reason": self._reason,
+                "has_ics": self._has_ics,
+                "time_range": _format_range(
+                    self.meeting.start_time, self.meeting.end_time, tzid
+                ),
+            }
+            parts = (text_template.render(context), html_template.render(context))
+            self._shared[tzid] = parts
+        return parts
+
+    def render(self, participant) -> RenderedEmail:
+        text, html = self.shared_parts(self._recipient_tz(participant))
+        name = participant.name or participant.email
+        return RenderedEmail(
+            subject=self.subject,
+            text=f"Hi {name},\n\n{text}",
+            html=f"<p>Hi {escape(name)},</p>\n{html}",
+        )
+
+
+DIGEST_HEADINGS = {
+    "invitation": "New invitations",
+    "update": "Updated meetings",
+    "cancellation": "Cancelled meetings",
+}
+
+
+@lru_cache(maxsize=None)
+def _digest_templates():
+    return (
+        get_template("notifications/email/digest.txt"),
+        get_template("notifications/email/digest.html"),
+    )
+
+
+def render_digest(participant, items, *, has_ics: bool = True) -> RenderedEmail:
+    """
+    items = (kind, meeting, reason)-এর list; kind অনুযায়ী section-এ ভাগ হয়।
+    Digest প্রতি recipient-এ একটাই, তাই এখানে shared cache লাগে না।
+    """
+    sections = []
+    for kind, heading in DIGEST_HEADINGS.items():
+        rows = [
+            {
+                "meeting": meeting,
+                "reason": reason,
+                "time_range": _format_range(
+                    meeting.start_time,
+                    meeting.end_time,
+                    coerce_timezone(participant.timezone, default=coerce_timezone(meeting.timezone)),
+                ),
+            }
+            for item_kind, meeting, reason in items
+            if item_kind == kind
+        ]
+        if rows:
+            sections.append({"heading": heading, "items": rows})
+
+    text_template, html_template = _digest_templates()
+    context = {"sections": sections, "has_ics": has_ics}
+    name = participant.name or participant.email
+    count = len(items)
+    return RenderedEmail(
+        subject=f"Your meeting digest: {count} update{'s' if count != 1 else ''}",
+        text=f"Hi {name},\n\n{text_template.render(context)}",
+        html=f"<p>Hi {escape(name)},</p>\n{html_template.render(context)}",
+    )
+
@@ -1,124 +1,174 @@
 from django.conf import settings
-from django.core.mail import EmailMessage
-from calendar_integration.services import generate_meeting_ics
+from django.core.mail import EmailMultiAlternatives, get_connection
+from calendar_integration.services import MeetingIcsBuilder
+from . import deliveries, digest
+from .recipients import ALL, batch_size, iter_recipient_batches, recipients_queryset
+from .rendering import MeetingEmailRenderer
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def send_meeting_invitations(meeting, meeting_participants):
-    ics_bytes = generate_meeting_ics(meeting, meeting_participants)
-    sent = 0
-    failed = []
-
-    for mp in meeting_participants:
-        participant = mp.participant
-
-        if not participant.email:
-            logger.warning(f"Skipping participant {participant.id} - no email address")
-            continue
-
-        try:
-            subject = f"Meeting Invitation: {meeting.title}"
-            body = (
-                f"Hi {participant.name or participant.email},\n\n"
-                f"You are invited to a meeting.\n\n"
-                f"Title: {meeting.title}\n"
-                f"Time: {meeting.start_time} - {meeting.end_time}\n"
-                f"Location: {meeting.location or '-'}\n\n"
-                f"Please find the calendar invitation attached.\n\n"
-                f"Thanks."
-            )
+def _build_message(rendered, to_email):
+    msg = EmailMultiAlternatives(
+        subject=rendered.subject,
+        body=rendered.text,
+        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        to=[to_email],
+    )
+    msg.attach_alternative(rendered.html, "text/html")
+    return msg
 
-            msg = EmailMessage(
-                subject=subject,
-                body=body,
-                from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-                to=[participant.email],
-            )
 
-            msg.attach(
-                f"meeting-{meeting.id}.ics",
-                ics_bytes,
-                "text/calendar; charset=utf-8; method=REQUEST",
-            )
+def _shared_ics(builder, meeting, selector):
+    """full/capped mode-এ সবার জন্য একটাই ICS; compact mode-এ None।"""
+    mode = getattr(settings, "ICS_ATTENDEE_MODE", "compact")
+    if mode == "compact":
+        return None
+    qs = recipients_queryset(meeting.id, selector)
+    if mode == "capped":
+        return builder.build(qs[: getattr(settings, "ICS_ATTENDEE_LIMIT", 50)])
+    return builder.build(qs.iterator(chunk_size=batch_size()))
 
-            msg.send(fail_silently=False)
-            sent += 1
 
-        except Exception as e:
-            logger.error(
-                f"Failed to send invitation to {participant.email} "
-                f"for meeting {meeting.id}: {str(e)}"
-            )
-            failed.append({
-                "email": participant.email,
-                "error": str(e)
-            })
-            continue
+def send_chunk_size() -> int:
+    return getattr(settings, "DELIVERY_SEND_CHUNK_SIZE", 50)
 
-    if failed:
-        logger.warning(
-            f"Meeting {meeting.id}: Sent {sent} invitations, "
-            f"{len(failed)} failed: {failed}"
-        )
-    else:
-        logger.info(f"Meeting {meeting.id}: Successfully sent {sent} invitations")
 
-    return sent
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
 
 
-def notify_meeting_cancelled(meeting, *, reason: str = ""):
-    """মিটিং cancel হলে সব participant-কে জানানো হয়।"""
-    participants = meeting.meeting_participants.select_related("participant")
+def _send(meeting, selector, *, kind, dispatch_key, renderer, attachment=None):
+    """
+    Recipient batch ধরে পাঠায়। Delivery row DELIVERY_SEND_CHUNK_SIZE করে claim
+    হয় আর প্রতি chunk একটা SMTP connection-এ যায় — তাই claim থেকে record পর্যন্ত
+    সময় DELIVERY_SENDING_TIMEOUT_SECONDS-এর অনেক নিচে থাকে, আর retry_due এখনও
+    পাঠানো হচ্ছে এমন row-কে stale ভেবে আবার পাঠায় না। আগে sent হওয়া কেউ আবার
+    পায় না; failure-গুলো row-এ থাকে আর retry_due পরে শুধু তাদেরই আবার পাঠায়।
+    """
+    dispatch_key = dispatch_key or deliveries.default_dispatch_key(meeting, kind)
     sent = 0
-    failed = []
-
-    for mp in participants:
-        participant = mp.participant
-
-        if not participant.email:
-            logger.warning(f"Skipping participant {participant.id} - no email address")
-            continue
-
-        try:
-            subject = f"Cancelled: {meeting.title}"
-            body = (
-                f"Hi {participant.name or participant.email},\n\n"
-                f"The following meeting has been cancelled:\n\n"
-                f"Title: {meeting.title}\n"
-                f"Time: {meeting.start_time} - {meeting.end_time}\n"
-                f"Location: {meeting.location or '-'}\n"
-            )
-            if reason:
-                body += f"\nReason: {reason}\n"
-
-            EmailMessage(
-                subject=subject,
-                body=body,
-                from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-                to=[participant.email],
-            ).send(fail_silently=False)
-
-            sent += 1
-
-        except Exception as e:
-            logger.error(
-                f"Failed to send cancellation email to {participant.email} "
-                f"for meeting {meeting.id}: {str(e)}"
+    failed = 0
+    deferred = 0
+
+    for batch in iter_recipient_batches(meeting.id, selector):
+        for mp in batch:
+            if not mp.participant.email:
+                logger.warning(f"Skipping participant {mp.participant.id} - no email address")
+        for chunk in _chunks(batch, send_chunk_size()):
+            claimed = deliveries.claim(meeting, kind, dispatch_key, chunk)
+            deferred += digest.divert(meeting, kind, chunk, claimed)
+            if not claimed:
+                continue
+            chunk_sent, chunk_failed = _send_chunk(
+                meeting, kind, chunk, claimed, renderer, attachment
             )
-            failed.append({
-                "email": participant.email,
-                "error": str(e)
-            })
-            continue
+            deliveries.record(chunk_sent, chunk_failed)
+            sent += len(chunk_sent)
+            failed += len(chunk_failed)
 
     if failed:
         logger.warning(
-            f"Meeting {meeting.id}: Cancellation sent to {sent}, "
-            f"{len(failed)} failed: {failed}"
+            f"Meeting {meeting.id}: Sent {sent} {kind}s, {failed} failed (queued for retry)"
         )
     else:
-        logger.info(f"Meeting {meeting.id}: Cancellation notified to {sent} participants")
+        logger.info(f"Meeting {meeting.id}: Successfully sent {sent} {kind}s")
+    if deferred:
+        logger.info(f"Meeting {meeting.id}: {deferred} {kind}s held for digest")
 
-    return sent
\ No newline at end of file
+    return sent
+
+
+def _send_chunk(meeting, kind, chunk, claimed, renderer, attachment):
+    chunk_sent = []
+    chunk_failed = []
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.error(f"Could not open mail connection for meeting {meeting.id}: {str(e)}")
+        return [], [(claimed[mp.id], str(e)) for mp in chunk if mp.id in claimed]
+
+    try:
+        for mp in chunk:
+            delivery = claimed.get(mp.id)
+            if delivery is None:
+                continue
+            participant = mp.participant
+            try:
+                msg = _build_message(renderer.render(participant), participant.email)
+                msg.connection = connection
+                if attachment is not None:
+                    msg.attach(
+                        f"meeting-{meeting.id}.ics",
+                        attachment(mp),
+                        "text/calendar; charset=utf-8; method=REQUEST",
+                    )
+                msg.send(fail_silently=False)
+                chunk_sent.append(delivery)
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to send {kind} to {participant.email} "
+                    f"for meeting {meeting.id}: {str(e)}"
+                )
+                chunk_failed.append((delivery, str(e)))
+    finally:
+        connection.close()
+    return chunk_sent, chunk_failed
+
+
+def _send_calendar_emails(meeting, selector, *, kind, dispatch_key=None):
+    builder = MeetingIcsBuilder(meeting)
+    shared_ics = _shared_ics(builder, meeting, selector)
+    return _send(
+        meeting,
+        selector,
+        kind=kind,
+        dispatch_key=dispatch_key,
+        renderer=MeetingEmailRenderer(meeting, kind),
+        attachment=lambda mp: shared_ics or builder.build_for(mp),
+    )
+
+
+def send_meeting_invitations(meeting, selector=ALL, *, dispatch_key=None):
+    return _send_calendar_emails(
+        meeting,
+        selector,
+        kind="invitation",
+        dispatch_key=dispatch_key,
+    )
+
+
+def send_meeting_updates(meeting, selector=ALL, *, dispatch_key=None):
+    """Debounce window শেষে সব edit মিলিয়ে একটাই "updated" email যায়।"""
+    return _send_calendar_emails(
+        meeting,
+        selector,
+        kind="update",
+        dispatch_key=dispatch_key,
+    )
+
+
+def notify_meeting_cancelled(meeting, *, reason: str = "", selector=ALL, dispatch_key=None):
+    """মিটিং cancel হলে সব participant-কে জানানো হয়।"""
+    return _send(
+        meeting,
+        selector,
+        kind="cancellation",
+        dispatch_key=dispatch_key,
+        renderer=MeetingEmailRenderer(meeting, "cancellation", reason=reason, has_ics=False),
+    )
+
+
+def send_meeting_reminders(meeting, selector, *, dispatch_key=None):
+    """Reminder-এর একটা recipient batch; ICS লাগে না, invitation আগেই গেছে।"""
+    return _send(
+        meeting,
+        selector,
+        kind="reminder",
+        dispatch_key=dispatch_key,
+        renderer=MeetingEmailRenderer(meeting, "reminder", has_ics=False),
+    )
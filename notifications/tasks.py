@@ -1,13 +1,15 @@
-from huey.contrib.djhuey import db_task
+from huey import crontab
+from huey.contrib.djhuey import db_periodic_task, db_task
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 @db_task()
-def send_invitations_task(meeting_id, meeting_participant_ids):
+def send_invitations_task(meeting_id, selector=None, dispatch_key=None):
 
-    from meetings.models import Meeting, MeetingParticipant
+    from meetings.models import Meeting
+    from .recipients import normalize_selector
     from .services import send_meeting_invitations
 
     try:
@@ -16,16 +18,37 @@ def send_invitations_task(meeting_id, meeting_participant_ids):
         logger.error(f"send_invitations_task: Meeting {meeting_id} not found")
         return 0
 
-    targets = MeetingParticipant.objects.select_related("participant").filter(
-        id__in=meeting_participant_ids
+    if meeting.status == Meeting.Status.CANCELLED:
+        return 0
+
+    return send_meeting_invitations(
+        meeting, normalize_selector(selector), dispatch_key=dispatch_key
     )
-    return send_meeting_invitations(meeting, targets)
 
 
 @db_task()
-def notify_cancelled_task(meeting_id, reason=""):
+def send_updates_task(meeting_id, selector=None, dispatch_key=None):
+    from meetings.models import Meeting
+    from .recipients import normalize_selector
+    from .services import send_meeting_updates
+
+    try:
+        meeting = Meeting.objects.get(id=meeting_id)
+    except Meeting.DoesNotExist:
+        logger.error(f"send_updates_task: Meeting {meeting_id} not found")
+        return 0
+
+    if meeting.status == Meeting.Status.CANCELLED:
+        return 0
+
+    return send_meeting_updates(meeting, normalize_selector(selector), dispatch_key=dispatch_key)
+
+
+@db_task()
+def notify_cancelled_task(meeting_id, reason="", selector=None, dispatch_key=None):
     """Background-এ meeting cancellation email পাঠায়।"""
     from meetings.models import Meeting
+    from .recipients import normalize_selector
     from .services import notify_meeting_cancelled
 
     try:
@@ -34,4 +57,73 @@ def notify_cancelled_task(meeting_id, reason=""):
         logger.error(f"notify_cancelled_task: Meeting {meeting_id} not found")
         return 0
 
-    return notify_meeting_cancelled(meeting, reason=reason)
\ No newline at end of file
+    return notify_meeting_cancelled(
+        meeting,
+        reason=reason,
+        selector=normalize_selector(selector),
+        dispatch_key=dispatch_key,
+    )
+
+
+@db_task()
+def send_reminders_task(meeting_id, selector, dispatch_key=None):
+    """Reminder fan-out-এর একটা batch (selector-এ link id range)।"""
+    from meetings.models import Meeting
+    from .services import send_meeting_reminders
+
+    try:
+        meeting = Meeting.objects.get(id=meeting_id)
+    except Meeting.DoesNotExist:
+        logger.error(f"send_reminders_task: Meeting {meeting_id} not found")
+        return 0
+
+    if meeting.status == Meeting.Status.CANCELLED:
+        return 0
+
+    return send_meeting_reminders(meeting, selector, dispatch_key=dispatch_key)
+
+
+@db_task()
+def relay_outbox_task():
+    from .outbox import relay_pending_events
+
+    return relay_pending_events()
+
+
+@db_periodic_task(crontab(minute="*"))
+def relay_outbox_periodic():
+    """Commit-এর পরে kick miss হলে বা queue down থাকলে বাকি event এখান থেকে যায়।"""
+    from .outbox import relay_pending_events
+
+    return relay_pending_events()
+
+
+@db_periodic_task(crontab(minute="*"))
+def dispatch_reminders_periodic():
+    """যে bucket-গুলোর সময় হয়েছে সেগুলোর reminder fan out করে।"""
+    from .reminders import dispatch_due
+
+    return dispatch_due()
+
+
+@db_periodic_task(crontab(minute="*"))
+def retry_deliveries_periodic():
+    """Backoff শেষ হওয়া failed delivery শুধু সেই recipient-দের আবার পাঠায়।"""
+    from .deliveries import retry_due
+
+    return retry_due()
+
+
+@db_periodic_task(crontab(minute="5"))
+def send_digests_periodic():
+    """Digest চাওয়া user-দের জমে থাকা invitation/cancellation একটা email-এ।"""
+    from .digest import send_due
+
+    return send_due()
+
+
+@db_periodic_task(crontab(hour="3", minute="40"))
+def prune_deliveries_periodic():
+    from .deliveries import prune
+
+    return prune()
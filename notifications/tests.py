@@ -1,3 +1,566 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from huey.contrib.djhuey import HUEY
+from meetings.models import MeetingParticipant
+from meetings.services import MeetingService
+from . import deliveries, digest, outbox, recipients, reminders
+from .models import Delivery, OutboxEvent, ScheduledReminder
+from .services import (
+    notify_meeting_cancelled,
+    send_meeting_invitations,
+    send_meeting_updates,
+)
 
-# Create your tests here.
+
+def make_meeting(organizer, emails, *, start=None, **fields):
+    start = start or timezone.now() + timedelta(days=7)
+    meeting = MeetingService.create_meeting(
+        created_by=organizer,
+        title=fields.pop("title", "Planning"),
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+        **fields,
+    )
+    MeetingService.book_participants(meeting, [{"email": email} for email in emails])
+    return meeting
+
+
+class Clock:
+    """timezone.now-এর বদলে; প্রতিটা email পাঠানোয় সময় এগোয়।"""
+
+    def __init__(self):
+        self.now = timezone.now()
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+@override_settings(DELIVERY_SENDING_TIMEOUT_SECONDS=600, DELIVERY_SEND_CHUNK_SIZE=2)
+class DeliveryIdempotencyTests(TestCase):
+    """একই delivery কখনো দুবার পাঠানো হয় না — claim, stale row বা backoff যাই হোক।"""
+
+    def setUp(self):
+        self.organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.emails = [f"attendee{i}@example.com" for i in range(6)]
+        self.meeting = make_meeting(self.organizer, self.emails)
+
+    def assertSentOnce(self):
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(self.emails))
+        self.assertEqual(
+            Delivery.objects.filter(meeting=self.meeting, status=Delivery.Status.SENT).count(),
+            len(self.emails),
+        )
+
+    def test_running_the_same_dispatch_twice_sends_once(self):
+        self.assertEqual(send_meeting_invitations(self.meeting, dispatch_key="k"), 6)
+        self.assertEqual(send_meeting_invitations(self.meeting, dispatch_key="k"), 0)
+        self.assertSentOnce()
+
+    def test_slow_send_is_not_picked_up_as_stale(self):
+        # প্রতি email-এ 250s — পুরো dispatch timeout-এর আড়াই গুণ; মাঝপথে retry চলে।
+        clock = Clock()
+        real_send = EmailBackend.send_messages
+
+        def slow_send(backend, messages):
+            clock.advance(250)
+            self.assertEqual(deliveries.retry_due(), 0)
+            return real_send(backend, messages)
+
+        with mock.patch("django.utils.timezone.now", clock), mock.patch.object(
+            EmailBackend, "send_messages", slow_send
+        ):
+            send_meeting_invitations(self.meeting, dispatch_key="k")
+        self.assertSentOnce()
+
+    def test_stale_row_is_resent_once(self):
+        send_meeting_invitations(self.meeting, dispatch_key="k")
+        stuck = Delivery.objects.filter(meeting=self.meeting).first()
+        Delivery.objects.filter(id=stuck.id).update(
+            status=Delivery.Status.SENDING, updated_at=timezone.now() - timedelta(seconds=601)
+        )
+        mail.outbox.clear()
+
+        with mock.patch("notifications.tasks.send_invitations_task") as task:
+            task.side_effect = lambda meeting_id, selector, dispatch_key: send_meeting_invitations(
+                self.meeting, selector, dispatch_key=dispatch_key
+            )
+            self.assertEqual(deliveries.retry_due(), 1)
+            self.assertEqual(deliveries.retry_due(), 0)
+        self.assertEqual([m.to[0] for m in mail.outbox], [stuck.email])
+
+    def test_failed_row_waits_for_its_backoff_window(self):
+        with mock.patch.object(
+            EmailBackend, "send_messages", side_effect=OSError("down")
+        ):
+            send_meeting_invitations(self.meeting, dispatch_key="k")
+        self.assertEqual(
+            Delivery.objects.filter(meeting=self.meeting, status=Delivery.Status.FAILED).count(), 6
+        )
+
+        # Window-এর ভেতরে: task আবার চললেও বা retry_due চললেও কিছু যায় না।
+        self.assertEqual(send_meeting_invitations(self.meeting, dispatch_key="k"), 0)
+        self.assertEqual(deliveries.retry_due(), 0)
+        self.assertEqual(mail.outbox, [])
+
+        later = timezone.now() + timedelta(seconds=61)
+        with mock.patch("django.utils.timezone.now", return_value=later), mock.patch(
+            "notifications.tasks.send_invitations_task"
+        ) as task:
+            task.side_effect = lambda meeting_id, selector, dispatch_key: send_meeting_invitations(
+                self.meeting, selector, dispatch_key=dispatch_key
+            )
+            self.assertEqual(deliveries.retry_due(), 6)
+            self.assertEqual(deliveries.retry_due(), 0)
+        self.assertSentOnce()
+
+
+class OutboxCoalesceTests(TestCase):
+    def events(self, *specs):
+        return [OutboxEvent(kind=kind, payload=payload) for kind, payload in specs]
+
+    def test_cancellation_wins(self):
+        events = self.events(
+            ("invitation", {"send_to_all": True}),
+            ("update", {}),
+            ("cancellation", {"reason": "first"}),
+            ("cancellation", {"reason": "moved"}),
+        )
+        self.assertEqual(outbox._coalesce(events), [("cancellation", {"reason": "moved"})])
+
+    def test_invite_to_all_suppresses_the_update(self):
+        events = self.events(
+            ("update", {}),
+            ("invitation", {"send_to_all": True}),
+            ("invitation", {"participant_ids": ["b"]}),
+        )
+        self.assertEqual(outbox._coalesce(events), [("invitation", {"send_to_all": True})])
+
+    def test_new_participants_are_excluded_from_the_update(self):
+        events = self.events(
+            ("invitation", {"participant_ids": ["b", "a"]}),
+            ("update", {}),
+            ("invitation", {"participant_ids": ["c"]}),
+        )
+        self.assertEqual(
+            outbox._coalesce(events),
+            [
+                ("invitation", {"participant_ids": ["a", "b", "c"]}),
+                ("update", {"exclude_ids": ["a", "b", "c"]}),
+            ],
+        )
+        self.assertEqual(outbox._coalesce(self.events(("update", {}))), [("update", {"exclude_ids": []})])
+
+    def test_held_update_excludes_only_links_excluded_by_every_update(self):
+        events = self.events(
+            ("update", {"exclude_ids": ["a", "b"]}),
+            ("update", {"exclude_ids": ["b"]}),
+        )
+        self.assertEqual(outbox._coalesce(events), [("update", {"exclude_ids": ["b"]})])
+
+
+@override_settings(MEETING_UPDATE_DEBOUNCE_SECONDS=120, MEETING_UPDATE_MAX_DELAY_SECONDS=600)
+class OutboxDebounceTests(TestCase):
+    """Update debounce window পর্যন্ত ধরে রাখা হয়, তবে max delay-এর বেশি না।"""
+
+    def setUp(self):
+        organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.meeting = make_meeting(organizer, ["a@example.com"])
+        self.clock = Clock()
+        patcher = mock.patch("django.utils.timezone.now", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def relay(self):
+        with mock.patch.object(outbox, "_deliver") as deliver:
+            outbox.relay_pending_events()
+        return [call.args[1] for call in deliver.call_args_list]
+
+    def enqueue(self, kind, payload=None):
+        with self.captureOnCommitCallbacks():
+            outbox.enqueue_event(self.meeting, kind, payload)
+
+    def test_update_waits_for_the_window(self):
+        self.enqueue("update")
+        self.clock.advance(60)
+        self.assertEqual(self.relay(), [])
+        self.clock.advance(61)
+        self.assertEqual(self.relay(), ["update"])
+        self.assertEqual(self.relay(), [])
+
+    def test_burst_of_edits_goes_out_as_one_update(self):
+        for _ in range(3):
+            self.enqueue("update")
+            self.clock.advance(100)
+            self.assertEqual(self.relay(), [])
+        self.clock.advance(21)
+        self.assertEqual(self.relay(), ["update"])
+        self.assertFalse(OutboxEvent.objects.filter(dispatched_at__isnull=True).exists())
+
+    def test_constant_edits_flush_after_the_max_delay(self):
+        sent = []
+        for _ in range(10):
+            self.enqueue("update")
+            self.clock.advance(90)
+            sent += self.relay()
+        self.assertEqual(sent, ["update"])
+        self.assertLessEqual(
+            OutboxEvent.objects.filter(dispatched_at__isnull=True).count(), 3
+        )
+
+    def test_invitation_is_not_held_behind_an_update(self):
+        self.enqueue("update")
+        self.enqueue("invitation", {"participant_ids": ["x"]})
+        self.assertEqual(self.relay(), ["invitation"])
+        self.enqueue("update")
+        self.clock.advance(121)
+        with mock.patch.object(outbox, "_deliver") as deliver:
+            outbox.relay_pending_events()
+        # "x" invite-এ সর্বশেষ তথ্য পেয়েছে, কিন্তু পরের edit-টা তারও পাওয়া দরকার।
+        self.assertEqual(deliver.call_args.args[1:3], ("update", {"exclude_ids": []}))
+        first = OutboxEvent.objects.filter(kind="update").order_by("id").first()
+        self.assertEqual(first.payload, {"exclude_ids": ["x"]})
+
+    def test_update_held_behind_an_invitation_skips_the_invitees(self):
+        self.enqueue("update")
+        self.enqueue("invitation", {"participant_ids": ["x"]})
+        self.assertEqual(self.relay(), ["invitation"])
+        self.clock.advance(121)
+        with mock.patch.object(outbox, "_deliver") as deliver:
+            outbox.relay_pending_events()
+        self.assertEqual(deliver.call_args.args[1:3], ("update", {"exclude_ids": ["x"]}))
+
+    def test_cancellation_is_never_held(self):
+        self.enqueue("update")
+        self.enqueue("cancellation", {"reason": "off"})
+        self.assertEqual(self.relay(), ["cancellation"])
+
+
+class OutboxRelayTests(TestCase):
+    """Outbox event caller-এর transaction-এই লেখা হয়; commit হলে তবেই relay।"""
+
+    def setUp(self):
+        HUEY.immediate = True
+        self.addCleanup(setattr, HUEY, "immediate", False)
+        organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.meeting = make_meeting(organizer, ["a@example.com", "b@example.com"])
+
+    def invite_all(self):
+        MeetingService.send_invitations(self.meeting, send_to_all=True, participant_ids=[])
+
+    def test_nothing_is_relayed_before_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                self.invite_all()
+            self.assertEqual(OutboxEvent.objects.filter(dispatched_at__isnull=True).count(), 1)
+            self.assertEqual(mail.outbox, [])
+
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ["a@example.com", "b@example.com"])
+        self.assertFalse(OutboxEvent.objects.filter(dispatched_at__isnull=True).exists())
+
+    def test_rolled_back_write_leaves_no_event(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.invite_all()
+                raise RuntimeError("booking failed")
+        self.assertEqual(callbacks, [])
+        self.assertFalse(OutboxEvent.objects.exists())
+        self.assertEqual(mail.outbox, [])
+
+    def test_relay_sends_each_event_once(self):
+        with self.captureOnCommitCallbacks():
+            self.invite_all()
+        self.assertEqual(outbox.relay_pending_events(), 1)
+        self.assertEqual(outbox.relay_pending_events(), 0)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_failed_relay_keeps_the_event_pending(self):
+        with self.captureOnCommitCallbacks():
+            self.invite_all()
+        with mock.patch.object(outbox, "_deliver", side_effect=OSError("queue down")):
+            self.assertEqual(outbox.relay_pending_events(), 0)
+        self.assertTrue(OutboxEvent.objects.filter(dispatched_at__isnull=True).exists())
+
+        self.assertEqual(outbox.relay_pending_events(), 1)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_cancellation_goes_through_the_outbox(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            MeetingService.cancel(self.meeting, reason="Moved online")
+        event = OutboxEvent.objects.get(kind=OutboxEvent.Kind.CANCELLATION)
+        self.assertEqual(event.payload, {"reason": "Moved online"})
+        self.assertIsNotNone(event.dispatched_at)
+        self.assertEqual(outbox.cancellation_reason(self.meeting), "Moved online")
+        self.assertEqual(len(mail.outbox), 2)
+
+
+class RecipientSelectorTests(TestCase):
+    def setUp(self):
+        organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.meeting = make_meeting(organizer, [f"p{i}@example.com" for i in range(7)])
+        self.ids = [
+            str(pk)
+            for pk in MeetingParticipant.objects.filter(meeting=self.meeting)
+            .order_by("id")
+            .values_list("id", flat=True)
+        ]
+
+    def select(self, selector, chunk_size=3):
+        return [
+            [str(mp.id) for mp in batch]
+            for batch in recipients.iter_recipient_batches(
+                self.meeting.id, selector, chunk_size=chunk_size
+            )
+        ]
+
+    def test_batches_walk_the_keyset_in_id_order(self):
+        batches = self.select(recipients.ALL)
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        self.assertEqual(sum(batches, []), self.ids)
+
+    def test_after_and_until_bound_a_range(self):
+        selector = {"all": True, "after_id": self.ids[1], "until_id": self.ids[4]}
+        self.assertEqual(sum(self.select(selector), []), self.ids[2:5])
+        self.assertEqual(sum(self.select({"all": True, "after_id": self.ids[-1]}), []), [])
+
+    def test_exclude_ids_survive_batch_boundaries(self):
+        excluded = [self.ids[2], self.ids[3]]
+        batches = self.select({"all": True, "exclude_ids": excluded}, chunk_size=2)
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(sum(batches, []), [pk for pk in self.ids if pk not in excluded])
+
+    def test_explicit_ids_and_legacy_lists(self):
+        self.assertEqual(sum(self.select({"ids": self.ids[:2]}), []), self.ids[:2])
+        self.assertEqual(sum(self.select(self.ids[5:]), []), self.ids[5:])
+        self.assertEqual(self.select({"ids": []}), [])
+
+    def test_skip_declined(self):
+        MeetingParticipant.objects.filter(id=self.ids[0]).update(response_status="declined")
+        selector = {"all": True, "skip_declined": True}
+        self.assertEqual(sum(self.select(selector), []), self.ids[1:])
+
+
+@override_settings(
+    REMINDER_OFFSETS_MINUTES=[1440, 15], REMINDER_BUCKET_SECONDS=60, NOTIFICATION_BATCH_SIZE=3
+)
+class ReminderTests(TestCase):
+    def setUp(self):
+        HUEY.immediate = True
+        self.addCleanup(setattr, HUEY, "immediate", False)
+        organizer = get_user_model().objects.create_user(email="organizer@example.com")
+        self.start = timezone.now() + timedelta(minutes=30)
+        self.emails = [f"p{i}@example.com" for i in range(7)]
+        self.meeting = make_meeting(organizer, self.emails, start=self.start)
+        self.due_at = timezone.now() + timedelta(minutes=16)
+
+    def test_bucket_floors_to_the_bucket_size(self):
+        when = timezone.now().replace(second=42, microsecond=123)
+        self.assertEqual(reminders.bucket_for(when), when.replace(second=0, microsecond=0))
+        with override_settings(REMINDER_BUCKET_SECONDS=300):
+            bucket = reminders.bucket_for(when)
+        self.assertEqual(bucket.minute % 5, 0)
+        self.assertLessEqual(bucket, when)
+
+    def test_only_future_offsets_are_scheduled(self):
+        reminder = ScheduledReminder.objects.get(meeting=self.meeting)
+        self.assertEqual(reminder.offset_minutes, 15)
+        self.assertEqual(reminder.fire_at, self.start - timedelta(minutes=15))
+        self.assertEqual(reminder.bucket, reminders.bucket_for(reminder.fire_at))
+        self.assertEqual(reminders.dispatch_due(), 0)
+
+    def test_fan_out_runs_only_after_commit(self):
+        with mock.patch("django.utils.timezone.now", return_value=self.due_at):
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.assertEqual(reminders.dispatch_due(), 1)
+                self.assertEqual(mail.outbox, [])
+            self.assertEqual(reminders.dispatch_due(), 0)
+            callbacks[0]()
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), self.emails)
+        self.assertTrue(mail.outbox[0].subject.startswith("Reminder:"))
+
+    def test_fan_out_batches_by_keyset_and_skips_declined(self):
+        MeetingParticipant.objects.filter(
+            meeting=self.meeting, participant__email="p0@example.com"
+        ).update(response_status="declined")
+        with mock.patch("notifications.tasks.send_reminders_task") as task:
+            self.assertEqual(reminders._fan_out(self.meeting.id, "k"), 2)
+        selectors = [call.args[1] for call in task.call_args_list]
+        self.assertIsNone(selectors[0]["after_id"])
+        self.assertEqual(selectors[1]["after_id"], selectors[0]["until_id"])
+        sent = [
+            mp.participant.email
+            for selector in selectors
+            for mp in recipients.iter_recipients(self.meeting.id, selector)
+        ]
+        self.assertEqual(sorted(sent), self.emails[1:])
+
+    def test_failed_fan_out_releases_the_claim(self):
+        with mock.patch("django.utils.timezone.now", return_value=self.due_at):
+            with self.captureOnCommitCallbacks() as callbacks:
+                reminders.dispatch_due()
+            with mock.patch.object(reminders, "_fan_out", side_effect=OSError("queue down")):
+                callbacks[0]()
+            self.assertIsNone(ScheduledReminder.objects.get(meeting=self.meeting).dispatched_at)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(reminders.dispatch_due(), 1)
+        self.assertEqual(len(mail.outbox), 7)
+
+    def test_started_meeting_is_marked_but_not_sent(self):
+        with mock.patch(
+            "django.utils.timezone.now", return_value=self.start + timedelta(minutes=1)
+        ), self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(reminders.dispatch_due(), 0)
+        self.assertIsNotNone(ScheduledReminder.objects.get(meeting=self.meeting).dispatched_at)
+        self.assertEqual(mail.outbox, [])
+
+    def test_reschedule_and_cancel(self):
+        new_start = self.start + timedelta(hours=2)
+        MeetingService.update_meeting(
+            self.meeting,
+            changes={"start_time": new_start, "end_time": new_start + timedelta(hours=1)},
+        )
+        self.assertEqual(
+            ScheduledReminder.objects.get(meeting=self.meeting).fire_at,
+            new_start - timedelta(minutes=15),
+        )
+        MeetingService.cancel(self.meeting)
+        self.assertFalse(ScheduledReminder.objects.filter(meeting=self.meeting).exists())
+
+
+@override_settings(DIGEST_DAILY_HOUR=3)
+class DigestTests(TestCase):
+    """Digest চাওয়া recipient-এর invite/cancel জমে থাকে; পরে একটাই email।"""
+
+    def setUp(self):
+        users = get_user_model().objects
+        self.organizer = users.create_user(email="organizer@example.com")
+        self.heavy = users.create_user(email="heavy@example.com", email_digest="daily")
+        self.meetings = [
+            make_meeting(
+                self.organizer,
+                ["heavy@example.com", "now@example.com"],
+                title=title,
+                start=timezone.now() + timedelta(days=3 + i),
+            )
+            for i, title in enumerate(["Alpha", "Beta", "Gamma"])
+        ]
+        self.digest_hour = timezone.now().replace(hour=3)
+
+    def parked(self):
+        return Delivery.objects.filter(status=Delivery.Status.DIGEST).count()
+
+    def send_due(self, **kwargs):
+        with mock.patch("django.utils.timezone.now", return_value=self.digest_hour):
+            return digest.send_due(**kwargs)
+
+    def invite_all(self):
+        for meeting in self.meetings:
+            send_meeting_invitations(meeting, dispatch_key=f"invite-{meeting.id}")
+        mail.outbox.clear()
+
+    def test_invites_are_parked_for_digest_users(self):
+        send_meeting_invitations(self.meetings[0], dispatch_key="k")
+        self.assertEqual([m.to[0] for m in mail.outbox], ["now@example.com"])
+        self.assertEqual(
+            Delivery.objects.get(status=Delivery.Status.DIGEST).email, "heavy@example.com"
+        )
+
+    def test_update_is_parked_only_behind_a_parked_invite(self):
+        self.invite_all()
+        send_meeting_updates(self.meetings[0], dispatch_key="u1")
+        self.assertEqual([m.to[0] for m in mail.outbox], ["now@example.com"])
+        self.assertEqual(self.parked(), 4)
+
+        # Invite আগেই সরাসরি গেলে update-ও সরাসরি যায়।
+        other = make_meeting(self.organizer, ["heavy@example.com"], title="Delta")
+        self.heavy.email_digest = "off"
+        self.heavy.save(update_fields=["email_digest"])
+        send_meeting_invitations(other, dispatch_key="i")
+        self.heavy.email_digest = "daily"
+        self.heavy.save(update_fields=["email_digest"])
+        mail.outbox.clear()
+        send_meeting_updates(other, dispatch_key="u2")
+        self.assertEqual([m.to[0] for m in mail.outbox], ["heavy@example.com"])
+
+    def test_daily_digest_waits_for_its_hour(self):
+        self.invite_all()
+        with mock.patch(
+            "django.utils.timezone.now", return_value=self.digest_hour.replace(hour=9)
+        ):
+            self.assertEqual(digest.send_due(), 0)
+        self.assertEqual(self.parked(), 3)
+
+    def test_one_email_with_one_ics_per_meeting(self):
+        self.invite_all()
+        self.assertEqual(self.send_due(batch_size=1), 1)
+        self.assertEqual(self.send_due(), 0)
+
+        [msg] = mail.outbox
+        self.assertEqual(msg.to, ["heavy@example.com"])
+        self.assertIn("3 updates", msg.subject)
+        self.assertEqual(
+            [name for name, _, _ in msg.attachments],
+            [f"meeting-{meeting.id}.ics" for meeting in self.meetings],
+        )
+        for _, ics, mimetype in msg.attachments:
+            ics = ics.decode() if isinstance(ics, bytes) else ics
+            self.assertEqual(ics.count("BEGIN:VEVENT"), 1)
+            self.assertIn("METHOD:REQUEST", ics)
+            self.assertIn("method=REQUEST", mimetype)
+        self.assertEqual(
+            Delivery.objects.filter(email="heavy@example.com", status=Delivery.Status.SENT).count(),
+            3,
+        )
+
+    def test_invite_cancelled_in_the_same_digest_is_dropped(self):
+        self.invite_all()
+        gamma = self.meetings[2]
+        MeetingService.cancel(gamma, reason="No longer needed")
+        notify_meeting_cancelled(gamma, reason="No longer needed", dispatch_key="c")
+        self.assertEqual([m.to[0] for m in mail.outbox], ["now@example.com"])
+
+        self.assertEqual(self.send_due(), 1)
+        msg = mail.outbox[-1]
+        self.assertIn("2 updates", msg.subject)
+        self.assertNotIn("Gamma", msg.body)
+        self.assertEqual(
+            [name for name, _, _ in msg.attachments],
+            [f"meeting-{meeting.id}.ics" for meeting in self.meetings[:2]],
+        )
+        self.assertEqual(
+            set(
+                Delivery.objects.filter(status=Delivery.Status.SKIPPED).values_list(
+                    "kind", flat=True
+                )
+            ),
+            {"invitation", "cancellation"},
+        )
+        self.assertEqual(self.parked(), 0)
+
+    def test_cancellation_after_a_delivered_invite_is_digested(self):
+        self.invite_all()
+        self.send_due()
+        gamma = self.meetings[2]
+        MeetingService.cancel(gamma, reason="No longer needed")
+        notify_meeting_cancelled(gamma, reason="No longer needed", dispatch_key="c")
+        mail.outbox.clear()
+
+        self.assertEqual(self.send_due(), 1)
+        [msg] = mail.outbox
+        [(name, ics, mimetype)] = msg.attachments
+        ics = ics.decode() if isinstance(ics, bytes) else ics
+        self.assertEqual(name, f"meeting-{gamma.id}.ics")
+        self.assertIn("METHOD:CANCEL", ics)
+        self.assertIn("STATUS:CANCELLED", ics)
+        self.assertIn("method=CANCEL", mimetype)